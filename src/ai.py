@@ -1,10 +1,11 @@
 """Gemini AI機能 - 修正版"""
 import streamlit as st
-import google.generativeai as genai
 from PIL import Image
 import io
 import re
+import pandas as pd
 from config import GEMINI_PROMPT
+from utils import DataValidator
 
 
 @st.cache_resource
@@ -19,6 +20,9 @@ def setup_gemini():
         return None, None
     
     try:
+        # Gemini SDKは読み込みが重いため、AI分析を使う時点でインポート
+        import google.generativeai as genai
+        
         genai.configure(api_key=api_key)
         
         # 利用可能なモデルを取得
@@ -86,11 +90,12 @@ def clean_csv_response(text: str) -> str:
     return '\n'.join(lines)
 
 
-def validate_csv_data(csv_text: str) -> tuple[bool, str]:
+def validate_csv_data(csv_text: str, check_consistency: bool = True) -> tuple[bool, str]:
     """CSVデータの妥当性を検証
     
     Args:
         csv_text: CSVテキスト
+        check_consistency: ボックススコアの整合性（得点・リバウンド・成功数）も検証するか
     
     Returns:
         (is_valid, error_message): 検証結果とエラーメッセージ
@@ -117,12 +122,37 @@ def validate_csv_data(csv_text: str) -> tuple[bool, str]:
             if len(columns) != header_count:
                 return False, f"{i}行目のカラム数が不一致です（期待: {header_count}, 実際: {len(columns)}）"
         
+        # ボックススコアの整合性チェック（全行をまとめて検証）
+        if check_consistency:
+            _, report = DataValidator.check_box_score_consistency(pd.read_csv(io.StringIO(csv_text)))
+            if not report.empty:
+                return False, format_consistency_report(report)
+        
         return True, ""
         
     except Exception as e:
         return False, f"検証エラー: {str(e)}"
 
 
+def format_consistency_report(report: pd.DataFrame, max_items: int = 5) -> str:
+    """整合性チェックの違反一覧をメッセージに整形
+    
+    Args:
+        report: DataValidator.check_box_score_consistencyの違反一覧
+        max_items: メッセージに含める最大件数
+    
+    Returns:
+        エラーメッセージ
+    """
+    items = [
+        f"{row.PlayerName} {row.Rule}（期待 {row.Expected:g} / 実際 {row.Actual:g}）"
+        for row in report.head(max_items).itertuples()
+    ]
+    remaining = len(report) - len(items)
+    suffix = f" ほか{remaining}件" if remaining > 0 else ""
+    return f"ボックススコアの整合性エラー {len(report)}件: " + "、".join(items) + suffix
+
+
 def analyze_scoresheet(model, image: Image.Image, max_retries: int = 2) -> str:
     """スコアシート画像を分析してCSVデータを取得
     
@@ -161,6 +191,10 @@ def analyze_scoresheet(model, image: Image.Image, max_retries: int = 2) -> str:
                     st.warning(f"⚠️ データ検証失敗（試行 {attempt + 1}/{max_retries}）: {error_msg}")
                     st.info("再試行中...")
                     continue
+                elif validate_csv_data(csv_text, check_consistency=False)[0]:
+                    # 形式は正しく整合性のみ不一致の場合は、手動確認用にデータを返す
+                    st.warning(f"⚠️ {error_msg}（保存前に確認してください）")
+                    return csv_text
                 else:
                     raise Exception(f"データ検証失敗: {error_msg}")
             
@@ -2,6 +2,7 @@
 import streamlit as st
 import sys
 import os
+import time
 from pathlib import Path
 
 # パスの設定
@@ -19,26 +20,16 @@ try:
 except Exception:
     pass
 
-# 必要なモジュールのインポート
+# 必要なモジュールのインポート（インポート時間を計測）
+# ページモジュールとplotly・Gemini SDKなどの重い依存は初回の表示時に読み込む
 try:
+    from startup_profiler import timed_import, import_report, record_first_content
+    
+    timed_import('config')
     from config import *
-    from database import StatsDatabase
-    from auth import check_password
-    from styles import load_css
-    
-    # ページモジュールのインポート
-    from pages import (
-        season_stats,
-        player_stats,
-        game_stats,
-        compare,
-        team_info,
-        opponent_stats,
-        data_input,
-        admin_settings,
-        schedule_management,
-        attendance_management
-    )
+    StatsDatabase = timed_import('database').StatsDatabase
+    check_password = timed_import('auth').check_password
+    load_css = timed_import('styles').load_css
 except ImportError as e:
     st.error(f"モジュールのインポートに失敗しました: {e}")
     st.error(f"カレントディレクトリ: {os.getcwd()}")
@@ -49,15 +40,17 @@ except ImportError as e:
 
 
 def show_splash_screen():
-    """スプラッシュスクリーン（フェイドアウト効果付き・筑波大学附属高校）"""
-    import time
+    """スプラッシュスクリーン（フェイドアウト効果付き・筑波大学附属高校）
     
-    # スプラッシュスクリーンの表示（JavaScriptで自動削除）
+    CSSアニメーションだけで消えるオーバーレイとして表示し、サーバー側では待機も再実行もしない。
+    下のコンテンツは同じ実行の中でそのまま描画される。
+    """
+    # スプラッシュスクリーンの表示（クリックを妨げず、フェイドアウト後は非表示）
     st.markdown("""
     <style>
     @keyframes fadeOut {
         from { opacity: 1; }
-        to { opacity: 0; }
+        to { opacity: 0; visibility: hidden; }
     }
     
     @keyframes slideUp {
@@ -77,8 +70,9 @@ def show_splash_screen():
         align-items: center;
         justify-content: center;
         z-index: 9999;
-        animation: fadeOut 2s ease-in-out forwards;
-        animation-delay: 6s;
+        pointer-events: none;
+        animation: fadeOut 0.6s ease-in-out forwards;
+        animation-delay: 1.2s;
     }
     
     .splash-logo {
@@ -131,20 +125,7 @@ def show_splash_screen():
         <div class="splash-school">筑波大学附属高等学校</div>
         <div class="splash-subtitle">Statistics Manager</div>
     </div>
-    
-    <script>
-    // 8秒後にスプラッシュスクリーンを完全に削除
-    setTimeout(function() {
-        var splash = document.getElementById('splashScreen');
-        if (splash) {
-            splash.remove();
-        }
-    }, 8000);
-    </script>
     """, unsafe_allow_html=True)
-    
-    # スプラッシュスクリーンが表示される時間だけ待つ
-    time.sleep(0.1)
 
 
 def initialize_session_state():
@@ -168,157 +149,18 @@ def initialize_session_state():
 def render_top_navigation(db):
     """統合ナビゲーションバーを表示（ヘッダー＋ナビゲーション一体型）"""
     
-    # データ集計
-    if db and db.df is not None and len(db.df) > 0:
-        total_games = len(db.df['GameDate'].unique()) if 'GameDate' in db.df.columns else 0
-        total_players = len(db.df['PlayerName'].unique()) if 'PlayerName' in db.df.columns else 0
-        total_records = len(db.df)
+    # データ集計（試合サマリーからキャッシュ済みの値を参照）
+    if db:
+        summary = db.get_stats_summary()
+        total_games = summary['total_games']
+        total_players = summary['total_players']
+        total_records = summary['total_records']
     else:
         total_games = 0
         total_players = 0
         total_records = 0
     
     st.markdown(f"""
-    <style>
-    /* ================================================
-       統合ヘッダー＋ナビゲーションバー
-       ================================================ */
-    
-    /* サイドバーを完全に隠す */
-    [data-testid="stSidebar"] {{
-        display: none !important;
-    }}
-    
-    /* ページ上部の余白をリセット */
-    .block-container {{
-        padding-top: 0.5rem !important;
-        max-width: 100% !important;
-    }}
-    
-    /* ===== 統合バー本体（黒背景） ===== */
-    .unified-bar {{
-        background: #000000;
-        margin: -1rem -1rem 0 -1rem;
-        border-bottom: 3px solid #c8102e;
-        position: sticky;
-        top: 0;
-        z-index: 100;
-    }}
-    
-    /* ===== 上段：ロゴ＋統計 ===== */
-    .bar-top {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 0.6rem 2rem;
-        border-bottom: 1px solid rgba(200, 16, 46, 0.3);
-    }}
-    
-    .bar-logo {{
-        display: flex;
-        align-items: center;
-        gap: 0.8rem;
-    }}
-    
-    .bar-logo-icon {{
-        font-size: 2rem;
-        line-height: 1;
-    }}
-    
-    .bar-logo-text h1 {{
-        margin: 0;
-        font-size: 1.2rem;
-        font-weight: 700;
-        color: white;
-        letter-spacing: 2px;
-        text-transform: uppercase;
-    }}
-    
-    .bar-logo-text p {{
-        margin: 0;
-        font-size: 0.7rem;
-        color: #c8102e;
-        font-weight: 600;
-        letter-spacing: 1px;
-    }}
-    
-    .bar-metrics {{
-        display: flex;
-        gap: 1.5rem;
-    }}
-    
-    .bar-metric {{
-        text-align: center;
-        padding: 0.2rem 0.8rem;
-        background: rgba(200, 16, 46, 0.1);
-        border-radius: 4px;
-        border-left: 3px solid #c8102e;
-    }}
-    
-    .bar-metric-value {{
-        font-size: 1.1rem;
-        font-weight: 700;
-        color: white;
-        line-height: 1.2;
-    }}
-    
-    .bar-metric-label {{
-        font-size: 0.6rem;
-        color: #aaa;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }}
-    
-    /* ===== 下段：ナビゲーション ===== */
-    .bar-nav {{
-        padding: 0 1rem;
-        display: flex;
-        align-items: stretch;
-        gap: 0;
-    }}
-    
-    /* ナビボタン（全ボタンに適用、ページ本文は別途上書き） */
-    .stButton button {{
-        background: transparent !important;
-        border: none !important;
-        border-radius: 0 !important;
-        border-bottom: 3px solid transparent !important;
-        padding: 0.7rem 1.2rem !important;
-        font-size: 0.82rem !important;
-        font-weight: 600 !important;
-        letter-spacing: 1px !important;
-        text-transform: uppercase !important;
-        color: rgba(0,0,0,0.85) !important;
-        transition: all 0.2s ease !important;
-        white-space: nowrap !important;
-        margin-bottom: 0 !important;
-        box-shadow: none !important;
-    }}
-    
-    .stButton button:hover {{
-        color: #000000 !important;
-        background: rgba(200, 16, 46, 0.15) !important;
-        border-bottom: 3px solid #c8102e !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }}
-    
-    .stButton button[kind="primary"] {{
-        color: #000000 !important;
-        background: rgba(200, 16, 46, 0.25) !important;
-        border-bottom: 3px solid #c8102e !important;
-        font-weight: 700 !important;
-    }}
-    
-    /* サブナビ行（統計のサブメニュー） */
-    .sub-nav-row {{
-        background: #111111;
-        padding: 0 1rem;
-        margin: 0 -1rem;
-        border-bottom: 2px solid #333;
-    }}
-    </style>
-    
     <div class="unified-bar">
         <!-- 上段：ロゴ＋統計情報 -->
         <div class="bar-top">
@@ -403,6 +245,35 @@ def render_top_navigation(db):
         st.markdown('</div>', unsafe_allow_html=True)
 
 
+# ページ名 → ページモジュール（pagesパッケージ内のモジュール名）
+PAGE_MODULES = {
+    "シーズン統計": "season_stats",
+    "選手統計": "player_stats",
+    "試合統計": "game_stats",
+    "比較分析": "compare",
+    "チーム情報": "team_info",
+    "対戦相手": "opponent_stats",
+    "予定・出欠管理": "schedule_management",
+    "データ入力": "data_input",
+    "設定": "admin_settings",
+}
+
+
+def load_page(page_name: str):
+    """ページモジュールを取得（初回の表示時にインポートし、インポート時間を記録）
+    
+    Args:
+        page_name: ページ名（PAGE_MODULESのキー）
+    
+    Returns:
+        ページモジュール
+    """
+    module = timed_import(f"pages.{PAGE_MODULES[page_name]}")
+    if DEBUG_MODE:
+        print(f"⏱️ インポート時間: {import_report()}")
+    return module
+
+
 def render_sidebar(db):
     """サイドバーを表示（後方互換性のため残す）"""
     # 上部ナビゲーションに移行したため、空にする
@@ -414,24 +285,7 @@ def render_main_content(db):
     current_page = st.session_state.current_page
     
     try:
-        if current_page == "シーズン統計":
-            season_stats.render(db)
-        elif current_page == "選手統計":
-            player_stats.render(db)
-        elif current_page == "試合統計":
-            game_stats.render(db)
-        elif current_page == "比較分析":
-            compare.render(db)
-        elif current_page == "チーム情報":
-            team_info.render(db)
-        elif current_page == "対戦相手":
-            opponent_stats.render(db)
-        elif current_page == "予定・出欠管理":
-            # パスワード不要で誰でもアクセス可能
-            schedule_management.render(db)
-        elif current_page == "データ入力":
-            data_input.render(db)
-        elif current_page == "設定":
+        if current_page == "設定":
             # 管理者認証が必要
             if not st.session_state.admin_logged_in:
                 st.warning("⚠️ この機能にアクセスするには管理者としてログインしてください")
@@ -446,11 +300,14 @@ def render_main_content(db):
                     else:
                         st.error("❌ パスワードが正しくありません")
             else:
-                admin_settings.render(db)
+                load_page(current_page).render(db)
                 
                 if st.button("ログアウト"):
                     st.session_state.admin_logged_in = False
                     st.rerun()
+        elif current_page in PAGE_MODULES:
+            # 予定・出欠管理はパスワード不要で誰でもアクセス可能
+            load_page(current_page).render(db)
         else:
             st.error(f"ページ '{current_page}' が見つかりません")
     
@@ -463,6 +320,8 @@ def render_main_content(db):
 
 def main():
     """メインアプリケーション"""
+    run_started = time.perf_counter()
+    
     # ページ設定
     st.set_page_config(
         page_title="Basketball Stats Manager",
@@ -474,12 +333,11 @@ def main():
     # セッション状態の初期化
     initialize_session_state()
     
-    # スプラッシュスクリーンを表示（初回のみ）
-    if not st.session_state.splash_shown:
+    # スプラッシュスクリーンを表示（初回のみ、オーバーレイとして表示し同じ実行でコンテンツも描画）
+    first_run = not st.session_state.splash_shown
+    if first_run:
         show_splash_screen()
         st.session_state.splash_shown = True
-        st.rerun()  # 再度追加 - これがないとコンテンツが表示されない
-        return
     
     # カスタムCSSを適用
     try:
@@ -499,6 +357,12 @@ def main():
     # 上部ナビゲーションバーとメインコンテンツを表示
     render_top_navigation(db)
     render_main_content(db)
+    
+    # 新しいセッションの最初のコンテンツ表示までの時間を記録
+    if first_run:
+        elapsed_ms = record_first_content(run_started)
+        if DEBUG_MODE:
+            print(f"⏱️ 最初のコンテンツ表示まで: {elapsed_ms:.0f} ms")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,87 @@
 """改良されたグラフ作成 - 完全版（正しいグラフタイプと軸、日英対応）"""
 import plotly.graph_objects as go
 import plotly.express as px
-from config import NBA_COLORS
+from config import NBA_COLORS, PERFORMANCE_SETTINGS
 import pandas as pd
+import hashlib
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+# 作成済みグラフのキャッシュ（キー → figureのJSON、古いものから破棄）
+_FIGURE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_FIGURE_CACHE_LOCK = threading.Lock()
+
+
+def _fingerprint(value, columns: tuple):
+    """グラフの入力値から軽量な指紋を作成
+    
+    データフレームはグラフで使うカラムだけをハッシュ化する。
+    
+    Args:
+        value: 引数の値
+        columns: グラフで使うカラム名
+    
+    Returns:
+        キャッシュキーに使えるハッシュ可能な値
+    """
+    if isinstance(value, pd.DataFrame):
+        used = [col for col in columns if col in value.columns] or list(value.columns)
+        row_hashes = pd.util.hash_pandas_object(value[used], index=False).to_numpy()
+        return ('df', tuple(map(str, used)), hashlib.sha1(row_hashes.tobytes()).hexdigest())
+    if isinstance(value, pd.Series):
+        return ('series', hashlib.sha1(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes()).hexdigest())
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(item, columns) for item in value)
+    return repr(value)
+
+
+def cached_figure(func):
+    """グラフ作成関数の結果をキャッシュするデコレータ
+    
+    入力データの指紋とグラフのパラメータが同じなら、作成済みfigureのJSONから
+    検証を省いて復元する（作成・シリアライズをやり直さない）。
+    呼び出しごとに新しいfigureを返すため、呼び出し側で変更してもキャッシュには影響しない。
+    """
+    signature = inspect.signature(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        columns = tuple(bound.arguments[name] for name in ('x_col', 'y_col') if name in bound.arguments)
+        try:
+            key = (func.__name__,) + tuple(
+                (name, _fingerprint(value, columns)) for name, value in bound.arguments.items()
+            )
+        except TypeError:
+            # ハッシュ化できない入力はキャッシュせずに作成
+            return func(*args, **kwargs)
+        
+        with _FIGURE_CACHE_LOCK:
+            figure_json = _FIGURE_CACHE.get(key)
+            if figure_json is not None:
+                _FIGURE_CACHE.move_to_end(key)
+        
+        if figure_json is None:
+            fig = func(*args, **kwargs)
+            with _FIGURE_CACHE_LOCK:
+                _FIGURE_CACHE[key] = fig.to_json()
+                while len(_FIGURE_CACHE) > PERFORMANCE_SETTINGS['figure_cache_size']:
+                    _FIGURE_CACHE.popitem(last=False)
+            return fig
+        
+        return go.Figure(json.loads(figure_json), _validate=False)
+    
+    return wrapper
+
+
+def clear_figure_cache():
+    """グラフのキャッシュを空にする"""
+    with _FIGURE_CACHE_LOCK:
+        _FIGURE_CACHE.clear()
 
 
 def create_nba_chart(data, title: str, x_col: str, y_col: str, chart_type: str = 'line', 
@@ -29,6 +108,7 @@ def create_nba_chart(data, title: str, x_col: str, y_col: str, chart_type: str =
         return create_line_chart(data, title, x_col, y_col, color, title_jp)
 
 
+@cached_figure
 def create_line_chart(data, title: str, x_col: str, y_col: str, color: str = None, title_jp: str = ""):
     """折れ線グラフを作成（改良版）
     
@@ -118,6 +198,7 @@ def create_line_chart(data, title: str, x_col: str, y_col: str, color: str = Non
     return fig
 
 
+@cached_figure
 def create_bar_chart(data, title: str, x_col: str, y_col: str, color: str = None, 
                      title_jp: str = "", orientation='v'):
     """棒グラフを作成（改良版）
@@ -207,6 +288,7 @@ def create_bar_chart(data, title: str, x_col: str, y_col: str, color: str = None
     return fig
 
 
+@cached_figure
 def create_pie_chart(labels, values, title: str, title_jp: str = ""):
     """円グラフを作成（改良版）
     
@@ -268,6 +350,7 @@ def create_pie_chart(labels, values, title: str, title_jp: str = ""):
     return fig
 
 
+@cached_figure
 def create_comparison_chart(data_list, names: list, x_col: str, y_col: str, 
                             title: str = "選手比較", title_jp: str = "Player Comparison"):
     """複数選手比較チャートを作成
@@ -362,6 +445,7 @@ def create_comparison_chart(data_list, names: list, x_col: str, y_col: str,
     return fig
 
 
+@cached_figure
 def create_radar_chart(categories, values_list, names: list, 
                        title: str = "スタッツレーダー", title_jp: str = "Stats Radar"):
     """レーダーチャートを作成
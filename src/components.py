@@ -1,8 +1,13 @@
 """再利用可能なUIコンポーネント - 完全改良版（ランキング修正、日英対応）"""
 import streamlit as st
 import os
+from functools import lru_cache
 from pathlib import Path
-from config import PLAYER_IMAGES_DIR, STAFF_IMAGES_DIR
+from config import PLAYER_IMAGES_DIR, STAFF_IMAGES_DIR, UI_SETTINGS
+
+# 部分再実行（フラグメント）デコレータ
+# 対応していない古いStreamlitでは通常の関数として実行（ページ全体が再実行される）
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
 
 
 def stat_card(label: str, value, subtitle: str = "", card_type: str = "", label_jp: str = ""):
@@ -28,26 +33,29 @@ def stat_card(label: str, value, subtitle: str = "", card_type: str = "", label_
     """, unsafe_allow_html=True)
 
 
-def ranking_row(rank: int, player: str, stat_value, stat_label: str, 
-                color: str = "#1d428a", image_path: str = None, player_number: str = ""):
-    """ランキング行を表示（完全改良版: 画像、背番号、名前を正しく表示）
-    
-    Args:
-        rank: 順位
-        player: 選手名
-        stat_value: 統計値
-        stat_label: 統計ラベル（例: "PPG"）
-        color: 表示色
-        image_path: 選手画像のパス（オプション）
-        player_number: 背番号（オプション）
-    """
-    # stat_valueを安全にfloatへ変換
+def format_ranking_value(stat_value) -> str:
+    """ランキングの統計値を表示用の文字列に変換（数値は小数1桁）"""
     try:
-        stat_value_f = float(stat_value)
-        stat_value_str = f"{stat_value_f:.1f}"
+        return f"{float(stat_value):.1f}"
     except (ValueError, TypeError):
-        stat_value_str = str(stat_value)
+        return str(stat_value)
+
 
+def _image_mtime(image_path: str = None) -> float:
+    """画像の更新時刻（ランキング行HTMLのキャッシュキーに使用、画像がなければ0）"""
+    if image_path and os.path.exists(image_path):
+        return os.path.getmtime(image_path)
+    return 0.0
+
+
+@lru_cache(maxsize=1024)
+def _ranking_row_html(rank: int, player: str, stat_value_str: str, stat_label: str,
+                      color: str, image_path: str, player_number: str, image_mtime: float) -> str:
+    """ランキング行のHTMLを作成（引数ごとにキャッシュ、画像の更新時刻もキーに含める）
+    
+    Returns:
+        1行にまとめたHTML文字列（複数行を連結してもMarkdownの空行で途切れない）
+    """
     rank_class = f"rank-{rank}" if rank <= 3 else ""
     
     # 画像があれば表示、なければデフォルトアバター
@@ -92,7 +100,7 @@ def ranking_row(rank: int, player: str, stat_value, stat_label: str,
     elif rank == 3:
         medal_html = '<span style="font-size: 1.5rem; margin-right: 0.5rem;">🥉</span>'
     
-    st.markdown(f"""
+    html = f"""
     <div class="ranking-row {rank_class}" style="background: linear-gradient(90deg, rgba(29, 66, 138, 0.1) 0%, rgba(200, 16, 46, 0.05) 100%); padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem; border-left: 5px solid {color}; display: flex; justify-content: space-between; align-items: center;">
         <div style="display: flex; align-items: center; flex: 1;">
             {medal_html}
@@ -110,7 +118,60 @@ def ranking_row(rank: int, player: str, stat_value, stat_label: str,
             <div style="color: #888; font-size: 1rem; margin-top: 0.3rem; font-weight: 600;">{stat_label}</div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+    return "".join(line.strip() for line in html.splitlines())
+
+
+def ranking_row(rank: int, player: str, stat_value, stat_label: str, 
+                color: str = "#1d428a", image_path: str = None, player_number: str = ""):
+    """ランキング行を表示（完全改良版: 画像、背番号、名前を正しく表示）
+    
+    Args:
+        rank: 順位
+        player: 選手名
+        stat_value: 統計値
+        stat_label: 統計ラベル（例: "PPG"）
+        color: 表示色
+        image_path: 選手画像のパス（オプション）
+        player_number: 背番号（オプション）
+    """
+    st.markdown(
+        _ranking_row_html(rank, str(player), format_ranking_value(stat_value), stat_label,
+                          color, image_path, str(player_number or ""), _image_mtime(image_path)),
+        unsafe_allow_html=True
+    )
+
+
+def ranking_table(players, stat_values, stat_label: str, color: str = "#1d428a",
+                  image_paths=None, player_numbers=None, start_rank: int = 1):
+    """ランキング全体（メダル表示を含む）を1回のst.markdownで表示
+    
+    ranking_rowを行数分呼び出すと行ごとにブラウザへの送信が発生するため、
+    全行のHTMLを連結して1ブロックで送信する。
+    
+    Args:
+        players: 選手名のリスト（順位順）
+        stat_values: 統計値のリスト（playersと同じ順）
+        stat_label: 統計ラベル（例: "PPG"）
+        color: 表示色
+        image_paths: 選手画像のパスのリスト（オプション）
+        player_numbers: 背番号のリスト（オプション）
+        start_rank: 先頭行の順位
+    """
+    players = list(players)
+    image_paths = list(image_paths) if image_paths is not None else [None] * len(players)
+    player_numbers = list(player_numbers) if player_numbers is not None else [""] * len(players)
+    
+    rows_html = "".join(
+        _ranking_row_html(rank, str(player), format_ranking_value(value), stat_label,
+                          color, image_path, str(number or ""), _image_mtime(image_path))
+        for rank, player, value, image_path, number in zip(
+            range(start_rank, start_rank + len(players)), players, stat_values, image_paths, player_numbers
+        )
+    )
+    
+    if rows_html:
+        st.markdown(f'<div class="ranking-table">{rows_html}</div>', unsafe_allow_html=True)
 
 
 def game_card(date: str, opponent: str, team_score: int, opp_score: int, game_format: str = "4Q"):
@@ -252,3 +313,49 @@ def comparison_table(data_dict: dict, highlight_max: bool = True):
     
     html += '</tbody></table>'
     st.markdown(html, unsafe_allow_html=True)
+
+
+def paginated_table(fetch_page, total_rows: int, key: str, page_size: int = None, height: int = None):
+    """ページ単位で表示するテーブル（表示中のページ分だけを取得・描画）
+    
+    Args:
+        fetch_page: (offset, limit)を受け取り、そのページのDataFrameを返す関数
+        total_rows: 全体の行数
+        key: ウィジェットキーの接頭辞
+        page_size: 1ページの件数（省略時はUI_SETTINGS['items_per_page']）
+        height: テーブルの高さ（省略時は行数に合わせる）
+    
+    Returns:
+        表示したページのDataFrame
+    """
+    page_size = page_size or UI_SETTINGS['items_per_page']
+    total_pages = max((total_rows + page_size - 1) // page_size, 1)
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input(
+            "ページ / Page",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key=f"{key}_page"
+        )
+    
+    # ページ数が減った後（フィルタ変更など）も範囲内に収める
+    page = min(int(page), total_pages)
+    offset = (page - 1) * page_size
+    page_df = fetch_page(offset, page_size)
+    
+    with col2:
+        if total_rows:
+            last_row = min(offset + page_size, total_rows)
+            st.caption(f"{offset + 1}–{last_row} / {total_rows}件 （{page} / {total_pages}ページ）")
+        else:
+            st.caption("0件 / No rows")
+    
+    if height:
+        st.dataframe(page_df, use_container_width=True, hide_index=True, height=height)
+    else:
+        st.dataframe(page_df, use_container_width=True, hide_index=True)
+    return page_df
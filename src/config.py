@@ -33,6 +33,7 @@ safe_mkdir(DATA_DIR, "データディレクトリ")
 safe_mkdir(IMAGES_DIR, "画像ディレクトリ")
 safe_mkdir(IMAGES_DIR / "players", "選手画像ディレクトリ")
 safe_mkdir(IMAGES_DIR / "staff", "スタッフ画像ディレクトリ")
+safe_mkdir(DATA_DIR / "reports", "レポートキャッシュディレクトリ")
 
 # データベースファイル（文字列パス）
 DATA_FILE = str(DATA_DIR / "basketball_stats.csv")
@@ -40,6 +41,7 @@ TEAM_INFO_FILE = str(DATA_DIR / "team_info.csv")
 OPPONENT_STATS_FILE = str(DATA_DIR / "opponent_stats.csv")
 PLAYER_IMAGES_DIR = str(IMAGES_DIR / "players")
 STAFF_IMAGES_DIR = str(IMAGES_DIR / "staff")
+REPORTS_DIR = str(DATA_DIR / "reports")
 
 # カラム定義
 STAT_COLUMNS = [
@@ -158,12 +160,17 @@ LOGGING_CONFIG = {
 PERFORMANCE_SETTINGS = {
     'cache_ttl': 300,
     'max_dataframe_size': 10000,
-    'chunk_size': 1000
+    'chunk_size': 1000,
+    'bootstrap_samples': 2000,
+    'random_seed': 42,
+    'report_workers': None,
+    'figure_cache_size': 128
 }
 
 # UI設定
 UI_SETTINGS = {
     'items_per_page': 10,
+    'editor_height': 400,
     'chart_height': 400,
     'chart_width': 600,
     'animation_duration': 500
@@ -3,9 +3,21 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
+from collections import OrderedDict
 import os
 import sys
 
+from stats import (
+    calculate_advanced_stats, calculate_rolling_stats, calculate_last_n_stats, build_game_table,
+    build_game_catalog, split_team_rows,
+    calculate_opponent_stats, build_percentile_table, lookup_percentiles,
+    build_similarity_matrix, find_similar_players, calculate_stats,
+    build_season_lines, merge_season_lines, summarize_lines, build_career_table,
+    calculate_streaks, calculate_milestones,
+    build_split_lines, calculate_splits, SPLIT_DIMENSIONS, check_box_score_consistency
+)
+from query import StatsQuery
+
 # Streamlitのインポート（オプショナル）
 try:
     import streamlit as st
@@ -27,6 +39,9 @@ except ImportError:
 # デバッグモード
 DEBUG_MODE = os.getenv('DEBUG', 'False').lower() == 'true'
 
+# クエリ結果キャッシュの最大件数
+QUERY_CACHE_SIZE = 32
+
 class StatsDatabase:
     """バスケットボール統計データベース - 改善版"""
     
@@ -70,6 +85,13 @@ class StatsDatabase:
         # パーセンテージカラム
         self.percentage_columns = ['3P%', '2P%', 'FT%']
         
+        # データセットのバージョン（書き込みのたびに更新）と集計キャッシュ
+        self._version = 0
+        self.last_consistency_report = pd.DataFrame()
+        self._cache: Dict[tuple, object] = {}
+        # クエリ結果のキャッシュ（検索文字列やページごとに増えるため件数を制限）
+        self._query_cache: "OrderedDict[tuple, object]" = OrderedDict()
+        
         # データフレームの初期化
         self._df = None
         self.load()
@@ -81,6 +103,73 @@ class StatsDatabase:
             self.load()
         return self._df if self._df is not None else self._create_empty()
     
+    @property
+    def version(self) -> int:
+        """データセットのバージョン（集計キャッシュのキーに使用）"""
+        return self._version
+    
+    def _mark_changed(self):
+        """データ変更を記録し、集計キャッシュを破棄"""
+        self._version += 1
+        self._cache.clear()
+        self._query_cache.clear()
+    
+    def cached(self, key, builder):
+        """データセットのバージョン単位で集計結果をキャッシュ
+        
+        Args:
+            key: キャッシュキー（文字列またはタプル）
+            builder: キャッシュがない場合に呼び出す集計関数
+        
+        Returns:
+            集計結果（呼び出し側で変更しないこと）
+        """
+        cache_key = (self._version,) + (key if isinstance(key, tuple) else (key,))
+        if cache_key not in self._cache:
+            self._cache[cache_key] = builder()
+        return self._cache[cache_key]
+    
+    def query_cached(self, key: tuple, builder):
+        """クエリ結果をキャッシュ（古いものから破棄するLRU）
+        
+        自由入力の検索条件や並び順ごとにエントリが増えるため、
+        件数をQUERY_CACHE_SIZEまでに制限する。
+        
+        Args:
+            key: キャッシュキー
+            builder: キャッシュがない場合に呼び出す関数
+        
+        Returns:
+            クエリ結果（呼び出し側で変更しないこと）
+        """
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+            return self._query_cache[key]
+        
+        result = builder()
+        self._query_cache[key] = result
+        while len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return result
+    
+    def page_cached(self, page: str, builder, season: str = None, player: str = None, mode=None):
+        """ページの重い計算をキャッシュ
+        
+        キーは(データセットのバージョン, ページ, シーズン, 選手, モード)。load・add_game_stats・
+        delete_gameでバージョンが更新されると自動的に無効になる。
+        
+        Args:
+            page: ページ名（'season_stats'など）
+            builder: キャッシュがない場合に呼び出す計算関数
+            season: シーズン（Noneの場合は全シーズン）
+            player: 選手名
+            mode: 表示モードなどの追加キー（ハッシュ可能な値）
+        
+        Returns:
+            計算結果（呼び出し側で変更しないこと）
+        """
+        return self.cached(('page', page, season, player, mode), builder)
+    
     def _create_empty(self) -> pd.DataFrame:
         """空のデータフレームを作成"""
         df = pd.DataFrame(columns=self.stat_columns)
@@ -141,6 +230,7 @@ class StatsDatabase:
                 df = self._recalculate_percentages(df)
                 
                 self._df = df
+                self._mark_changed()
                 
                 # セッション状態にも保存（Streamlitがある場合）
                 if HAS_STREAMLIT and hasattr(st, 'session_state'):
@@ -156,6 +246,7 @@ class StatsDatabase:
                     print("✅ 新しいデータベースを作成")
                 
                 self._df = self._create_empty()
+                self._mark_changed()
                 
                 if HAS_STREAMLIT and hasattr(st, 'session_state'):
                     st.session_state['database'] = self._df
@@ -170,6 +261,7 @@ class StatsDatabase:
                 print(traceback.format_exc())
             
             self._df = self._create_empty()
+            self._mark_changed()
             if HAS_STREAMLIT and hasattr(st, 'session_state'):
                 st.session_state['database'] = self._df
             return False
@@ -297,11 +389,26 @@ class StatsDatabase:
             # データ型変換
             stats_df = self._validate_and_convert_types(stats_df)
             
+            # ボックススコアの整合性チェック（違反があっても保存は行い、警告のみ表示）
+            _, report = check_box_score_consistency(stats_df)
+            self.last_consistency_report = report
+            if not report.empty:
+                st.warning(f"⚠️ ボックススコアの整合性に問題がある行が{len(report)}件あります（得点・リバウンド・成功数・チーム得点）")
+            
+            # 追加前のシーズン別合計（あれば追加分だけ集計して結合する）
+            previous_lines = self._cache.get((self._version, 'season_lines'))
+            
             # データを追加
             if self._df is None or self._df.empty:
                 self._df = stats_df
             else:
                 self._df = pd.concat([self._df, stats_df], ignore_index=True)
+            self._mark_changed()
+            
+            if previous_lines is not None:
+                self._cache[(self._version, 'season_lines')] = merge_season_lines(
+                    previous_lines, build_season_lines(stats_df)
+                )
             
             # 保存
             return self.save()
@@ -313,21 +420,18 @@ class StatsDatabase:
                 print(traceback.format_exc())
             return False
     
+    def query(self) -> StatsQuery:
+        """統計クエリを作成（query.StatsQueryを参照）"""
+        return StatsQuery(self)
+    
     def get_player_stats(self, player_name: str = None, season: str = None) -> pd.DataFrame:
         """選手統計を取得"""
         try:
-            df = self.df.copy()
-            
-            if df.empty:
+            if self.df.empty:
                 return self._create_empty()
             
-            if player_name:
-                df = df[df['PlayerName'] == player_name]
-            
-            if season:
-                df = df[df['Season'] == season]
-            
-            return df
+            # 抽出結果はクエリのキャッシュを共有し、呼び出し側にはコピーを返す
+            return self.query().where(PlayerName=player_name or None, Season=season or None).rows().copy()
             
         except Exception as e:
             st.error(f"❌ 統計取得エラー: {e}")
@@ -358,6 +462,475 @@ class StatsDatabase:
                 print(traceback.format_exc())
             return self._create_empty()
     
+    def _get_date_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """GameDateを一度だけdatetime64に変換したソート済みインデックス（バージョン単位でキャッシュ）
+        
+        Returns:
+            (昇順の日付配列, 対応する行位置の配列)（日付を解釈できない行は含まない）
+        """
+        def build():
+            if self.df.empty or 'GameDate' not in self.df.columns:
+                return np.array([], dtype='datetime64[ns]'), np.array([], dtype=np.int64)
+            dates = pd.to_datetime(self.df['GameDate'], errors='coerce').to_numpy()
+            valid_positions = np.flatnonzero(~np.isnat(dates))
+            order = valid_positions[np.argsort(dates[valid_positions], kind='stable')]
+            return dates[order], order
+        
+        return self.cached('date_index', build)
+    
+    def get_games_between(self, start=None, end=None, season: str = None) -> pd.DataFrame:
+        """期間内のデータを取得（ソート済み日付インデックスを二分探索して範囲を切り出す）
+        
+        Args:
+            start: 開始日（この日を含む、Noneの場合は最初から）
+            end: 終了日（この日を含む、Noneの場合は最後まで）
+            season: シーズン（指定時はさらに絞り込む）
+        
+        Returns:
+            期間内のデータフレーム（試合日の昇順）
+        """
+        try:
+            sorted_dates, order = self._get_date_index()
+            low = 0 if start is None else np.searchsorted(sorted_dates, np.datetime64(pd.Timestamp(start)), side='left')
+            high = len(order) if end is None else np.searchsorted(sorted_dates, np.datetime64(pd.Timestamp(end)), side='right')
+            
+            rows = self.df.iloc[order[low:high]]
+            if season:
+                rows = rows[rows['Season'] == season]
+            return rows.copy()
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 期間指定データ取得エラー: {e}")
+            return self._create_empty()
+    
+    def get_recent_stats(self, days: int = 30, reference=None) -> pd.DataFrame:
+        """直近の期間のデータを取得
+        
+        Args:
+            days: 日数
+            reference: 基準日（Noneの場合はデータ内の最新試合日）
+        
+        Returns:
+            基準日までのdays日間のデータフレーム（試合日の昇順）
+        """
+        sorted_dates, _ = self._get_date_index()
+        if len(sorted_dates) == 0:
+            return self._create_empty()
+        
+        end = pd.Timestamp(reference) if reference is not None else pd.Timestamp(sorted_dates[-1])
+        return self.get_games_between(end - pd.Timedelta(days=days - 1), end)
+    
+    def get_date_range(self) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """データ内の最初と最後の試合日を取得"""
+        sorted_dates, _ = self._get_date_index()
+        if len(sorted_dates) == 0:
+            return None, None
+        return pd.Timestamp(sorted_dates[0]), pd.Timestamp(sorted_dates[-1])
+    
+    def _get_advanced_stats_by_season(self) -> pd.DataFrame:
+        """(Season, PlayerName) をインデックスとするアドバンスドスタッツ（キャッシュ）"""
+        return self.cached(
+            'advanced_stats_by_season',
+            lambda: calculate_advanced_stats(self.df, ['Season', 'PlayerName'])
+        )
+    
+    def get_advanced_stats(self, season: str = None) -> pd.DataFrame:
+        """選手ごとのアドバンスドスタッツを取得（データセットのバージョン単位でキャッシュ）
+        
+        Args:
+            season: シーズン（Noneの場合は全シーズン通算）
+        
+        Returns:
+            選手名をインデックスとするデータフレーム
+        """
+        try:
+            if not season:
+                return self.cached('advanced_stats', lambda: calculate_advanced_stats(self.df))
+            
+            by_season = self._get_advanced_stats_by_season()
+            if by_season.empty or season not in by_season.index.get_level_values('Season'):
+                return pd.DataFrame()
+            return by_season.xs(season, level='Season')
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ アドバンスドスタッツ取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_similarity_matrix(self) -> tuple:
+        """全シーズンの選手×シーズン特徴量行列を取得（データセットのバージョン単位でキャッシュ）
+        
+        Returns:
+            (インデックス, 標準化済み行列, 出場試合数)（stats.build_similarity_matrixを参照）
+        """
+        return self.cached(
+            'similarity_matrix',
+            lambda: build_similarity_matrix(self._get_advanced_stats_by_season())
+        )
+    
+    def get_similar_players(self, player_name: str, season: str, k: int = 5,
+                            min_games: int = 1, exclude_same_player: bool = True) -> pd.DataFrame:
+        """指定した選手シーズンに近い選手シーズンを全シーズンから検索
+        
+        Args:
+            player_name: 選手名
+            season: シーズン
+            k: 返す件数
+            min_games: 候補とする最低出場試合数
+            exclude_same_player: 同じ選手の別シーズンを除外するか
+        
+        Returns:
+            Season, PlayerName, Distance, Similarity と主要スタッツのデータフレーム（近い順）
+        """
+        try:
+            index, matrix, games = self.get_similarity_matrix()
+            similar = find_similar_players(
+                index, matrix, games, (season, player_name),
+                k=k, min_games=min_games, exclude_same_player=exclude_same_player
+            )
+            profile = self._get_advanced_stats_by_season()[['GP', 'PPG', 'RPG', 'APG', 'TS%', 'USG%']]
+            return similar.join(profile, on=['Season', 'PlayerName'])
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 類似選手検索エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_percentile_table(self, season: str = None) -> dict:
+        """スタッツごとのソート済み配列を取得（パーセンタイル検索用、バージョン単位でキャッシュ）
+        
+        Args:
+            season: シーズン（Noneの場合は全シーズン通算）
+        
+        Returns:
+            {カラム名: ソート済み配列} の辞書（stats.build_percentile_tableを参照）
+        """
+        try:
+            return self.cached(
+                ('percentile_table', season or None),
+                lambda: build_percentile_table(self.get_advanced_stats(season))
+            )
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ パーセンタイルテーブル取得エラー: {e}")
+            return {}
+    
+    def get_player_percentiles(self, player_name: str, stats: list, season: str = None) -> list:
+        """選手のパーセンタイル（0〜100）を取得
+        
+        Args:
+            player_name: 選手名
+            stats: 取得するカラム名のリスト（アドバンスドスタッツのカラム）
+            season: シーズン（Noneの場合は全シーズン通算）
+        
+        Returns:
+            statsと同じ順序のパーセンタイルのリスト（選手が存在しない場合は0）
+        """
+        advanced = self.get_advanced_stats(season)
+        if advanced.empty or player_name not in advanced.index:
+            return [0.0] * len(stats)
+        return lookup_percentiles(self.get_percentile_table(season), advanced.loc[player_name], stats)
+    
+    def get_season_lines(self) -> pd.DataFrame:
+        """選手×シーズン単位の合計・最高記録を取得
+        
+        データセットのバージョン単位でキャッシュし、add_game_statsでは追加分のみ集計して結合する。
+        
+        Returns:
+            (PlayerName, Season) をインデックスとするデータフレーム（stats.build_season_linesを参照）
+        """
+        return self.cached('season_lines', lambda: build_season_lines(self.df))
+    
+    def get_career_stats(self) -> pd.DataFrame:
+        """選手ごとの通算成績を取得（シーズン別合計から作成）
+        
+        Returns:
+            選手名をインデックスとするデータフレーム（stats.build_career_tableを参照）
+        """
+        try:
+            return self.cached('career_stats', lambda: build_career_table(self.get_season_lines()))
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 通算成績取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_season_summaries(self, player_name: str = None) -> pd.DataFrame:
+        """選手のシーズン別成績（平均・成功率・最高記録）を取得
+        
+        Args:
+            player_name: 選手名（Noneの場合は全選手）
+        
+        Returns:
+            player_name指定時はシーズンをインデックス（新しい順）、
+            それ以外は (PlayerName, Season) をインデックスとするデータフレーム
+        """
+        try:
+            summaries = self.cached('season_summaries', lambda: summarize_lines(self.get_season_lines()))
+            if player_name is None:
+                return summaries
+            if summaries.empty or player_name not in summaries.index.get_level_values('PlayerName'):
+                return pd.DataFrame()
+            return summaries.xs(player_name, level='PlayerName').sort_index(ascending=False)
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ シーズン別成績取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_player_summary(self, player_name: str, season: str = None) -> dict:
+        """選手の平均スタッツを取得（calculate_statsと同じキーの辞書）
+        
+        Args:
+            player_name: 選手名
+            season: シーズン（Noneの場合は通算）
+        
+        Returns:
+            統計情報の辞書（データがない場合はGP=0の辞書）
+        """
+        if season:
+            table = self.get_season_summaries(player_name)
+            key = season
+        else:
+            table = self.get_career_stats()
+            key = player_name
+        
+        if table.empty or key not in table.index:
+            return calculate_stats(self._create_empty())
+        
+        summary = table.loc[key].to_dict()
+        summary['GP'] = int(summary['GP'])
+        return summary
+    
+    def _split_lines(self) -> pd.DataFrame:
+        """スプリット集計の元になる合計テーブル（自チームの行のみ、バージョン単位でキャッシュ）"""
+        return self.cached('split_lines', lambda: build_split_lines(self.df))
+    
+    def get_split_dimensions(self) -> List[str]:
+        """利用可能なスプリットの軸を取得（Venueはデータにカラムがある場合のみ）"""
+        split_lines = self._split_lines()
+        if split_lines.empty:
+            return []
+        return [dim for dim in SPLIT_DIMENSIONS if dim in split_lines.index.names]
+    
+    def get_splits(self, dimension: str, season: str = None, player_name: str = None) -> pd.DataFrame:
+        """スプリット別の平均スタッツを取得（データセットのバージョン単位でキャッシュ）
+        
+        Args:
+            dimension: スプリットの軸（'Role', 'Result', 'Venue', 'GameFormat'）
+            season: シーズン（Noneの場合は全シーズン）
+            player_name: 選手名（Noneの場合はチーム全体）
+        
+        Returns:
+            スプリットごとのデータフレーム（stats.calculate_splitsを参照）
+        """
+        try:
+            split_lines = self._split_lines()
+            return self.cached(
+                ('splits', dimension, season or None, player_name),
+                lambda: calculate_splits(
+                    split_lines, dimension, season=season, player_name=player_name,
+                    games=None if player_name else self.get_game_table(season)
+                )
+            )
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ スプリット取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_streaks(self, season: str = None) -> pd.DataFrame:
+        """全選手の連続記録を取得（データセットのバージョン単位でキャッシュ）
+        
+        Args:
+            season: シーズン（指定時はそのシーズン内の連続記録、Noneの場合は全試合通し）
+        
+        Returns:
+            連続記録のデータフレーム（stats.calculate_streaksを参照）
+        """
+        try:
+            if not season:
+                return self.cached('streaks', lambda: calculate_streaks(self.df))
+            return self.cached(('streaks', season), lambda: calculate_streaks(self.get_season_stats(season)))
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 連続記録取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_milestones(self) -> pd.DataFrame:
+        """全選手の通算マイルストーン・キャリアハイ達成試合を取得（バージョン単位でキャッシュ）
+        
+        Returns:
+            マイルストーンのデータフレーム（stats.calculate_milestonesを参照）
+        """
+        try:
+            return self.cached('milestones', lambda: calculate_milestones(self.df))
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ マイルストーン取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_rolling_stats(self, window: int = 5, season: str = None) -> pd.DataFrame:
+        """全選手の移動平均を取得（データセットのバージョン・ウィンドウ幅単位でキャッシュ）
+        
+        Args:
+            window: 移動平均の試合数
+            season: シーズン（Noneの場合はシーズンをまたいで計算）
+        
+        Returns:
+            元データと同じ行インデックスを持つデータフレーム
+        """
+        try:
+            if not season:
+                return self.cached(('rolling_stats', window), lambda: calculate_rolling_stats(self.df, window))
+            
+            by_season = self.cached(
+                ('rolling_stats_by_season', window),
+                lambda: calculate_rolling_stats(self.df, window, ['Season', 'PlayerName'])
+            )
+            if by_season.empty:
+                return by_season
+            return by_season[by_season['Season'] == season]
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 移動平均取得エラー: {e}")
+            return pd.DataFrame()
+    
+    def get_last_n_stats(self, n: int = 5, season: str = None) -> pd.DataFrame:
+        """全選手の直近N試合成績を取得
+        
+        Args:
+            n: 試合数
+            season: シーズン（Noneの場合は全シーズン）
+        
+        Returns:
+            選手名をインデックスとするデータフレーム
+        """
+        return self.cached(
+            ('last_n_stats', n, season),
+            lambda: calculate_last_n_stats(self.get_rolling_stats(n, season))
+        )
+    
+    def get_game_table(self, season: str = None) -> pd.DataFrame:
+        """試合単位のチームサマリーを取得（データセットのバージョン単位でキャッシュ）
+        
+        Args:
+            season: シーズン（Noneの場合は全シーズン）
+        
+        Returns:
+            1行=1試合のデータフレーム（stats.build_game_tableを参照）
+        """
+        try:
+            games = self.cached('game_table', lambda: build_game_table(self.df))
+            if not season:
+                return games
+            return self.cached(
+                ('game_table', season),
+                lambda: games[games['Season'] == season].reset_index(drop=True)
+            )
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 試合サマリー取得エラー: {e}")
+            return build_game_table(self._create_empty())
+    
+    def get_game_catalog(self, season: str = None, data_type: str = 'OurTeam') -> pd.DataFrame:
+        """試合選択用のカタログを取得（データセットのバージョン単位でキャッシュ）
+        
+        Args:
+            season: シーズン（Noneの場合は全シーズン）
+            data_type: 'OurTeam'（自チームの試合）、'OpponentTeam'（相手チームとして登録された行）、
+                       Noneの場合はすべての行
+        
+        Returns:
+            1行=1試合のデータフレーム（stats.build_game_catalogを参照）
+        """
+        def build():
+            if data_type == 'OurTeam':
+                return build_game_catalog(self.get_game_table(season))
+            
+            rows = self.df
+            if data_type == 'OpponentTeam':
+                rows = split_team_rows(rows)[1]
+            if season:
+                rows = rows[rows['Season'] == season]
+            return build_game_catalog(rows)
+        
+        try:
+            return self.cached(('game_catalog', data_type, season), build)
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 試合カタログ取得エラー: {e}")
+            return build_game_catalog(self._create_empty())
+    
+    def delete_game(self, game_date: str, opponent: str, game_format: str = None) -> int:
+        """試合の行を削除（保存は呼び出し側で行う）
+        
+        Args:
+            game_date: 試合日
+            opponent: 対戦相手
+            game_format: 試合形式（Noneの場合は同日・同相手のすべての試合）
+        
+        Returns:
+            削除した行数
+        """
+        try:
+            if self.df.empty:
+                return 0
+            
+            mask = (self._df['GameDate'].astype(str) == str(game_date)) & (self._df['Opponent'] == opponent)
+            if game_format is not None and 'GameFormat' in self._df.columns:
+                mask &= self._df['GameFormat'] == game_format
+            
+            deleted = int(mask.sum())
+            if deleted:
+                self._df = self._df[~mask].reset_index(drop=True)
+                self._mark_changed()
+            return deleted
+        
+        except Exception as e:
+            st.error(f"❌ 試合削除エラー: {e}")
+            if DEBUG_MODE:
+                import traceback
+                print(traceback.format_exc())
+            return 0
+    
+    def get_opponent_stats(self, season: str = None) -> pd.DataFrame:
+        """対戦相手ごとの成績を取得（データセットのバージョン単位でキャッシュ）
+        
+        シーズン別の成績は全シーズン分を1回の集計で作成し、シーズン指定時はそこから抽出する。
+        
+        Args:
+            season: シーズン（Noneの場合は全シーズン通算）
+        
+        Returns:
+            対戦相手ごとの成績（stats.calculate_opponent_statsを参照）
+        """
+        try:
+            games = self.get_game_table()
+            if not season:
+                return self.cached('opponent_stats', lambda: calculate_opponent_stats(games))
+            
+            by_season = self.cached(
+                'opponent_stats_by_season',
+                lambda: calculate_opponent_stats(games, ['Season', 'Opponent'])
+            )
+            return self.cached(
+                ('opponent_stats', season),
+                lambda: by_season[by_season['Season'] == season].drop(columns='Season').reset_index(drop=True)
+            )
+        
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"⚠️ 対戦相手成績取得エラー: {e}")
+            return pd.DataFrame()
+    
     def get_all_players(self, season: str = None) -> List[str]:
         """全選手リストを取得"""
         try:
@@ -421,7 +994,7 @@ class StatsDatabase:
     def get_stats_summary(self) -> dict:
         """データベースの統計サマリーを取得"""
         try:
-            df = self.df.copy()
+            df = self.df
             
             if df.empty:
                 return {
@@ -431,17 +1004,15 @@ class StatsDatabase:
                     'total_records': 0
                 }
             
-            total_games = len(df['GameDate'].unique()) if 'GameDate' in df.columns else 0
-            total_players = len(df['PlayerName'].unique()) if 'PlayerName' in df.columns else 0
-            total_seasons = len(df['Season'].unique()) if 'Season' in df.columns else 0
-            total_records = len(df)
+            def build_summary():
+                return {
+                    'total_games': len(self.get_game_table()),
+                    'total_players': df['PlayerName'].nunique() if 'PlayerName' in df.columns else 0,
+                    'total_seasons': df['Season'].nunique() if 'Season' in df.columns else 0,
+                    'total_records': len(df)
+                }
             
-            return {
-                'total_games': total_games,
-                'total_players': total_players,
-                'total_seasons': total_seasons,
-                'total_records': total_records
-            }
+            return self.cached('stats_summary', build_summary)
         except Exception as e:
             if DEBUG_MODE:
                 print(f"⚠️ 統計サマリー取得エラー: {e}")
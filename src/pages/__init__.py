@@ -1,18 +1,9 @@
-"""ページモジュール"""
-from . import season_stats
-from . import player_stats
-from . import game_stats
-from . import compare
-from . import data_input
-from . import team_info
-from . import opponent_stats
-from . import admin_settings
-from . import schedule_management
-from . import attendance_management
+"""ページモジュール（各ページは初回アクセス時にインポート）"""
+import importlib
 
 __all__ = [
     'season_stats',
-    'player_stats', 
+    'player_stats',
     'game_stats',
     'compare',
     'data_input',
@@ -22,3 +13,10 @@ __all__ = [
     'schedule_management',
     'attendance_management'
 ]
+
+
+def __getattr__(name):
+    """ページモジュールを初回アクセス時にインポート（plotlyなどの重い依存を必要になるまで読み込まない）"""
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,7 @@ if str(Path(__file__).parent.parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import *
+from startup_profiler import import_report, loaded_heavy_modules, first_content_summary
 
 
 def render(db=None):
@@ -417,20 +418,35 @@ def render(db=None):
         with col1:
             st.markdown("### テーマカラー / Theme Colors")
             
+            theme = st.session_state.get('theme_colors', {})
+            current_theme = {
+                'primary': theme.get('primary', NBA_COLORS.get('primary', '#1d428a')),
+                'secondary': theme.get('secondary', NBA_COLORS.get('secondary', '#c8102e'))
+            }
+            
             primary_color = st.color_picker(
                 "プライマリカラー",
-                value=NBA_COLORS.get('primary', '#1d428a'),
+                value=current_theme['primary'],
                 help="メインで使用される色"
             )
             
             secondary_color = st.color_picker(
                 "セカンダリカラー",
-                value=NBA_COLORS.get('secondary', '#c8102e'),
+                value=current_theme['secondary'],
                 help="アクセントカラー"
             )
             
+            # スタイルシートはページ描画前のload_cssで送信されるため、色が変わったら再実行して反映
+            # （テーマごとに一度だけ生成され、変更時のみ再送信される）
+            picked_theme = {'primary': primary_color, 'secondary': secondary_color}
+            if picked_theme != current_theme:
+                st.session_state['theme_colors'] = picked_theme
+                st.rerun()
+            
             if st.button("カラーをリセット", key="reset_colors"):
+                st.session_state.pop('theme_colors', None)
                 st.success("デフォルトカラーに戻しました")
+                st.rerun()
         
         with col2:
             st.markdown("### 言語設定 / Language")
@@ -635,6 +651,28 @@ def render(db=None):
         for key, value in system_info.items():
             st.text(f"{key}: {value}")
         
+        st.markdown("### 起動プロファイル / Startup Profile")
+        
+        # モジュールごとの初回インポート時間（ページは初回表示時に読み込まれる）
+        report = import_report()
+        if report:
+            st.dataframe(
+                [{"モジュール / Module": row['module'], "インポート時間 (ms)": row['ms']} for row in report],
+                use_container_width=True,
+                hide_index=True
+            )
+        
+        for label, loaded in loaded_heavy_modules().items():
+            st.text(f"{label}: {'読み込み済み / loaded' if loaded else '未読み込み / not loaded'}")
+        
+        first_content = first_content_summary()
+        if first_content:
+            st.text(
+                f"最初のコンテンツ表示まで / Time to first content: "
+                f"直近 {first_content['last_ms']:.0f} ms・中央値 {first_content['median_ms']:.0f} ms"
+                f"（{first_content['sessions']}セッション）"
+            )
+        
         if st.button("設定をリセット"):
             st.warning("すべての設定がデフォルトに戻ります")
             if st.button("確認: リセット実行"):
@@ -9,9 +9,9 @@ if str(Path(__file__).parent.parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import StatsDatabase
-from stats import calculate_stats
+from stats import calculate_season_overview, RADAR_STATS
 from charts import create_comparison_chart, create_radar_chart, create_bar_chart
-from components import section_header, comparison_table
+from components import section_header, comparison_table, fragment
 from config import NBA_COLORS, STAT_CATEGORIES
 
 
@@ -23,7 +23,7 @@ def calculate_contribution_score(stats_dict):
              (スティール × 3.0) + (ブロック × 3.0) - (TO × 2.0)
     
     Args:
-        stats_dict: 統計データの辞書
+        stats_dict: 統計データの辞書（値はスカラーまたは全選手分のシリーズ）
     
     Returns:
         貢献度スコア
@@ -60,13 +60,20 @@ def render(db: StatsDatabase):
         st.info("📊 現在データがありません / No data available.")
         return
     
+    render_comparison(db)
+
+
+@fragment
+def render_comparison(db: StatsDatabase):
+    """比較モードと各モードの内容を表示（モード切り替えではこのセクションだけを再実行）"""
     # 比較モード選択
     compare_mode = st.radio(
         "比較モードを選択 / Select Comparison Mode",
         ["選手間比較（同一シーズン）/ Player vs Player (Same Season)", 
          "同一選手の異シーズン比較 / Same Player (Different Seasons)",
          "シーズン間比較 / Season Comparison",
-         "貢献度ランキング / Contribution Ranking"],
+         "貢献度ランキング / Contribution Ranking",
+         "類似選手検索 / Similar Players"],
         horizontal=False
     )
     
@@ -76,8 +83,10 @@ def render(db: StatsDatabase):
         render_player_season_comparison(db)
     elif compare_mode == "シーズン間比較 / Season Comparison":
         render_season_comparison(db)
-    else:
+    elif compare_mode == "貢献度ランキング / Contribution Ranking":
         render_contribution_ranking(db)
+    else:
+        render_similar_players(db)
 
 
 def render_player_comparison(db: StatsDatabase):
@@ -137,12 +146,14 @@ def render_player_comparison(db: StatsDatabase):
         return
     
     # 統計データ取得
-    season_df = db.get_season_stats(selected_season)
-    stats_list = [calculate_stats(season_df, player) for player in selected_players]
+    stats_list = [db.get_player_summary(player, selected_season) for player in selected_players]
     
-    # 貢献度スコアを計算
-    for stats in stats_list:
+    # 貢献度スコアとアドバンスドスタッツを追加
+    advanced_stats = db.get_advanced_stats(selected_season)
+    for player, stats in zip(selected_players, stats_list):
         stats['Contribution'] = calculate_contribution_score(stats)
+        if player in advanced_stats.index:
+            stats.update(advanced_stats.loc[player, ['eFG%', 'TS%', 'USG%']].to_dict())
     
     # 比較テーブル
     section_header("STATISTICS COMPARISON", "統計比較")
@@ -152,6 +163,7 @@ def render_player_comparison(db: StatsDatabase):
             'PPG / 平均得点', 'RPG / 平均リバウンド', 'APG / 平均アシスト', 
             'SPG / 平均スティール', 'BPG / 平均ブロック', 
             'FG% / FG成功率', '3P% / 3P成功率', 'FT% / FT成功率', 
+            'eFG% / 実効FG%', 'TS% / トゥルーシューティング', 'USG% / 使用率',
             'GP / 試合数', '**貢献度スコア**'
         ]
     }
@@ -166,6 +178,9 @@ def render_player_comparison(db: StatsDatabase):
             f"{stats['FG%']:.1f}%",
             f"{stats['3P%']:.1f}%",
             f"{stats['FT%']:.1f}%",
+            f"{stats.get('eFG%', 0):.1f}%",
+            f"{stats.get('TS%', 0):.1f}%",
+            f"{stats.get('USG%', 0):.1f}%",
             str(stats['GP']),
             f"**{stats['Contribution']:.2f}**"
         ]
@@ -215,9 +230,9 @@ def render_player_season_comparison(db: StatsDatabase):
         key='season_comp_player'
     )
     
-    # その選手がプレーしたシーズンを取得
-    player_data = db.get_player_stats(selected_player)
-    player_seasons = sorted(player_data['Season'].unique().tolist(), reverse=True)
+    # その選手がプレーしたシーズンを取得（シーズン別成績から参照）
+    season_lines = db.get_season_summaries(selected_player)
+    player_seasons = season_lines.index.tolist()
     
     if len(player_seasons) < 2:
         st.warning(f"⚠️ {selected_player}は1シーズンのみのデータです")
@@ -240,8 +255,8 @@ def render_player_season_comparison(db: StatsDatabase):
         return
     
     # 各シーズンの統計を取得
-    stats1 = calculate_stats(db.get_season_stats(season1), selected_player)
-    stats2 = calculate_stats(db.get_season_stats(season2), selected_player)
+    stats1 = db.get_player_summary(selected_player, season1)
+    stats2 = db.get_player_summary(selected_player, season2)
     
     stats1['Contribution'] = calculate_contribution_score(stats1)
     stats2['Contribution'] = calculate_contribution_score(stats2)
@@ -324,42 +339,39 @@ def render_season_comparison(db: StatsDatabase):
         season2 = st.selectbox("シーズン 2", remaining_seasons, key='season_cmp2')
     
     if season1 and season2:
-        data1 = db.get_season_stats(season1)
-        data2 = db.get_season_stats(season2)
-        
-        # チーム統計比較
-        team_stats1 = {
-            'games': len(data1['GameDate'].unique()),
-            'wins': len(data1[data1['TeamScore'] > data1['OpponentScore']]['GameDate'].unique()),
-            'avg_pts': data1.groupby('GameDate')['PTS'].sum().mean(),
-            'avg_reb': data1.groupby('GameDate')['TOT'].sum().mean(),
-            'avg_ast': data1.groupby('GameDate')['AST'].sum().mean()
-        }
-        
-        team_stats2 = {
-            'games': len(data2['GameDate'].unique()),
-            'wins': len(data2[data2['TeamScore'] > data2['OpponentScore']]['GameDate'].unique()),
-            'avg_pts': data2.groupby('GameDate')['PTS'].sum().mean(),
-            'avg_reb': data2.groupby('GameDate')['TOT'].sum().mean(),
-            'avg_ast': data2.groupby('GameDate')['AST'].sum().mean()
-        }
+        # チーム統計比較（試合サマリーから集計）
+        team_stats1, team_stats2 = [
+            db.page_cached(
+                'compare',
+                lambda season=season: calculate_season_overview(db.get_season_stats(season), db.get_game_table(season)),
+                season=season,
+                mode='overview'
+            )
+            for season in (season1, season2)
+        ]
         
         # 比較テーブル
         comparison_data = {
-            'STAT / 項目': ['試合数', '勝利数', '平均得点', '平均リバウンド', '平均アシスト'],
+            'STAT / 項目': ['試合数', '勝利数', '平均得点', '平均リバウンド', '平均アシスト', 'ペース', 'ORtg', 'DRtg'],
             season1: [
                 team_stats1['games'],
                 team_stats1['wins'],
                 f"{team_stats1['avg_pts']:.1f}",
                 f"{team_stats1['avg_reb']:.1f}",
-                f"{team_stats1['avg_ast']:.1f}"
+                f"{team_stats1['avg_ast']:.1f}",
+                f"{team_stats1['avg_pace']:.1f}",
+                f"{team_stats1['ortg']:.1f}",
+                f"{team_stats1['drtg']:.1f}"
             ],
             season2: [
                 team_stats2['games'],
                 team_stats2['wins'],
                 f"{team_stats2['avg_pts']:.1f}",
                 f"{team_stats2['avg_reb']:.1f}",
-                f"{team_stats2['avg_ast']:.1f}"
+                f"{team_stats2['avg_ast']:.1f}",
+                f"{team_stats2['avg_pace']:.1f}",
+                f"{team_stats2['ortg']:.1f}",
+                f"{team_stats2['drtg']:.1f}"
             ]
         }
         
@@ -382,29 +394,35 @@ def render_contribution_ranking(db: StatsDatabase):
         key='contrib_season'
     )
     
-    season_data = db.get_season_stats(selected_season)
-    players = db.get_all_players(season=selected_season)
+    advanced_stats = db.get_advanced_stats(selected_season)
     
-    # 各選手の貢献度を計算
-    contrib_list = []
+    if advanced_stats.empty:
+        st.warning("⚠️ データがありません")
+        return
     
-    for player in players:
-        stats = calculate_stats(season_data, player)
-        contribution = calculate_contribution_score(stats)
-        
-        contrib_list.append({
-            'Player': player,
-            'PPG': stats['PTS'],
-            'RPG': stats['REB'],
-            'APG': stats['AST'],
-            'SPG': stats['STL'],
-            'BPG': stats['BLK'],
-            'TO': stats.get('TO', 0),
-            'Contribution': contribution,
-            'GP': stats['GP']
+    # 全選手の貢献度を一括計算（シーズンごとにキャッシュ）
+    def build_contributions():
+        contrib_df = pd.DataFrame({
+            'Player': advanced_stats.index,
+            'PPG': advanced_stats['PPG'].values,
+            'RPG': advanced_stats['RPG'].values,
+            'APG': advanced_stats['APG'].values,
+            'SPG': advanced_stats['SPG'].values,
+            'BPG': advanced_stats['BPG'].values,
+            'TO': advanced_stats['TOPG'].values
+        })
+        contrib_df['Contribution'] = calculate_contribution_score({
+            'PTS': contrib_df['PPG'],
+            'REB': contrib_df['RPG'],
+            'AST': contrib_df['APG'],
+            'STL': contrib_df['SPG'],
+            'BLK': contrib_df['BPG'],
+            'TO': contrib_df['TO']
         })
+        contrib_df['GP'] = advanced_stats['GP'].values
+        return contrib_df.sort_values('Contribution', ascending=False)
     
-    contrib_df = pd.DataFrame(contrib_list).sort_values('Contribution', ascending=False)
+    contrib_df = db.page_cached('compare', build_contributions, season=selected_season, mode='contribution')
     
     # ランキング表示
     st.markdown("### 📊 シーズン貢献度ランキング")
@@ -427,6 +445,67 @@ def render_contribution_ranking(db: StatsDatabase):
     st.plotly_chart(fig, use_container_width=True)
 
 
+def render_similar_players(db: StatsDatabase):
+    """類似選手検索を表示（全シーズンの選手シーズンからk近傍を検索）"""
+    section_header("SIMILAR PLAYERS", "類似選手検索")
+    
+    seasons = db.get_all_seasons()
+    if not seasons:
+        st.warning("⚠️ データがありません")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_season = st.selectbox(
+            "シーズン選択 / Select Season",
+            seasons,
+            key='similar_season'
+        )
+    
+    players = db.get_all_players(season=selected_season)
+    if not players:
+        st.warning("⚠️ 選手データがありません")
+        return
+    
+    with col2:
+        selected_player = st.selectbox(
+            "基準となる選手 / Reference Player",
+            players,
+            key='similar_player'
+        )
+    
+    col3, col4, col5 = st.columns(3)
+    
+    with col3:
+        k = st.slider("表示件数 / Results", min_value=3, max_value=10, value=5, key='similar_k')
+    
+    with col4:
+        min_games = st.number_input("最低出場試合数 / Min Games", min_value=1, value=1, step=1, key='similar_min_games')
+    
+    with col5:
+        include_self = st.checkbox("同じ選手の別シーズンを含める", value=False, key='similar_include_self')
+    
+    similar = db.get_similar_players(
+        selected_player, selected_season, k=k,
+        min_games=int(min_games), exclude_same_player=not include_self
+    )
+    
+    if similar.empty:
+        st.info("条件に合う選手が見つかりません / No similar players found")
+        return
+    
+    st.markdown(f"### 🔍 {selected_player}（{selected_season}）に近い選手")
+    
+    display_df = similar.drop(columns='Distance')
+    display_df.insert(0, '順位', range(1, len(display_df) + 1))
+    display_df.columns = ['順位', 'シーズン', '選手名', '類似度', '試合数', 'PPG', 'RPG', 'APG', 'TS%', 'USG%']
+    display_df = display_df.round(1)
+    
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    st.caption("類似度は出場時間・各種平均・シュート効率を標準化した距離から算出（100=完全一致）")
+
+
 def render_comparison_charts(db, players, stats_list, season):
     """比較チャートをレンダリング"""
     chart_type = st.radio(
@@ -436,33 +515,17 @@ def render_comparison_charts(db, players, stats_list, season):
     )
     
     if chart_type == "レーダーチャート（総合）":
-        categories = ['得点', 'リバウンド', 'アシスト', 'スティール', 'ブロック']
+        categories = list(RADAR_STATS.values())
         
-        values_list = []
-        for stats in stats_list:
-            max_vals = {'PTS': 30, 'REB': 15, 'AST': 10, 'STL': 3, 'BLK': 3}
-            
-            # 安全な数値変換
-            pts = float(stats.get('PTS', 0)) if stats.get('PTS') is not None else 0
-            reb = float(stats.get('REB', 0)) if stats.get('REB') is not None else 0
-            ast = float(stats.get('AST', 0)) if stats.get('AST') is not None else 0
-            stl = float(stats.get('STL', 0)) if stats.get('STL') is not None else 0
-            blk = float(stats.get('BLK', 0)) if stats.get('BLK') is not None else 0
-            
-            values = [
-                min(pts / max_vals['PTS'] * 100, 100),
-                min(reb / max_vals['REB'] * 100, 100),
-                min(ast / max_vals['AST'] * 100, 100),
-                min(stl / max_vals['STL'] * 100, 100),
-                min(blk / max_vals['BLK'] * 100, 100)
-            ]
-            values_list.append(values)
+        # シーズン内パーセンタイルで正規化（選手ページと同じテーブルを参照）
+        values_list = [db.get_player_percentiles(player, list(RADAR_STATS), season) for player in players]
         
         fig = create_radar_chart(categories, values_list, players, "総合スタッツ比較", "Overall Stats")
         st.plotly_chart(fig, use_container_width=True)
+        st.caption("各項目はシーズン内パーセンタイル（0=最下位、100=最上位）/ Season percentile per category")
     
     elif chart_type == "棒グラフ（項目別）":
-        stat_options = ['PTS', 'TOT', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'Contribution']
+        stat_options = ['PTS', 'TOT', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'eFG%', 'TS%', 'USG%', 'Contribution']
         stat_to_compare = st.selectbox(
             "比較する統計項目",
             stat_options,
@@ -474,6 +537,9 @@ def render_comparison_charts(db, players, stats_list, season):
                 'BLK': 'ブロック BPG',
                 'FG%': 'FG成功率',
                 '3P%': '3P成功率',
+                'eFG%': '実効FG%',
+                'TS%': 'トゥルーシューティング%',
+                'USG%': '使用率',
                 'Contribution': '貢献度スコア'
             }.get(x, x)
         )
@@ -2,6 +2,7 @@
 import streamlit as st
 import pandas as pd
 import io
+import time
 from datetime import datetime
 from PIL import Image
 import sys
@@ -13,9 +14,11 @@ if str(Path(__file__).parent.parent) not in sys.path:
 
 from database import StatsDatabase
 from auth import check_password
-from ai import setup_gemini, analyze_scoresheet
-from components import section_header
-from config import SEASONS, GAME_FORMATS
+from ai import setup_gemini, analyze_scoresheet, format_consistency_report
+from components import section_header, paginated_table
+from utils import DataValidator
+from config import SEASONS, GAME_FORMATS, PERFORMANCE_SETTINGS, UI_SETTINGS
+from reports import build_all_season_reports
 
 
 def render(db: StatsDatabase):
@@ -127,9 +130,21 @@ def render_team_data_input(db: StatsDatabase):
             st.session_state['current_stats'],
             num_rows="dynamic",
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            height=UI_SETTINGS['editor_height']
         )
         
+        # ボックススコアの整合性チェック（保存前に確認）
+        _, consistency_report = DataValidator.check_box_score_consistency(edited_df)
+        if consistency_report.empty:
+            st.success("✅ ボックススコアの整合性チェックOK / Box score is consistent")
+        else:
+            st.warning(f"⚠️ {format_consistency_report(consistency_report)}")
+            with st.expander("違反の詳細 / Violation details"):
+                display_report = consistency_report.copy()
+                display_report.columns = ['行', '選手名', 'ルール', '期待値', '実際']
+                st.dataframe(display_report, use_container_width=True, hide_index=True)
+        
         col1, col2, col3 = st.columns([1, 1, 2])
         
         with col1:
@@ -226,6 +241,7 @@ def render_opponent_data_input(db: StatsDatabase):
         num_rows="dynamic",
         use_container_width=True,
         hide_index=True,
+        height=UI_SETTINGS['editor_height'],
         key='opp_data_editor'
     )
     
@@ -295,15 +311,29 @@ def render_data_management(db: StatsDatabase):
     with col2:
         st.markdown("#### 📤 インポート / Import")
         import_file = st.file_uploader("CSV Upload", type=['csv'], key='import')
-        if import_file and st.button("インポート実行 / IMPORT DATA"):
+        if import_file:
             try:
                 import_df = pd.read_csv(import_file)
-                db.add_game_stats(import_df)
-                if db.save():
-                    st.success("✅ インポート成功! / Import successful!")
-                    st.rerun()
             except Exception as e:
+                import_df = None
                 st.error(f"❌ エラー / Error: {e}")
+            
+            if import_df is not None:
+                # プレビューは表示中のページ分だけを描画
+                paginated_table(
+                    lambda offset, limit: import_df.iloc[offset:offset + limit],
+                    len(import_df),
+                    key='import_preview'
+                )
+                
+                if st.button("インポート実行 / IMPORT DATA"):
+                    try:
+                        db.add_game_stats(import_df)
+                        if db.save():
+                            st.success("✅ インポート成功! / Import successful!")
+                            st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ エラー / Error: {e}")
     
     with col3:
         st.markdown("#### 🗑️ 削除 / Delete")
@@ -316,31 +346,41 @@ def render_data_management(db: StatsDatabase):
             )
             
             if data_type_filter == "自チーム / Our Team":
-                filtered_df = db.df[db.df.get('DataType', 'OurTeam') == 'OurTeam']
+                catalog = db.get_game_catalog()
             elif data_type_filter == "相手チーム / Opponent":
-                filtered_df = db.df[db.df.get('DataType', 'OurTeam') == 'OpponentTeam']
+                catalog = db.get_game_catalog(data_type='OpponentTeam')
             else:
-                filtered_df = db.df
+                catalog = db.get_game_catalog(data_type=None)
             
-            if not filtered_df.empty:
-                games_list = filtered_df.groupby(['GameDate', 'Opponent']).size().reset_index()[['GameDate', 'Opponent']]
-                game_options = [f"{row['GameDate']} vs {row['Opponent']}" for _, row in games_list.iterrows()]
+            if not catalog.empty:
+                game_labels = dict(zip(catalog['GameKey'], catalog['Label']))
+                selected_game_to_delete = st.selectbox(
+                    "試合選択 / Select game",
+                    [""] + catalog['GameKey'].tolist(),
+                    format_func=lambda key: game_labels.get(key, ""),
+                    key='delete_game'
+                )
                 
-                if game_options:
-                    selected_game_to_delete = st.selectbox("試合選択 / Select game", [""] + game_options, key='delete_game')
+                if selected_game_to_delete and st.button("🗑️ 削除 / DELETE", type="secondary"):
+                    # キー文字列を分解せず、カタログの行から日付・相手・試合形式を取得
+                    game_row = catalog[catalog['GameKey'] == selected_game_to_delete].iloc[0]
                     
-                    if selected_game_to_delete and st.button("🗑️ 削除 / DELETE", type="secondary"):
-                        game_date_str = selected_game_to_delete.split(" vs ")[0]
-                        opponent_str = selected_game_to_delete.split(" vs ")[1]
-                        
-                        db.delete_game(game_date_str, opponent_str)
-                        
-                        if db.save():
-                            st.success(f"✅ 削除完了: {selected_game_to_delete}")
-                            st.rerun()
+                    db.delete_game(game_row['GameDate'], game_row['Opponent'], game_row['GameFormat'])
+                    
+                    if db.save():
+                        st.success(f"✅ 削除完了: {game_labels[selected_game_to_delete]}")
+                        st.rerun()
             else:
                 st.info("該当データなし")
     
+    # 全データ閲覧
+    st.markdown("---")
+    render_data_browser(db)
+    
+    # シーズンレポート一括作成
+    st.markdown("---")
+    render_report_builder(db)
+    
     # データベース統計
     st.markdown("---")
     st.markdown("### 📊 データベース統計")
@@ -360,3 +400,98 @@ def render_data_management(db: StatsDatabase):
     
     with metric_col4:
         st.metric("総レコード数", stats_summary['total_records'])
+
+
+def render_data_browser(db: StatsDatabase):
+    """全データをページ単位で閲覧（絞り込み・並び替えはデータベース側で実行）"""
+    st.markdown("### 🔎 全データ閲覧 / Browse All Data")
+    
+    if db.df.empty:
+        st.info("データがありません")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        browse_season = st.selectbox(
+            "シーズン / Season",
+            ["全シーズン / ALL"] + db.get_all_seasons(),
+            key='browse_season'
+        )
+    
+    with col2:
+        browse_player = st.text_input("選手名で検索 / Player", key='browse_player')
+    
+    with col3:
+        sort_column = st.selectbox(
+            "並び替え / Sort by",
+            list(db.df.columns),
+            index=list(db.df.columns).index('GameDate') if 'GameDate' in db.df.columns else 0,
+            key='browse_sort'
+        )
+    
+    with col4:
+        sort_order = st.radio(
+            "順序 / Order",
+            ["降順 / Desc", "昇順 / Asc"],
+            horizontal=True,
+            key='browse_order'
+        )
+    
+    query = db.query()
+    if browse_season != "全シーズン / ALL":
+        query = query.where(Season=browse_season)
+    if browse_player.strip():
+        query = query.filter('PlayerName', 'contains', browse_player.strip())
+    query = query.sort(sort_column, ascending=(sort_order == "昇順 / Asc"))
+    
+    paginated_table(
+        lambda offset, limit: query.offset(offset).limit(limit).run(),
+        query.count(),
+        key='browse'
+    )
+
+
+def render_report_builder(db: StatsDatabase):
+    """全シーズンのレポートを一括作成（変更のないシーズンはキャッシュを再利用）"""
+    st.markdown("### 📑 シーズンレポート一括作成 / Batch Season Reports")
+    
+    if db.df.empty:
+        st.info("データがありません")
+        return
+    
+    force = st.checkbox("キャッシュを使わずにすべて再計算 / Rebuild all", key='report_force_rebuild')
+    
+    if st.button("📑 全シーズンのレポートを作成 / BUILD ALL REPORTS", key='build_reports'):
+        start = time.perf_counter()
+        try:
+            with st.spinner("レポートを作成中... / Building reports..."):
+                reports = build_all_season_reports(
+                    db.df, max_workers=PERFORMANCE_SETTINGS['report_workers'], force=force
+                )
+        except Exception as e:
+            st.error(f"❌ レポート作成エラー / Report error: {e}")
+            return
+        elapsed = time.perf_counter() - start
+        
+        if not reports:
+            st.warning("⚠️ レポートを作成できるデータがありません")
+            return
+        
+        rebuilt = sum(1 for report in reports.values() if not report['cached'])
+        st.success(f"✅ {len(reports)}シーズンのレポートを準備しました（再計算 {rebuilt}件・{elapsed:.2f}秒）")
+        
+        summary_df = pd.DataFrame([
+            {
+                'シーズン': season,
+                '試合数': report['overview']['games'],
+                '勝': report['overview']['wins'],
+                '敗': report['overview']['losses'],
+                '平均得点': round(report['overview']['avg_pts'], 1),
+                '選手数': report['overview']['players'],
+                '作成日時': report['generated_at'],
+                '状態': 'キャッシュ' if report['cached'] else '再計算'
+            }
+            for season, report in reports.items()
+        ])
+        st.dataframe(summary_df, use_container_width=True, hide_index=True)
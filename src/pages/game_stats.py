@@ -72,61 +72,35 @@ def render(db: StatsDatabase):
         """, unsafe_allow_html=True)
         return
     
-    # 試合を一意に識別（日付 + 相手 + 試合形式で区別、同日同対戦相手は連番付与）
-    game_groups = season_data.groupby(['GameDate', 'Opponent', 'GameFormat']).size().reset_index(name='count')
-    game_list = []
-    
-    # 同日同対戦相手の試合を追跡するカウンター
-    date_opponent_counter = {}
-    
-    for _, row in game_groups.iterrows():
-        date = row['GameDate']
-        opponent = row['Opponent']
-        game_format = row['GameFormat']
-        
-        # 同日・同相手のカウント
-        key = f"{date}_{opponent}"
-        if key not in date_opponent_counter:
-            date_opponent_counter[key] = 0
-        date_opponent_counter[key] += 1
-        
-        # 同日・同相手の試合が複数ある場合は番号を付ける
-        same_day_same_opponent = game_groups[(game_groups['GameDate'] == date) & (game_groups['Opponent'] == opponent)]
-        
-        if len(same_day_same_opponent) > 1:
-            game_number = date_opponent_counter[key]
-            game_label = f"{date} vs {opponent} (第{game_number}試合 - {game_format})"
-        else:
-            game_label = f"{date} vs {opponent} ({game_format})"
-        
-        game_list.append({
-            'label': game_label,
-            'date': date,
-            'opponent': opponent,
-            'format': game_format,
-            'game_number': date_opponent_counter[key]
-        })
+    # 試合カタログ（日付 + 相手 + 試合形式で区別、同日同対戦相手は連番付与済み）
+    catalog = db.get_game_catalog(None if selected_season == "全シーズン / ALL" else selected_season)
     
     with col2:
-        if not game_list:
+        if catalog.empty:
             st.warning("試合データがありません / No game data available")
             return
         
-        selected_game_label = st.selectbox(
+        selected_game_key = st.selectbox(
             "試合選択 / SELECT GAME",
-            [g['label'] for g in game_list],
+            catalog['GameKey'].tolist(),
+            format_func=dict(zip(catalog['GameKey'], catalog['Label'])).get,
             key='game_select'
         )
     
     # 選択された試合の情報を取得
-    selected_game_info = next(g for g in game_list if g['label'] == selected_game_label)
-    
-    # 試合データを取得（日付・相手・試合形式で絞り込み）
-    game_data = season_data[
-        (season_data['GameDate'] == selected_game_info['date']) &
-        (season_data['Opponent'] == selected_game_info['opponent']) &
-        (season_data['GameFormat'] == selected_game_info['format'])
-    ]
+    selected_game_info = catalog[catalog['GameKey'] == selected_game_key].iloc[0]
+    
+    # 試合データを取得（日付・相手・試合形式で絞り込み、試合ごとにキャッシュ）
+    game_data = db.page_cached(
+        'game_stats',
+        lambda: season_data[
+            (season_data['GameDate'] == selected_game_info['GameDate']) &
+            (season_data['Opponent'] == selected_game_info['Opponent']) &
+            (season_data['GameFormat'] == selected_game_info['GameFormat'])
+        ],
+        season=selected_game_info['Season'],
+        mode=('game', selected_game_key)
+    )
     
     if game_data.empty:
         st.warning("試合データの取得に失敗しました / Failed to retrieve game data")
@@ -138,7 +112,7 @@ def render(db: StatsDatabase):
     opp_score = game_data['OpponentScore'].iloc[0] if 'OpponentScore' in game_data.columns else 0
     game_format = game_data['GameFormat'].iloc[0] if 'GameFormat' in game_data.columns else '4Q'
     
-    game_card(selected_game_info['date'], opponent, team_score, opp_score)
+    game_card(selected_game_info['GameDate'], opponent, team_score, opp_score)
     
     # 試合形式表示
     st.markdown(f"**試合形式 / Game Format:** `{game_format}`")
@@ -148,7 +122,12 @@ def render(db: StatsDatabase):
     # チーム統計
     section_header("チーム統計 / Team Statistics")
     
-    team_stats = calculate_team_stats(game_data)
+    team_stats = db.page_cached(
+        'game_stats',
+        lambda: calculate_team_stats(game_data),
+        season=selected_game_info['Season'],
+        mode=('team_stats', selected_game_key)
+    )
     
     col1, col2, col3, col4, col5 = st.columns(5)
     
@@ -184,6 +163,32 @@ def render(db: StatsDatabase):
     with col9:
         stat_card("FT%", f"{team_stats.get('ft_pct', 0):.1f}%", "FT成功率")
     
+    # ポゼッション・レーティング（試合サマリーから）
+    games = db.get_game_table(selected_game_info['Season'])
+    game_row = games[
+        (games['GameDate'] == selected_game_info['GameDate']) &
+        (games['Opponent'] == selected_game_info['Opponent']) &
+        (games['GameFormat'] == selected_game_info['GameFormat'])
+    ]
+    
+    if not game_row.empty:
+        pace_row = game_row.iloc[0]
+        drtg_note = "失点/相手100ポゼッション" if pace_row['OppRecorded'] else "失点/100ポゼッション（推定）"
+        
+        col10, col11, col12, col13 = st.columns(4)
+        
+        with col10:
+            stat_card("Possessions", f"{pace_row['POSS']:.1f}", "ポゼッション数")
+        
+        with col11:
+            stat_card("Pace", f"{pace_row['PACE']:.1f}", "ペース")
+        
+        with col12:
+            stat_card("ORtg", f"{pace_row['ORtg']:.1f}", "得点/100ポゼッション", "primary")
+        
+        with col13:
+            stat_card("DRtg", f"{pace_row['DRtg']:.1f}", drtg_note, "secondary")
+    
     st.markdown("---")
     
     # ビジュアル分析
@@ -283,7 +288,7 @@ def render(db: StatsDatabase):
     st.download_button(
         label="試合データをダウンロード / Download Game Data",
         data=csv,
-        file_name=f"game_{selected_game_info['date']}_{opponent}.csv",
+        file_name=f"game_{selected_game_info['GameDate']}_{opponent}.csv",
         mime="text/csv"
     )
     
@@ -69,17 +69,11 @@ def render_head_to_head_summary(db: StatsDatabase):
         key='opponent_season'
     )
     
+    # 対戦相手ごとの統計（試合サマリーから集計済み）
     if selected_season == "全シーズン / ALL":
-        season_data = db.df
+        opponent_stats = db.get_opponent_stats()
     else:
-        season_data = db.get_season_stats(selected_season)
-    
-    if season_data.empty:
-        st.warning("⚠️ データがありません")
-        return
-    
-    # 対戦相手ごとの統計を計算
-    opponent_stats = calculate_opponent_stats(season_data)
+        opponent_stats = db.get_opponent_stats(selected_season)
     
     if opponent_stats.empty:
         st.warning("⚠️ 対戦相手データがありません")
@@ -181,28 +175,35 @@ def render_game_comparison(db: StatsDatabase):
         st.warning("⚠️ データがありません")
         return
     
-    # 試合リストを取得
-    games = season_data.groupby(['GameDate', 'Opponent']).size().reset_index()[['GameDate', 'Opponent']]
-    game_options = [f"{row['GameDate']} vs {row['Opponent']}" for _, row in games.iterrows()]
+    # 試合リストを取得（試合カタログから）
+    catalog = db.get_game_catalog(selected_season)
     
-    if not game_options:
+    if catalog.empty:
         st.warning("⚠️ 試合データがありません")
         return
     
-    selected_game = st.selectbox(
+    selected_game_key = st.selectbox(
         "試合を選択 / Select Game",
-        game_options,
+        catalog['GameKey'].tolist(),
+        format_func=dict(zip(catalog['GameKey'], catalog['Label'])).get,
         key='comp_game_select'
     )
     
     # 選択された試合のデータを取得
-    game_date = selected_game.split(" vs ")[0]
-    opponent = selected_game.split(" vs ")[1]
-    
-    game_data = season_data[
-        (season_data['GameDate'] == game_date) & 
-        (season_data['Opponent'] == opponent)
-    ]
+    selected_game = catalog[catalog['GameKey'] == selected_game_key].iloc[0]
+    game_date = selected_game['GameDate']
+    opponent = selected_game['Opponent']
+    
+    game_data = db.page_cached(
+        'opponent_stats',
+        lambda: season_data[
+            (season_data['GameDate'] == game_date) & 
+            (season_data['Opponent'] == opponent) &
+            (season_data['GameFormat'] == selected_game['GameFormat'])
+        ],
+        season=selected_season,
+        mode=('game', selected_game_key)
+    )
     
     if game_data.empty:
         st.warning("⚠️ 試合データがありません")
@@ -301,45 +302,3 @@ def render_opponent_details(db: StatsDatabase):
     # - 相手チーム選手の個人スタッツ管理
     # - より詳細な比較分析
 
-
-def calculate_opponent_stats(season_data: pd.DataFrame) -> pd.DataFrame:
-    """対戦相手ごとの統計を計算"""
-    if season_data.empty:
-        return pd.DataFrame()
-    
-    opponent_stats = []
-    
-    for opponent in season_data['Opponent'].unique():
-        opp_games = season_data[season_data['Opponent'] == opponent]
-        
-        games_played = len(opp_games['GameDate'].unique())
-        
-        # 勝敗を計算
-        game_results = opp_games.groupby('GameDate').agg({
-            'TeamScore': 'first',
-            'OpponentScore': 'first'
-        })
-        
-        wins = len(game_results[game_results['TeamScore'] > game_results['OpponentScore']])
-        losses = games_played - wins
-        
-        # 統計を集計
-        team_pts = opp_games.groupby('GameDate')['PTS'].sum().mean()
-        opp_pts = opp_games.groupby('GameDate')['OpponentScore'].first().mean()
-        team_reb = opp_games.groupby('GameDate')['TOT'].sum().mean()
-        team_ast = opp_games.groupby('GameDate')['AST'].sum().mean()
-        
-        opponent_stats.append({
-            'Opponent': opponent,
-            'GamesPlayed': games_played,
-            'Wins': wins,
-            'Losses': losses,
-            'WinRate': (wins / games_played * 100) if games_played > 0 else 0,
-            'AvgPtsFor': team_pts,
-            'AvgPtsAgainst': opp_pts,
-            'AvgRebFor': team_reb,
-            'AvgAstFor': team_ast,
-            'PtsDiff': team_pts - opp_pts
-        })
-    
-    return pd.DataFrame(opponent_stats).sort_values('GamesPlayed', ascending=False)
@@ -9,9 +9,9 @@ if str(Path(__file__).parent.parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import StatsDatabase
-from stats import calculate_stats
-from charts import create_nba_chart, create_bar_chart, create_radar_chart
-from components import stat_card, section_header, player_card
+from stats import RADAR_STATS, SPLIT_DIMENSIONS
+from charts import create_nba_chart, create_bar_chart, create_radar_chart, create_comparison_chart
+from components import stat_card, section_header, player_card, fragment
 from config import NBA_COLORS
 
 
@@ -31,6 +31,17 @@ def render(db: StatsDatabase):
         st.info("📊 現在データがありません")
         return
     
+    render_player_section(db, seasons)
+
+
+@fragment
+def render_player_section(db: StatsDatabase, seasons):
+    """シーズン・選手の選択と選手スタッツを表示（選択の変更ではこのセクションだけを再実行）
+    
+    Args:
+        db: データベースインスタンス
+        seasons: シーズン一覧
+    """
     col1, col2 = st.columns([2, 3])
     
     with col1:
@@ -62,15 +73,21 @@ def render(db: StatsDatabase):
     if not selected_player:
         return
     
-    # 選手データ取得
-    player_data = db.get_player_stats(selected_player, season=season_filter)
+    # 選手データ取得（ページキャッシュを共有するため変更しないこと）
+    player_data = db.page_cached(
+        'player_stats',
+        lambda: db.get_player_stats(selected_player, season=season_filter),
+        season=season_filter,
+        player=selected_player,
+        mode='game_log'
+    )
     
     if player_data.empty:
         st.warning(f"⚠️ {selected_player}のデータがありません")
         return
     
     # 選手情報カード
-    stats = calculate_stats(db.df if season_filter is None else db.get_season_stats(season_filter), selected_player)
+    stats = db.get_player_summary(selected_player, season_filter)
     player_number = player_data['No'].iloc[0] if len(player_data) > 0 else "N/A"
     
     player_card(selected_player, player_number)
@@ -130,6 +147,15 @@ def render(db: StatsDatabase):
     with col10:
         stat_card("TO", f"{stats.get('TO', 0):.1f}", "Turnovers", "secondary")
     
+    # 通算モードではシーズン別成績とキャリアハイを表示
+    if season_filter is None:
+        render_career_section(db, selected_player, stats)
+    
+    # アドバンスドスタッツ
+    advanced_stats = db.get_advanced_stats(season_filter)
+    if selected_player in advanced_stats.index:
+        render_advanced_stats(advanced_stats.loc[selected_player])
+    
     # パフォーマンスチャート
     section_header("パフォーマンスチャート / Performance Charts")
     
@@ -140,23 +166,31 @@ def render(db: StatsDatabase):
     )
     
     if chart_type == "時系列推移":
-        render_time_series_charts(player_data)
+        render_time_series_charts(db, player_data, selected_player, stats, season_filter)
     elif chart_type == "カテゴリ別比較":
         render_category_comparison(stats, selected_player)
     else:
-        render_radar_chart_analysis(stats, selected_player)
+        render_radar_chart_analysis(db, stats, selected_player, season_filter)
+    
+    # スプリット
+    render_player_splits(db, selected_player, season_filter)
+    
+    # 連続記録・マイルストーン
+    render_streaks_and_milestones(db, selected_player, season_filter)
     
     # ゲームログ
     section_header("ゲームログ / Game Log")
     
+    game_log = filter_game_log_period(db, player_data, selected_player, season_filter)
+    
     display_cols = ['GameDate', 'Opponent', 'PTS', '3PM', '3PA', '3P%', 
                    'FTM', 'FTA', 'FT%', 'TOT', 'AST', 'STL', 'BLK', 'TO', 'MIN']
     
     # 利用可能なカラムのみを表示
-    available_cols = [col for col in display_cols if col in player_data.columns]
+    available_cols = [col for col in display_cols if col in game_log.columns]
     
     st.dataframe(
-        player_data[available_cols].sort_values('GameDate', ascending=False),
+        game_log[available_cols].sort_values('GameDate', ascending=False),
         use_container_width=True,
         hide_index=True,
         height=400
@@ -172,51 +206,272 @@ def render(db: StatsDatabase):
     )
 
 
-def render_time_series_charts(player_data):
-    """時系列推移チャートを表示"""
+def filter_game_log_period(db, player_data, player_name, season=None):
+    """ゲームログの表示期間を選択して絞り込む（日付インデックスの範囲検索を使用）"""
+    period = st.radio(
+        "期間 / Period",
+        ["全期間", "直近30日", "直近90日", "期間指定"],
+        horizontal=True,
+        key='player_log_period'
+    )
+    
+    if period == "全期間":
+        return player_data
+    
+    if period == "期間指定":
+        first_date, last_date = db.get_date_range()
+        if first_date is None:
+            return player_data
+        date_range = st.date_input(
+            "期間を選択 / Select Range",
+            (first_date.date(), last_date.date()),
+            min_value=first_date.date(),
+            max_value=last_date.date(),
+            key='player_log_range'
+        )
+        if not isinstance(date_range, (tuple, list)) or len(date_range) != 2:
+            return player_data
+        rows = db.get_games_between(date_range[0], date_range[1], season)
+    else:
+        days = 30 if period == "直近30日" else 90
+        if player_data.empty:
+            return player_data
+        # 期間の終わりは表示中の選手（シーズン）の最終試合日
+        last_game = pd.to_datetime(player_data['GameDate'], errors='coerce').max()
+        if pd.isna(last_game):
+            return player_data
+        rows = db.get_recent_stats(days, reference=last_game)
+        if season:
+            rows = rows[rows['Season'] == season]
+    
+    return rows[rows['PlayerName'] == player_name]
+
+
+def render_career_section(db, player_name, career):
+    """シーズン別成績とキャリアハイを表示"""
+    section_header("シーズン別成績 / Season by Season")
+    
+    season_lines = db.get_season_summaries(player_name)
+    if not season_lines.empty:
+        display_df = season_lines[['GP', 'MPG', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'FT%']].round(1)
+        display_df = display_df.reset_index()
+        display_df.columns = ['シーズン', '試合数', 'MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'FG%', '3P%', 'FT%']
+        st.dataframe(display_df, use_container_width=True, hide_index=True)
+    
+    if career.get('GP', 0) == 0:
+        return
+    
+    st.markdown("#### 🏆 キャリアハイ / Career Highs")
+    highs = [
+        ("PTS", 'PTS_HIGH', "Points"),
+        ("REB", 'TOT_HIGH', "Rebounds"),
+        ("AST", 'AST_HIGH', "Assists"),
+        ("STL", 'STL_HIGH', "Steals"),
+        ("BLK", 'BLK_HIGH', "Blocks"),
+        ("3PM", '3PM_HIGH', "3-Pointers")
+    ]
+    cols = st.columns(len(highs))
+    for col, (label, key, label_en) in zip(cols, highs):
+        with col:
+            stat_card(label, f"{career.get(key, 0):.0f}", label_en, "primary")
+    
+    st.caption(
+        f"通算 {career['GP']}試合 / {career.get('Seasons', 0):.0f}シーズン・"
+        f"通算得点 {career.get('TOTAL_PTS', 0):.0f}"
+    )
+
+
+def render_player_splits(db, player_name, season=None):
+    """スプリット（先発/ベンチ・勝敗・試合形式など）別の平均を表示"""
+    section_header("スプリット / Splits")
+    
+    dimensions = db.get_split_dimensions()
+    if not dimensions:
+        return
+    
+    dimension = st.radio(
+        "スプリット",
+        dimensions,
+        format_func=lambda dim: SPLIT_DIMENSIONS[dim],
+        horizontal=True,
+        key='player_split_dimension'
+    )
+    
+    splits = db.get_splits(dimension, season, player_name)
+    if splits.empty:
+        st.caption("スプリットデータがありません")
+        return
+    
+    display_df = splits.round(1).reset_index()
+    display_df.columns = ['区分', '試合数', 'MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'TO', 'FG%', '3P%', 'FT%']
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+
+def render_streaks_and_milestones(db, player_name, season=None):
+    """連続記録とマイルストーンを表示"""
+    section_header("連続記録・マイルストーン / Streaks & Milestones")
+    
+    streaks = db.get_streaks(season)
+    milestones = db.get_milestones()
+    player_streaks = streaks[streaks['PlayerName'] == player_name] if not streaks.empty else streaks
+    player_milestones = milestones[milestones['PlayerName'] == player_name] if not milestones.empty else milestones
+    if season and not player_milestones.empty:
+        player_milestones = player_milestones[player_milestones['Season'] == season]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 🔥 連続記録 / Streaks")
+        if player_streaks.empty:
+            st.caption("2試合以上の連続記録はありません")
+        else:
+            # 項目ごとの最長記録
+            best = player_streaks.drop_duplicates('Streak').copy()
+            best['Active'] = best['Active'].map({True: '継続中', False: ''})
+            best = best[['Streak', 'Length', 'StartDate', 'EndDate', 'Active']]
+            best.columns = ['記録', '連続試合', '開始', '終了', '状態']
+            st.dataframe(best, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("#### 🏅 マイルストーン / Milestones")
+        if player_milestones.empty:
+            st.caption("マイルストーンはまだありません")
+        else:
+            display_df = player_milestones[['GameDate', 'Opponent', 'Label']].head(10)
+            display_df.columns = ['日付', '対戦相手', '記録']
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+
+def render_advanced_stats(advanced):
+    """アドバンスドスタッツを表示
+    
+    Args:
+        advanced: 選手のアドバンスドスタッツ（get_advanced_statsの1行）
+    """
+    section_header("アドバンスドスタッツ / Advanced Stats")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        stat_card("eFG%", f"{advanced['eFG%']:.1f}", "Effective FG", "primary")
+    
+    with col2:
+        stat_card("TS%", f"{advanced['TS%']:.1f}", "True Shooting")
+    
+    with col3:
+        stat_card("PTS/32", f"{advanced['PTS/32']:.1f}", "Per 32 Min", "secondary")
+    
+    with col4:
+        stat_card("AST/TO", f"{advanced['AST/TO']:.2f}", "Assist Ratio")
+    
+    with col5:
+        stat_card("USG%", f"{advanced['USG%']:.1f}", "Usage (est.)", "primary")
+    
+    st.caption(
+        f"出場時間 {advanced['MPG']:.1f}分/試合 ・ "
+        f"36分換算: {advanced['PTS/36']:.1f}点 / {advanced['REB/36']:.1f}リバウンド / {advanced['AST/36']:.1f}アシスト"
+    )
+
+
+def render_time_series_charts(db, player_data, player_name, stats, season=None):
+    """時系列推移チャートを表示（移動平均・直近N試合付き）"""
+    window = st.slider(
+        "移動平均・直近の試合数 / Moving Average Window",
+        min_value=2,
+        max_value=10,
+        value=5,
+        key='player_ma_window'
+    )
+    
+    # 直近N試合の成績（全選手分をキャッシュから参照）
+    last_n_stats = db.get_last_n_stats(window, season)
+    if player_name in last_n_stats.index:
+        render_last_n_split(last_n_stats.loc[player_name], stats, window)
+    
+    # 移動平均（元データと同じ行インデックスで結合）
+    def build_chart_data():
+        rolling = db.get_rolling_stats(window, season)
+        ma_cols = [col for col in rolling.columns if col.endswith('_MA')]
+        return player_data.join(rolling[ma_cols]) if ma_cols else player_data
+    
+    chart_data = db.page_cached('player_stats', build_chart_data, season=season, player=player_name, mode=('trend', window))
+    
     chart_col1, chart_col2 = st.columns(2)
     
     with chart_col1:
-        fig_pts = create_nba_chart(
-            player_data, 
-            '得点推移 / POINTS TREND', 
-            'GameDate', 
-            'PTS'
-        )
+        fig_pts = create_trend_chart(chart_data, 'PTS', '得点推移', 'POINTS TREND', window)
         st.plotly_chart(fig_pts, use_container_width=True)
     
     with chart_col2:
-        fig_reb = create_nba_chart(
-            player_data, 
-            'リバウンド推移 / REBOUNDS TREND', 
-            'GameDate', 
-            'TOT', 
-            color=NBA_COLORS['secondary']
-        )
+        fig_reb = create_trend_chart(chart_data, 'TOT', 'リバウンド推移', 'REBOUNDS TREND', window)
         st.plotly_chart(fig_reb, use_container_width=True)
     
     chart_col3, chart_col4 = st.columns(2)
     
     with chart_col3:
-        fig_ast = create_nba_chart(
-            player_data, 
-            'アシスト推移 / ASSISTS TREND', 
-            'GameDate', 
-            'AST',
-            color='#FDB927'
-        )
+        fig_ast = create_trend_chart(chart_data, 'AST', 'アシスト推移', 'ASSISTS TREND', window)
         st.plotly_chart(fig_ast, use_container_width=True)
     
     with chart_col4:
         if 'STL' in player_data.columns:
-            fig_stl = create_nba_chart(
-                player_data, 
-                'スティール推移 / STEALS TREND', 
-                'GameDate', 
-                'STL',
-                color='#552583'
-            )
+            fig_stl = create_trend_chart(chart_data, 'STL', 'スティール推移', 'STEALS TREND', window)
             st.plotly_chart(fig_stl, use_container_width=True)
+    
+    # 移動シュート率
+    if 'FG%_MA' in chart_data.columns:
+        shooting_data = [
+            chart_data[['GameDate', f'{label}_MA']].rename(columns={f'{label}_MA': 'Pct'})
+            for label in ['FG%', '3P%', 'FT%']
+        ]
+        fig_shooting = create_comparison_chart(
+            shooting_data,
+            ['FG%', '3P%', 'FT%'],
+            'GameDate',
+            'Pct',
+            title=f'移動シュート率（{window}試合）',
+            title_jp=f'Rolling Shooting % ({window}-Game Window)'
+        )
+        st.plotly_chart(fig_shooting, use_container_width=True)
+
+
+def create_trend_chart(chart_data, stat, title, title_en, window):
+    """試合ごとの値と移動平均を重ねたチャートを作成"""
+    ma_col = f'{stat}_MA'
+    if ma_col not in chart_data.columns:
+        return create_nba_chart(chart_data, f'{title} / {title_en}', 'GameDate', stat)
+    
+    per_game = chart_data[['GameDate', stat]]
+    moving_avg = chart_data[['GameDate', ma_col]].rename(columns={ma_col: stat})
+    
+    return create_comparison_chart(
+        [per_game, moving_avg],
+        ['試合ごと / Per Game', f'{window}試合移動平均 / {window}-Game Avg'],
+        'GameDate',
+        stat,
+        title=title,
+        title_jp=title_en
+    )
+
+
+def render_last_n_split(last_n, stats, window):
+    """直近N試合の成績をシーズン平均との差分付きで表示"""
+    st.markdown(f"#### 直近{int(last_n['GP'])}試合 / Last {int(last_n['GP'])} Games")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    splits = [
+        (col1, "PPG", last_n['PPG'], stats.get('PTS', 0)),
+        (col2, "RPG", last_n['RPG'], stats.get('REB', 0)),
+        (col3, "APG", last_n['APG'], stats.get('AST', 0)),
+        (col4, "FG%", last_n['FG%'], stats.get('FG%', 0)),
+        (col5, "3P%", last_n['3P%'], stats.get('3P%', 0)),
+    ]
+    
+    for col, label, recent, overall in splits:
+        with col:
+            st.metric(label, f"{recent:.1f}", delta=f"{recent - overall:+.1f}")
+    
+    st.caption(f"※ 差分は選択期間の平均との比較 / Delta vs. selected-period average (window: {window})")
 
 
 def render_category_comparison(stats, player_name):
@@ -268,22 +523,10 @@ def render_category_comparison(stats, player_name):
     st.plotly_chart(fig2, use_container_width=True)
 
 
-def render_radar_chart_analysis(stats, player_name):
-    """レーダーチャート分析を表示"""
-    categories = ['得点', 'リバウンド', 'アシスト', 'スティール', 'ブロック']
-    
-    # 正規化（0-100スケール）
-    max_vals = {
-        'PTS': 30, 'REB': 15, 'AST': 10, 'STL': 3, 'BLK': 3
-    }
-    
-    values = [
-        min(stats.get('PTS', 0) / max_vals['PTS'] * 100, 100),
-        min(stats.get('REB', 0) / max_vals['REB'] * 100, 100),
-        min(stats.get('AST', 0) / max_vals['AST'] * 100, 100),
-        min(stats.get('STL', 0) / max_vals['STL'] * 100, 100),
-        min(stats.get('BLK', 0) / max_vals['BLK'] * 100, 100)
-    ]
+def render_radar_chart_analysis(db, stats, player_name, season=None):
+    """レーダーチャート分析を表示（チーム内パーセンタイル）"""
+    categories = list(RADAR_STATS.values())
+    values = db.get_player_percentiles(player_name, list(RADAR_STATS), season)
     
     fig = create_radar_chart(
         categories,
@@ -293,6 +536,7 @@ def render_radar_chart_analysis(stats, player_name):
         "Overall Performance Analysis"
     )
     st.plotly_chart(fig, use_container_width=True)
+    st.caption("各項目はチーム内パーセンタイル（0=最下位、100=最上位）/ Team percentile per category")
     
     # 能力評価コメント
     st.markdown("### 📊 能力評価")
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
+from components import fragment
+
 # データファイルのパス
 SCHEDULE_FILE = Path(__file__).parent.parent.parent / "data" / "schedule.json"
 ATTENDANCE_FILE = Path(__file__).parent.parent.parent / "data" / "attendance.json"
@@ -213,168 +215,10 @@ def render(db):
     tab1, tab2, tab3 = st.tabs(["📋 予定一覧・出欠登録", "📊 カレンダー表示", "👥 出欠状況一覧"])
     
     with tab1:
-        # 予定を日付順にソート（未来の予定を優先）
-        sorted_schedules = sorted(schedules, key=lambda x: x["date"])
-        
-        # フィルター
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            filter_type = st.selectbox("種類で絞り込み", 
-                                      ["全て", "練習試合", "公式戦", "練習"],
-                                      key="schedule_filter_type")
-        
-        with col2:
-            filter_status = st.selectbox("ステータスで絞り込み",
-                                        ["全て", "予定", "完了"],
-                                        key="schedule_filter_status")
-        
-        # フィルタリング
-        filtered_schedules = sorted_schedules
-        
-        if filter_type != "全て":
-            type_map = {"練習試合": "practice", "公式戦": "tournament", "練習": "training"}
-            filtered_schedules = [s for s in filtered_schedules if s["type"] == type_map[filter_type]]
-        
-        if filter_status != "全て":
-            today = datetime.now().date()
-            if filter_status == "予定":
-                filtered_schedules = [s for s in filtered_schedules if datetime.strptime(s["date"], "%Y-%m-%d").date() >= today]
-            else:
-                filtered_schedules = [s for s in filtered_schedules if datetime.strptime(s["date"], "%Y-%m-%d").date() < today]
-        
-        st.markdown(f"### 表示中: {len(filtered_schedules)} 件")
-        
-        # 予定カードを表示
-        if filtered_schedules:
-            for schedule in filtered_schedules:
-                schedule_date = datetime.strptime(schedule["date"], "%Y-%m-%d").date()
-                is_upcoming = schedule_date >= datetime.now().date()
-                schedule_id = str(schedule['id'])
-                
-                # 種類の表示名
-                type_names = {"practice": "練習試合", "tournament": "公式戦", "training": "練習"}
-                type_name = type_names.get(schedule["type"], schedule["type"])
-                
-                # カードのHTML
-                status_class = "status-upcoming" if is_upcoming else "status-completed"
-                status_text = "予定" if is_upcoming else "完了"
-                type_class = f"schedule-type-{schedule['type']}"
-                
-                st.markdown(f"""
-                <div class="schedule-card">
-                    <div class="schedule-date">📅 {schedule['date']} ({schedule.get('time', '未定')})</div>
-                    <div class="schedule-event">{schedule['event']}</div>
-                    <div class="schedule-details">
-                        📍 {schedule['location']} | 
-                        <span class="{type_class}">{type_name}</span> | 
-                        <span class="{status_class}">{status_text}</span>
-                    </div>
-                    {f'<div class="schedule-details" style="margin-top: 8px;">📝 {schedule.get("notes", "")}</div>' if schedule.get("notes") else ''}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # 出欠登録フォーム（予定の場合のみ）
-                if is_upcoming:
-                    with st.expander("✍️ 出欠を登録する", expanded=False):
-                        col1, col2, col3 = st.columns([2, 2, 1])
-                        
-                        with col1:
-                            member_name = st.selectbox(
-                                "名前を選択",
-                                options=[""] + TEAM_MEMBERS,
-                                key=f"member_select_{schedule_id}"
-                            )
-                        
-                        with col2:
-                            attendance_status = st.selectbox(
-                                "出欠を選択",
-                                options=["出席", "欠席", "未定"],
-                                key=f"status_select_{schedule_id}"
-                            )
-                        
-                        with col3:
-                            st.write("")
-                            st.write("")
-                            if st.button("登録", key=f"submit_{schedule_id}", type="primary", use_container_width=True):
-                                if member_name:
-                                    if schedule_id not in attendance_records:
-                                        attendance_records[schedule_id] = {}
-                                    
-                                    attendance_records[schedule_id][member_name] = attendance_status
-                                    attendance_data["attendance"] = attendance_records
-                                    
-                                    if save_attendance_data(attendance_data):
-                                        st.success(f"✅ {member_name}さんの出欠を登録しました")
-                                        st.rerun()
-                                    else:
-                                        st.error("❌ 出欠の保存に失敗しました")
-                                else:
-                                    st.warning("⚠️ 名前を選択してください")
-                
-                # 出欠状況サマリー
-                if schedule_id in attendance_records and attendance_records[schedule_id]:
-                    responses = attendance_records[schedule_id]
-                    present = sum(1 for status in responses.values() if status == "出席")
-                    absent = sum(1 for status in responses.values() if status == "欠席")
-                    maybe = sum(1 for status in responses.values() if status == "未定")
-                    
-                    absent_members = [name for name, status in responses.items() if status == "欠席"]
-                    maybe_members = [name for name, status in responses.items() if status == "未定"]
-                    
-                    st.markdown(f"""
-                    <div class="attendance-summary">
-                        <strong>📊 出欠状況:</strong> 
-                        <span class="attendance-present">出席 {present}名</span> | 
-                        <span class="attendance-absent">欠席 {absent}名</span> | 
-                        <span class="attendance-maybe">未定 {maybe}名</span>
-                        <br>
-                        {f'<span class="attendance-absent">⚠️ 欠席: {", ".join(absent_members)}</span><br>' if absent_members else ''}
-                        {f'<span class="attendance-maybe">❓ 未定: {", ".join(maybe_members)}</span>' if maybe_members else ''}
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("---")
-        else:
-            st.info("📭 表示する予定がありません")
+        render_schedule_list(schedules, attendance_data)
     
     with tab2:
-        st.markdown("### 📆 月間カレンダー")
-        
-        # 月選択
-        selected_month = st.date_input("表示する月", value=datetime.now().date(), key="calendar_month")
-        
-        # その月の予定を抽出
-        month_schedules = [s for s in schedules 
-                          if datetime.strptime(s["date"], "%Y-%m-%d").month == selected_month.month
-                          and datetime.strptime(s["date"], "%Y-%m-%d").year == selected_month.year]
-        
-        if month_schedules:
-            # カレンダー表示用のデータフレーム作成
-            calendar_data = []
-            for schedule in sorted(month_schedules, key=lambda x: x["date"]):
-                type_names = {"practice": "練習試合", "tournament": "公式戦", "training": "練習"}
-                schedule_id = str(schedule['id'])
-                
-                # 出欠状況を集計
-                absent_count = 0
-                if schedule_id in attendance_records:
-                    responses = attendance_records[schedule_id]
-                    absent_count = sum(1 for status in responses.values() if status == "欠席")
-                
-                calendar_data.append({
-                    "日付": schedule["date"],
-                    "時刻": schedule.get("time", "未定"),
-                    "イベント": schedule["event"],
-                    "種類": type_names.get(schedule["type"], schedule["type"]),
-                    "場所": schedule["location"],
-                    "欠席者数": absent_count
-                })
-            
-            df = pd.DataFrame(calendar_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info(f"📭 {selected_month.year}年{selected_month.month}月の予定はありません")
+        render_month_calendar(schedules, attendance_records)
     
     with tab3:
         st.markdown("### 👥 全体出欠状況")
@@ -407,3 +251,175 @@ def render(db):
             st.dataframe(df_stats, use_container_width=True, hide_index=True)
         else:
             st.info("📭 まだ出欠登録がありません")
+
+
+@fragment
+def render_schedule_list(schedules, attendance_data):
+    """予定一覧・出欠登録を表示（フィルター操作ではこのセクションだけを再実行）"""
+    attendance_records = attendance_data.get("attendance", {})
+    
+    # 予定を日付順にソート（未来の予定を優先）
+    sorted_schedules = sorted(schedules, key=lambda x: x["date"])
+    
+    # フィルター
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        filter_type = st.selectbox("種類で絞り込み", 
+                                  ["全て", "練習試合", "公式戦", "練習"],
+                                  key="schedule_filter_type")
+    
+    with col2:
+        filter_status = st.selectbox("ステータスで絞り込み",
+                                    ["全て", "予定", "完了"],
+                                    key="schedule_filter_status")
+    
+    # フィルタリング
+    filtered_schedules = sorted_schedules
+    
+    if filter_type != "全て":
+        type_map = {"練習試合": "practice", "公式戦": "tournament", "練習": "training"}
+        filtered_schedules = [s for s in filtered_schedules if s["type"] == type_map[filter_type]]
+    
+    if filter_status != "全て":
+        today = datetime.now().date()
+        if filter_status == "予定":
+            filtered_schedules = [s for s in filtered_schedules if datetime.strptime(s["date"], "%Y-%m-%d").date() >= today]
+        else:
+            filtered_schedules = [s for s in filtered_schedules if datetime.strptime(s["date"], "%Y-%m-%d").date() < today]
+    
+    st.markdown(f"### 表示中: {len(filtered_schedules)} 件")
+    
+    # 予定カードを表示
+    if filtered_schedules:
+        for schedule in filtered_schedules:
+            schedule_date = datetime.strptime(schedule["date"], "%Y-%m-%d").date()
+            is_upcoming = schedule_date >= datetime.now().date()
+            schedule_id = str(schedule['id'])
+            
+            # 種類の表示名
+            type_names = {"practice": "練習試合", "tournament": "公式戦", "training": "練習"}
+            type_name = type_names.get(schedule["type"], schedule["type"])
+            
+            # カードのHTML
+            status_class = "status-upcoming" if is_upcoming else "status-completed"
+            status_text = "予定" if is_upcoming else "完了"
+            type_class = f"schedule-type-{schedule['type']}"
+            
+            st.markdown(f"""
+            <div class="schedule-card">
+                <div class="schedule-date">📅 {schedule['date']} ({schedule.get('time', '未定')})</div>
+                <div class="schedule-event">{schedule['event']}</div>
+                <div class="schedule-details">
+                    📍 {schedule['location']} | 
+                    <span class="{type_class}">{type_name}</span> | 
+                    <span class="{status_class}">{status_text}</span>
+                </div>
+                {f'<div class="schedule-details" style="margin-top: 8px;">📝 {schedule.get("notes", "")}</div>' if schedule.get("notes") else ''}
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # 出欠登録フォーム（予定の場合のみ）
+            if is_upcoming:
+                with st.expander("✍️ 出欠を登録する", expanded=False):
+                    col1, col2, col3 = st.columns([2, 2, 1])
+                    
+                    with col1:
+                        member_name = st.selectbox(
+                            "名前を選択",
+                            options=[""] + TEAM_MEMBERS,
+                            key=f"member_select_{schedule_id}"
+                        )
+                    
+                    with col2:
+                        attendance_status = st.selectbox(
+                            "出欠を選択",
+                            options=["出席", "欠席", "未定"],
+                            key=f"status_select_{schedule_id}"
+                        )
+                    
+                    with col3:
+                        st.write("")
+                        st.write("")
+                        if st.button("登録", key=f"submit_{schedule_id}", type="primary", use_container_width=True):
+                            if member_name:
+                                if schedule_id not in attendance_records:
+                                    attendance_records[schedule_id] = {}
+                                
+                                attendance_records[schedule_id][member_name] = attendance_status
+                                attendance_data["attendance"] = attendance_records
+                                
+                                if save_attendance_data(attendance_data):
+                                    st.success(f"✅ {member_name}さんの出欠を登録しました")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ 出欠の保存に失敗しました")
+                            else:
+                                st.warning("⚠️ 名前を選択してください")
+            
+            # 出欠状況サマリー
+            if schedule_id in attendance_records and attendance_records[schedule_id]:
+                responses = attendance_records[schedule_id]
+                present = sum(1 for status in responses.values() if status == "出席")
+                absent = sum(1 for status in responses.values() if status == "欠席")
+                maybe = sum(1 for status in responses.values() if status == "未定")
+                
+                absent_members = [name for name, status in responses.items() if status == "欠席"]
+                maybe_members = [name for name, status in responses.items() if status == "未定"]
+                
+                st.markdown(f"""
+                <div class="attendance-summary">
+                    <strong>📊 出欠状況:</strong> 
+                    <span class="attendance-present">出席 {present}名</span> | 
+                    <span class="attendance-absent">欠席 {absent}名</span> | 
+                    <span class="attendance-maybe">未定 {maybe}名</span>
+                    <br>
+                    {f'<span class="attendance-absent">⚠️ 欠席: {", ".join(absent_members)}</span><br>' if absent_members else ''}
+                    {f'<span class="attendance-maybe">❓ 未定: {", ".join(maybe_members)}</span>' if maybe_members else ''}
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown("---")
+    else:
+        st.info("📭 表示する予定がありません")
+
+
+@fragment
+def render_month_calendar(schedules, attendance_records):
+    """月間カレンダーを表示（月の選択ではこのセクションだけを再実行）"""
+    st.markdown("### 📆 月間カレンダー")
+    
+    # 月選択
+    selected_month = st.date_input("表示する月", value=datetime.now().date(), key="calendar_month")
+    
+    # その月の予定を抽出
+    month_schedules = [s for s in schedules 
+                      if datetime.strptime(s["date"], "%Y-%m-%d").month == selected_month.month
+                      and datetime.strptime(s["date"], "%Y-%m-%d").year == selected_month.year]
+    
+    if month_schedules:
+        # カレンダー表示用のデータフレーム作成
+        calendar_data = []
+        for schedule in sorted(month_schedules, key=lambda x: x["date"]):
+            type_names = {"practice": "練習試合", "tournament": "公式戦", "training": "練習"}
+            schedule_id = str(schedule['id'])
+            
+            # 出欠状況を集計
+            absent_count = 0
+            if schedule_id in attendance_records:
+                responses = attendance_records[schedule_id]
+                absent_count = sum(1 for status in responses.values() if status == "欠席")
+            
+            calendar_data.append({
+                "日付": schedule["date"],
+                "時刻": schedule.get("time", "未定"),
+                "イベント": schedule["event"],
+                "種類": type_names.get(schedule["type"], schedule["type"]),
+                "場所": schedule["location"],
+                "欠席者数": absent_count
+            })
+        
+        df = pd.DataFrame(calendar_data)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+    else:
+        st.info(f"📭 {selected_month.year}年{selected_month.month}月の予定はありません")
@@ -9,10 +9,21 @@ if str(Path(__file__).parent.parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import StatsDatabase
-from stats import calculate_season_overview, get_leaders
+from stats import calculate_season_overview, add_shooting_intervals, SPLIT_DIMENSIONS
 from charts import create_nba_chart, create_bar_chart, create_pie_chart
-from components import stat_card, section_header, ranking_row
-from config import NBA_COLORS, PLAYER_IMAGES_DIR
+from components import stat_card, section_header, ranking_table, fragment
+from config import NBA_COLORS, PLAYER_IMAGES_DIR, PERFORMANCE_SETTINGS
+
+# 全選手ランキングのカテゴリ（表示ラベル → (カラム, 表示名)）
+RANKING_CATEGORIES = {
+    "🏀 得点 PPG": ('PPG', '平均得点'),
+    "📦 リバウンド RPG": ('RPG', '平均リバウンド'),
+    "🎯 アシスト APG": ('APG', '平均アシスト'),
+    "🖐️ スティール SPG": ('SPG', '平均スティール'),
+    "🚫 ブロック BPG": ('BPG', '平均ブロック'),
+    "🎲 シュート効率": ('shooting', 'シュート効率'),
+    "📐 アドバンスド": ('advanced', 'アドバンスド'),
+}
 
 
 def render(db: StatsDatabase):
@@ -85,8 +96,14 @@ def render(db: StatsDatabase):
     # ===== セクション1: シーズンサマリー =====
     section_header("🏆 シーズンサマリー / Season Summary")
     
-    overview = calculate_season_overview(season_data)
-    win_rate = (overview['wins'] / overview['games'] * 100) if overview['games'] > 0 else 0
+    season_games = db.get_game_table(selected_season)
+    overview = db.page_cached(
+        'season_stats',
+        lambda: calculate_season_overview(season_data, season_games),
+        season=selected_season,
+        mode='overview'
+    )
+    win_rate = overview['win_pct']
     
     # メインサマリーカード
     col1, col2, col3, col4 = st.columns(4)
@@ -119,22 +136,19 @@ def render(db: StatsDatabase):
     # ===== セクション2: チームパフォーマンス =====
     section_header("📈 チームパフォーマンス / Team Performance")
     
-    # ゲームごとの統計を集計
-    game_stats = season_data.groupby('GameDate').agg({
-        'PTS': 'sum',
-        'TOT': 'sum',
-        'AST': 'sum',
-        'STL': 'sum',
-        'BLK': 'sum',
-        'GameDate': 'first'
-    }).reset_index(drop=True)
+    # ゲームごとの統計（試合サマリーから取得）
+    game_stats = db.page_cached(
+        'season_stats',
+        lambda: season_games[['GameDate', 'PTS', 'TOT', 'AST', 'STL', 'BLK']].assign(
+            GameNumber=range(1, len(season_games) + 1)
+        ),
+        season=selected_season,
+        mode='performance'
+    )
     
     if game_stats.empty:
         st.info("パフォーマンスデータがありません / No performance data available")
     else:
-        game_stats = game_stats.sort_values('GameDate')
-        game_stats['GameNumber'] = range(1, len(game_stats) + 1)
-        
         # メイングラフ(2つ)
         chart_col1, chart_col2 = st.columns(2)
         
@@ -185,19 +199,27 @@ def render(db: StatsDatabase):
     ])
     
     with leader_tab1:
-        render_leader_section(season_data, 'PTS', 'PPG', 'Points Per Game', 'primary')
+        render_leader_section(db, selected_season, 'PTS', 'PPG', 'Points Per Game', 'primary')
     
     with leader_tab2:
-        render_leader_section(season_data, 'TOT', 'RPG', 'Rebounds Per Game', 'secondary')
+        render_leader_section(db, selected_season, 'TOT', 'RPG', 'Rebounds Per Game', 'secondary')
     
     with leader_tab3:
-        render_leader_section(season_data, 'AST', 'APG', 'Assists Per Game', 'primary')
+        render_leader_section(db, selected_season, 'AST', 'APG', 'Assists Per Game', 'primary')
     
     with leader_tab4:
-        render_leader_section(season_data, 'STL', 'SPG', 'Steals Per Game', 'secondary')
+        render_leader_section(db, selected_season, 'STL', 'SPG', 'Steals Per Game', 'secondary')
     
     with leader_tab5:
-        render_leader_section(season_data, 'BLK', 'BPG', 'Blocks Per Game', 'primary')
+        render_leader_section(db, selected_season, 'BLK', 'BPG', 'Blocks Per Game', 'primary')
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # ===== チームスプリット =====
+    render_team_splits(db, selected_season)
+    
+    # ===== 連続記録・マイルストーン =====
+    render_season_streaks(db, selected_season)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -212,13 +234,76 @@ def render(db: StatsDatabase):
     # 全ランキング表示
     if st.session_state.get('show_full_rankings', False):
         st.markdown("---")
-        render_full_rankings(season_data)
+        render_full_rankings(db, selected_season)
         st.markdown("---")
 
 
-def render_leader_section(season_data, stat_col, avg_label, stat_name, color):
+def render_team_splits(db, selected_season):
+    """チームのスプリット（先発/ベンチ・勝敗・試合形式など）別の1試合平均を表示"""
+    section_header("📊 チームスプリット / Team Splits")
+    
+    dimensions = db.get_split_dimensions()
+    if not dimensions:
+        return
+    
+    dimension = st.radio(
+        "スプリット",
+        dimensions,
+        format_func=lambda dim: SPLIT_DIMENSIONS[dim],
+        horizontal=True,
+        key='team_split_dimension'
+    )
+    
+    splits = db.get_splits(dimension, selected_season)
+    if splits.empty:
+        st.caption("スプリットデータがありません")
+        return
+    
+    display_df = splits.drop(columns='MPG').round(1).reset_index()
+    display_df.columns = ['区分', '試合数', '得点', 'リバウンド', 'アシスト', 'スティール', 'ブロック', 'TO', 'FG%', '3P%', 'FT%']
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    if dimension == 'Role':
+        st.caption("先発・ベンチは各グループの1試合あたり合計 / Per-game totals for each group")
+
+
+def render_season_streaks(db, selected_season):
+    """シーズンの連続記録とマイルストーンを表示"""
+    section_header("🔥 連続記録・マイルストーン / Streaks & Milestones")
+    
+    streaks = db.get_streaks(selected_season)
+    milestones = db.get_milestones()
+    if not milestones.empty:
+        milestones = milestones[milestones['Season'] == selected_season]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 最長連続記録 / Longest Streaks")
+        if streaks.empty:
+            st.caption("連続記録はありません")
+        else:
+            top = streaks.head(10).copy()
+            top['Active'] = top['Active'].map({True: '継続中', False: ''})
+            top = top[['PlayerName', 'Streak', 'Length', 'Active']]
+            top.columns = ['選手名', '記録', '連続試合', '状態']
+            st.dataframe(top, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("#### 最近のマイルストーン / Recent Milestones")
+        if milestones.empty:
+            st.caption("このシーズンのマイルストーンはありません")
+        else:
+            recent = milestones[['GameDate', 'PlayerName', 'Label']].head(10)
+            recent.columns = ['日付', '選手名', '記録']
+            st.dataframe(recent, use_container_width=True, hide_index=True)
+
+
+def render_leader_section(db, selected_season, stat_col, avg_label, stat_name, color):
     """リーダーセクションをレンダリング(名前表示修正版)"""
-    leaders = get_leaders(season_data, stat_col, n=5)
+    leaders = (
+        db.query().where(Season=selected_season).group_by('PlayerName')
+        .metrics(stat_col, avg_label, 'GP').sort(avg_label).limit(5).run()
+    )
     
     if leaders.empty:
         st.info(f"{stat_name}のデータがありません / No {stat_name} data available")
@@ -234,20 +319,9 @@ def render_leader_section(season_data, stat_col, avg_label, stat_name, color):
     if len(column_names) >= 4:
         leaders.columns = ['選手名 / Player', 'Total', avg_label, 'GP']
     
-    # TOP 5選手を表示
-    for idx, row in leaders.head(5).iterrows():
-        player_name = row['選手名 / Player']
-        avg_val = row[avg_label]
-        gp = row['GP']
-        
-        # ランキング行を表示
-        ranking_row(
-            rank=idx + 1,
-            player=player_name,
-            stat_value=f"{avg_val:.1f}",
-            stat_label=avg_label,
-            color=color
-        )
+    # TOP 5選手を1ブロックで表示
+    top = leaders.head(5)
+    ranking_table(top['選手名 / Player'], top[avg_label], avg_label, color=color)
 
 
 def render_detailed_season_stats(season_data, overview):
@@ -274,6 +348,18 @@ def render_detailed_season_stats(season_data, overview):
         stat_card("総アシスト", int(season_data['AST'].sum()), card_type="primary", label_jp="Total Assists")
         stat_card("総スティール", int(season_data['STL'].sum()), card_type="secondary", label_jp="Total Steals")
         stat_card("総ブロック", int(season_data['BLK'].sum()), card_type="primary", label_jp="Total Blocks")
+    
+    # ペース・レーティング（試合サマリーのポゼッション推定から）
+    col4, col5, col6 = st.columns(3)
+    
+    with col4:
+        stat_card("平均ペース", f"{overview['avg_pace']:.1f}", card_type="secondary", label_jp="Pace")
+    
+    with col5:
+        stat_card("オフェンスレーティング", f"{overview['ortg']:.1f}", card_type="primary", label_jp="ORtg")
+    
+    with col6:
+        stat_card("ディフェンスレーティング", f"{overview['drtg']:.1f}", card_type="secondary", label_jp="DRtg")
 
 
 def render_detailed_performance_charts(game_stats):
@@ -373,79 +459,50 @@ def render_detailed_performance_charts(game_stats):
         st.plotly_chart(fig_perf, use_container_width=True)
 
 
-def render_full_rankings(season_data):
+@fragment
+def render_full_rankings(db, selected_season):
     """全選手の詳細ランキングを表示(改善版)"""
     st.markdown("### 🏅 全選手統計ランキング / Full Player Rankings")
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # 選手ごとの平均スタッツを計算
-    player_stats = season_data.groupby('PlayerName').agg({
-        'PTS': 'sum',
-        'TOT': 'sum',
-        'AST': 'sum',
-        'STL': 'sum',
-        'BLK': 'sum',
-        'GameDate': 'count',  # 試合数
-        '2PM': 'sum',
-        '2PA': 'sum',
-        '3PM': 'sum',
-        '3PA': 'sum',
-        'FTM': 'sum',
-        'FTA': 'sum'
-    }).rename(columns={'GameDate': 'GP'})
+    # 選手ごとの合計・平均・成功率を1回の集計で取得
+    player_stats = db.page_cached(
+        'season_stats',
+        lambda: (
+            db.query().where(Season=selected_season).group_by('PlayerName')
+            .metrics('PTS', 'TOT', 'AST', 'STL', 'BLK', 'GP', '2PM', '2PA', '3PM', '3PA', 'FTM', 'FTA',
+                     'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'FG%', '3P%', 'FT%')
+            .run().round(1)
+        ),
+        season=selected_season,
+        mode='rankings'
+    )
     
     if player_stats.empty:
         st.info("ランキングデータがありません / No ranking data available")
         return
     
-    # すべてのカラムを数値型に変換
-    numeric_columns = ['PTS', 'TOT', 'AST', 'STL', 'BLK', 'GP', '2PM', '2PA', '3PM', '3PA', 'FTM', 'FTA']
-    for col in numeric_columns:
-        player_stats[col] = pd.to_numeric(player_stats[col], errors='coerce').fillna(0)
-    
-    # 平均スタッツを計算
-    player_stats['PPG'] = (player_stats['PTS'] / player_stats['GP'].replace(0, 1)).round(1)
-    player_stats['RPG'] = (player_stats['TOT'] / player_stats['GP'].replace(0, 1)).round(1)
-    player_stats['APG'] = (player_stats['AST'] / player_stats['GP'].replace(0, 1)).round(1)
-    player_stats['SPG'] = (player_stats['STL'] / player_stats['GP'].replace(0, 1)).round(1)
-    player_stats['BPG'] = (player_stats['BLK'] / player_stats['GP'].replace(0, 1)).round(1)
-    
-    # シュート率を計算
-    player_stats['FG%'] = ((player_stats['2PM'] + player_stats['3PM']) / 
-                           (player_stats['2PA'] + player_stats['3PA']).replace(0, 1) * 100).round(1)
-    player_stats['3P%'] = (player_stats['3PM'] / player_stats['3PA'].replace(0, 1) * 100).round(1)
-    player_stats['FT%'] = (player_stats['FTM'] / player_stats['FTA'].replace(0, 1) * 100).round(1)
-    
-    # NaN を 0 に置換
-    player_stats = player_stats.fillna(0)
-    
-    # タブで各カテゴリのランキングを表示
-    rank_tab1, rank_tab2, rank_tab3, rank_tab4, rank_tab5, rank_tab6 = st.tabs([
-        "🏀 得点 PPG", 
-        "📦 リバウンド RPG", 
-        "🎯 アシスト APG", 
-        "🖐️ スティール SPG", 
-        "🚫 ブロック BPG",
-        "🎲 シュート効率"
-    ])
-    
-    with rank_tab1:
-        display_ranking_table(player_stats.sort_values('PPG', ascending=False), 'PPG', '平均得点', show_games=True)
-    
-    with rank_tab2:
-        display_ranking_table(player_stats.sort_values('RPG', ascending=False), 'RPG', '平均リバウンド', show_games=True)
-    
-    with rank_tab3:
-        display_ranking_table(player_stats.sort_values('APG', ascending=False), 'APG', '平均アシスト', show_games=True)
-    
-    with rank_tab4:
-        display_ranking_table(player_stats.sort_values('SPG', ascending=False), 'SPG', '平均スティール', show_games=True)
-    
-    with rank_tab5:
-        display_ranking_table(player_stats.sort_values('BPG', ascending=False), 'BPG', '平均ブロック', show_games=True)
+    # 選択中のカテゴリだけを集計・表示（他のカテゴリは選択時に計算してキャッシュ）
+    category = st.radio(
+        "ランキングカテゴリ / Category",
+        list(RANKING_CATEGORIES),
+        horizontal=True,
+        key='ranking_category'
+    )
+    stat_col, stat_name = RANKING_CATEGORIES[category]
     
-    with rank_tab6:
-        display_shooting_rankings(player_stats)
+    if stat_col == 'shooting':
+        display_shooting_rankings(db, selected_season, player_stats)
+    elif stat_col == 'advanced':
+        display_advanced_rankings(db.get_advanced_stats(selected_season))
+    else:
+        ranked = db.page_cached(
+            'season_stats',
+            lambda: player_stats.sort_values(stat_col, ascending=False),
+            season=selected_season,
+            mode=('ranking', stat_col)
+        )
+        display_ranking_table(ranked, stat_col, stat_name, show_games=True)
 
 
 def display_ranking_table(stats_df, stat_col, stat_name, show_games=True):
@@ -467,16 +524,18 @@ def display_ranking_table(stats_df, stat_col, stat_name, show_games=True):
     display_df['選手名 / Player'] = display_df['選手名 / Player'].fillna('Unknown Player')
     display_df['選手名 / Player'] = display_df['選手名 / Player'].astype(str)
     
-    display_df.insert(0, '順位 / Rank', range(1, len(display_df) + 1))
+    # 順位（トップ3はメダル付き）
+    medals = {1: '🥇 1', 2: '🥈 2', 3: '🥉 3'}
+    display_df.insert(0, '順位 / Rank', [medals.get(rank, str(rank)) for rank in range(1, len(display_df) + 1)])
     
-    # スタイリング付きでデータフレームを表示
+    # 1つのデータフレームとして表示（行ごとのHTML出力は行わない）
     st.dataframe(
         display_df,
         use_container_width=True,
         hide_index=True,
         height=500,
         column_config={
-            '順位 / Rank': st.column_config.NumberColumn(
+            '順位 / Rank': st.column_config.TextColumn(
                 '順位 / Rank',
                 width='small'
             ),
@@ -488,52 +547,99 @@ def display_ranking_table(stats_df, stat_col, stat_name, show_games=True):
     )
 
 
-def display_shooting_rankings(player_stats):
-    """シュート効率ランキングを表示"""
+def display_shooting_rankings(db, selected_season, player_stats):
+    """シュート効率ランキングを表示（95%信頼区間付き）"""
     st.markdown("#### シュート効率ランキング / Shooting Efficiency Rankings")
     
     # 最低試投数のフィルタ(5試投以上)
     min_attempts = 5
     
-    col1, col2, col3 = st.columns(3)
+    option_col1, option_col2 = st.columns(2)
     
-    with col1:
-        st.markdown("##### FG% (総合シュート率)")
-        fg_qualified = player_stats[(player_stats['2PA'] + player_stats['3PA']) >= min_attempts].copy()
-        fg_qualified = fg_qualified.sort_values('FG%', ascending=False)
-        
-        if not fg_qualified.empty:
-            display_df = fg_qualified.reset_index()[['PlayerName', 'FG%']].copy()
-            display_df.columns = ['選手名', 'FG%']
-            display_df.insert(0, '順位', range(1, len(display_df) + 1))
-            st.dataframe(display_df, use_container_width=True, hide_index=True, height=300)
-        else:
-            st.info("データなし / No data")
+    with option_col1:
+        method = st.radio(
+            "信頼区間の算出方法 / Interval Method",
+            ['wilson', 'bootstrap'],
+            format_func=lambda m: {'wilson': 'Wilson区間', 'bootstrap': 'ブートストラップ'}[m],
+            horizontal=True,
+            key='shooting_ci_method'
+        )
     
-    with col2:
-        st.markdown("##### 3P% (3ポイント率)")
-        fg3_qualified = player_stats[player_stats['3PA'] >= min_attempts].copy()
-        fg3_qualified = fg3_qualified.sort_values('3P%', ascending=False)
-        
-        if not fg3_qualified.empty:
-            display_df = fg3_qualified.reset_index()[['PlayerName', '3P%']].copy()
-            display_df.columns = ['選手名', '3P%']
-            display_df.insert(0, '順位', range(1, len(display_df) + 1))
-            st.dataframe(display_df, use_container_width=True, hide_index=True, height=300)
-        else:
-            st.info("データなし / No data")
+    with option_col2:
+        sort_basis = st.radio(
+            "並び順 / Sort By",
+            ['lower', 'rate'],
+            format_func=lambda b: {'lower': '区間下限（試投数を考慮）', 'rate': '成功率'}[b],
+            horizontal=True,
+            key='shooting_sort_basis'
+        )
     
-    with col3:
-        st.markdown("##### FT% (フリースロー率)")
-        ft_qualified = player_stats[player_stats['FTA'] >= min_attempts].copy()
-        ft_qualified = ft_qualified.sort_values('FT%', ascending=False)
-        
-        if not ft_qualified.empty:
-            display_df = ft_qualified.reset_index()[['PlayerName', 'FT%']].copy()
-            display_df.columns = ['選手名', 'FT%']
-            display_df.insert(0, '順位', range(1, len(display_df) + 1))
-            st.dataframe(display_df, use_container_width=True, hide_index=True, height=300)
-        else:
-            st.info("データなし / No data")
+    # 区間の計算（特にブートストラップ）は方法ごとにキャッシュ
+    def build_intervals():
+        if method == 'bootstrap':
+            return add_shooting_intervals(
+                player_stats,
+                method='bootstrap',
+                n_samples=PERFORMANCE_SETTINGS['bootstrap_samples'],
+                seed=PERFORMANCE_SETTINGS['random_seed'],
+                chunk_size=PERFORMANCE_SETTINGS['chunk_size']
+            )
+        return add_shooting_intervals(player_stats)
+    
+    try:
+        player_stats = db.page_cached('season_stats', build_intervals, season=selected_season, mode=('shooting', method))
+    except Exception as e:
+        st.error(f"信頼区間の計算エラー / Interval error: {e}")
+        return
+    
+    shooting_columns = [
+        ("##### FG% (総合シュート率)", 'FG%', player_stats['2PA'] + player_stats['3PA']),
+        ("##### 3P% (3ポイント率)", '3P%', player_stats['3PA']),
+        ("##### FT% (フリースロー率)", 'FT%', player_stats['FTA'])
+    ]
+    
+    for col, (title, stat, attempts) in zip(st.columns(3), shooting_columns):
+        with col:
+            st.markdown(title)
+            sort_col = f'{stat}_LO' if sort_basis == 'lower' else stat
+            # 区間が計算できない行（欠損値）は並び順が定まらないため除外
+            qualified = player_stats[attempts >= min_attempts].dropna(subset=[stat, f'{stat}_LO', f'{stat}_HI'])
+            qualified = qualified.sort_values(sort_col, ascending=False)
+            
+            if not qualified.empty:
+                display_df = qualified.reset_index()[['PlayerName', stat]].copy()
+                display_df[stat] = display_df[stat].round(1)
+                display_df['95%区間'] = [
+                    f"{low:.0f}–{high:.0f}"
+                    for low, high in zip(qualified[f'{stat}_LO'], qualified[f'{stat}_HI'])
+                ]
+                display_df.columns = ['選手名', stat, '95%区間']
+                display_df.insert(0, '順位', range(1, len(display_df) + 1))
+                st.dataframe(display_df, use_container_width=True, hide_index=True, height=300)
+            else:
+                st.info("データなし / No data")
+    
+    st.caption(
+        f"※ 最低{min_attempts}試投以上の選手のみ表示 / Minimum {min_attempts} attempts required。"
+        "並び順の既定は95%区間の下限（試投数の少ない高確率が過大評価されない）、"
+        "従来の成功率順は「並び順」で選択できます / Default order: interval lower bound"
+    )
+
+
+def display_advanced_rankings(advanced_stats):
+    """アドバンスドスタッツランキングを表示"""
+    st.markdown("#### アドバンスドスタッツ / Advanced Stats")
+    
+    if advanced_stats is None or advanced_stats.empty:
+        st.info("データなし / No data")
+        return
+    
+    display_cols = ['GP', 'MPG', 'eFG%', 'TS%', 'PTS/32', 'REB/32', 'AST/32', 'AST/TO', 'USG%']
+    decimals = {col: 1 for col in display_cols}
+    decimals['AST/TO'] = 2
+    
+    display_df = advanced_stats[display_cols].sort_values('TS%', ascending=False).round(decimals).reset_index()
+    display_df = display_df.rename(columns={'PlayerName': '選手名 / Player'})
     
-    st.caption(f"※ 最低{min_attempts}試投以上の選手のみ表示 / Minimum {min_attempts} attempts required")
+    st.dataframe(display_df, use_container_width=True, hide_index=True, height=500)
+    st.caption("※ 32分換算は出場時間（MIN）が記録された試合のスタッツのみで計算 / USG%は試投・FT・TOから推定した使用率")
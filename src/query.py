@@ -0,0 +1,207 @@
+"""統計クエリビルダー - フィルタ・グループ化・集計を1回のpandas操作にまとめる"""
+import pandas as pd
+import numpy as np
+
+from stats import numeric_columns, parse_minutes, _ratio, AVERAGE_LABELS
+
+
+# 合計で集計するカラム
+SUM_METRICS = ['PTS', '3PM', '3PA', '2PM', '2PA', 'DK', 'FTM', 'FTA',
+               'OR', 'DR', 'TOT', 'AST', 'STL', 'BLK', 'TO', 'PF']
+
+# 平均（1試合あたり）の指標 {指標名: 合計カラム}
+AVERAGE_METRICS = {label: col for col, label in AVERAGE_LABELS.items()}
+
+# 成功率の指標 {指標名: (成功数の合計カラム, 試投数の合計カラム)}
+PERCENTAGE_METRICS = {
+    'FG%': (['2PM', '3PM'], ['2PA', '3PA']),
+    '3P%': (['3PM'], ['3PA']),
+    '2P%': (['2PM'], ['2PA']),
+    'FT%': (['FTM'], ['FTA']),
+}
+
+# 比較演算子
+OPERATORS = {
+    '==': lambda series, value: series == value,
+    '!=': lambda series, value: series != value,
+    '>': lambda series, value: series > value,
+    '>=': lambda series, value: series >= value,
+    '<': lambda series, value: series < value,
+    '<=': lambda series, value: series <= value,
+    'in': lambda series, value: series.isin(value),
+    'contains': lambda series, value: series.astype(str).str.contains(str(value), case=False, regex=False),
+}
+
+
+class StatsQuery:
+    """StatsDatabase上の宣言的なクエリ
+    
+    使用例:
+        db.query().where(Season='2024-25').group_by('PlayerName') \\
+            .metrics('GP', 'PPG', 'FG%').sort('PPG').limit(10).run()
+        db.query().filter('PlayerName', 'contains', '太郎').sort('GameDate').page(2, 10).run()
+    
+    フィルタ結果とクエリ結果はデータセットのバージョン単位で（件数を制限して）キャッシュされるため、
+    同じ条件のクエリは複数のページ・セクションで共有される。offset・limitはキャッシュ後に適用する。
+    """
+    
+    def __init__(self, db):
+        self._db = db
+        self._filters = []
+        self._group_keys = []
+        self._metrics = []
+        self._sort = None
+        self._limit = None
+        self._offset = 0
+    
+    # ===== ビルダー =====
+    
+    def where(self, **conditions) -> 'StatsQuery':
+        """等値条件を追加（Noneの条件は無視）"""
+        for col, value in conditions.items():
+            if value is not None:
+                self._filters.append((col, '==', value))
+        return self
+    
+    def filter(self, col: str, op: str, value) -> 'StatsQuery':
+        """比較条件を追加（op: ==, !=, >, >=, <, <=, in, contains）"""
+        if op not in OPERATORS:
+            raise ValueError(f"未対応の演算子です: {op}")
+        self._filters.append((col, op, tuple(value) if op == 'in' else value))
+        return self
+    
+    def group_by(self, *keys: str) -> 'StatsQuery':
+        """グループ化するカラムを指定"""
+        self._group_keys.extend(keys)
+        return self
+    
+    def metrics(self, *names: str) -> 'StatsQuery':
+        """集計する指標を指定（GP, MIN, MPG, 合計カラム, PPGなどの平均, FG%などの成功率）"""
+        self._metrics.extend(names)
+        return self
+    
+    def sort(self, col: str, ascending: bool = False) -> 'StatsQuery':
+        """並び順を指定"""
+        self._sort = (col, ascending)
+        return self
+    
+    def limit(self, n: int) -> 'StatsQuery':
+        """件数を制限"""
+        self._limit = n
+        return self
+    
+    def offset(self, n: int) -> 'StatsQuery':
+        """先頭から読み飛ばす件数を指定"""
+        self._offset = max(int(n), 0)
+        return self
+    
+    def page(self, number: int, size: int) -> 'StatsQuery':
+        """ページ単位で取得（number: 1始まりのページ番号、size: 1ページの件数）"""
+        return self.offset((max(int(number), 1) - 1) * size).limit(size)
+    
+    # ===== 実行 =====
+    
+    def _filter_key(self) -> tuple:
+        return tuple(sorted(self._filters, key=repr))
+    
+    def _signature(self) -> tuple:
+        return ('query', self._filter_key(), tuple(self._group_keys), tuple(self._metrics), self._sort)
+    
+    def rows(self) -> pd.DataFrame:
+        """フィルタ条件に合う行を取得（すべての条件を1つのマスクにまとめて1回で抽出）
+        
+        Returns:
+            抽出したデータフレーム（キャッシュを共有するため変更しないこと）
+        """
+        filters = self._filter_key()
+        if not filters:
+            return self._db.df
+        return self._db.query_cached(('query_rows', filters), lambda: self._apply_filters(self._db.df, filters))
+    
+    def count(self) -> int:
+        """フィルタ条件に合う行数（ページ数の計算に使用）"""
+        return len(self.rows())
+    
+    def _sorted_rows(self) -> pd.DataFrame:
+        """並び替え済みの抽出行（ページ送りでは並び替えを繰り返さないようキャッシュ）"""
+        if not self._sort:
+            return self.rows()
+        col, ascending = self._sort
+        return self._db.query_cached(
+            ('query_sorted', self._filter_key(), self._sort),
+            lambda: self.rows().sort_values(col, ascending=ascending, kind='stable')
+        )
+    
+    def _slice(self, result: pd.DataFrame) -> pd.DataFrame:
+        """offset・limitの範囲を切り出す"""
+        if self._limit:
+            return result.iloc[self._offset:self._offset + self._limit]
+        return result.iloc[self._offset:] if self._offset else result
+    
+    @staticmethod
+    def _apply_filters(df: pd.DataFrame, filters: tuple) -> pd.DataFrame:
+        if df.empty:
+            return df
+        
+        mask = np.ones(len(df), dtype=bool)
+        for col, op, value in filters:
+            if col not in df.columns:
+                return df.iloc[0:0]
+            mask &= OPERATORS[op](df[col], value).to_numpy()
+        return df[mask]
+    
+    def run(self) -> pd.DataFrame:
+        """クエリを実行
+        
+        Returns:
+            group_by指定時はグループキーをインデックスとする集計結果、
+            未指定時は全体を1行に集計した結果（metrics未指定時はフィルタ後の行）
+        """
+        if not self._metrics:
+            return self._slice(self._sorted_rows())
+        
+        return self._slice(self._db.query_cached(self._signature(), self._aggregate))
+    
+    def _aggregate(self) -> pd.DataFrame:
+        rows = self.rows()
+        
+        # 必要な合計カラムを洗い出し、1回のgroupbyで集計
+        needed = set()
+        for name in self._metrics:
+            if name in SUM_METRICS:
+                needed.add(name)
+            elif name in AVERAGE_METRICS:
+                needed.add(AVERAGE_METRICS[name])
+            elif name in PERCENTAGE_METRICS:
+                made, attempted = PERCENTAGE_METRICS[name]
+                needed.update(made + attempted)
+            elif name not in ('GP', 'MIN', 'MPG'):
+                raise ValueError(f"未対応の指標です: {name}")
+        
+        frame = numeric_columns(rows, sorted(needed))
+        if {'MIN', 'MPG'} & set(self._metrics):
+            frame['MIN'] = parse_minutes(rows['MIN']) if 'MIN' in rows.columns else 0.0
+        frame['GP'] = 1
+        
+        if self._group_keys:
+            for key in self._group_keys:
+                frame[key] = rows[key]
+            totals = frame.groupby(self._group_keys).sum()
+        else:
+            totals = frame.sum().to_frame().T
+        
+        result = pd.DataFrame(index=totals.index)
+        for name in self._metrics:
+            if name in AVERAGE_METRICS:
+                result[name] = _ratio(totals[AVERAGE_METRICS[name]], totals['GP'])
+            elif name == 'MPG':
+                result[name] = _ratio(totals['MIN'], totals['GP'])
+            elif name in PERCENTAGE_METRICS:
+                made, attempted = PERCENTAGE_METRICS[name]
+                result[name] = _ratio(totals[made].sum(axis=1), totals[attempted].sum(axis=1), 100)
+            else:
+                result[name] = totals[name]
+        
+        if self._sort:
+            result = result.sort_values(self._sort[0], ascending=self._sort[1], kind='stable')
+        return result
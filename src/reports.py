@@ -0,0 +1,195 @@
+"""シーズンレポートの一括作成 - プロセスプールで全シーズンを並列集計"""
+import pandas as pd
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict
+
+from config import DEBUG_MODE, REPORTS_DIR
+from stats import (
+    calculate_season_overview, get_leaders, build_game_table, calculate_advanced_stats,
+    calculate_opponent_stats, build_season_lines, summarize_lines, build_split_lines,
+    calculate_splits, SPLIT_DIMENSIONS
+)
+
+# リーダーボードを作成するスタッツ
+REPORT_LEADER_STATS = ['PTS', 'TOT', 'AST', 'STL', 'BLK']
+
+# レポートの形式バージョン（集計内容を変えたら更新し、古いキャッシュを作り直す）
+# 2: スプリットから相手チームの行を除外
+REPORT_FORMAT_VERSION = 2
+
+# ワーカープロセスが共有する読み取り専用のデータセット（プール初期化時に設定）
+_worker_data: Optional[pd.DataFrame] = None
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """データフレームの内容から指紋（ハッシュ値）を作成
+    
+    Args:
+        df: データフレーム
+    
+    Returns:
+        内容が同じなら同じになる16進文字列
+    """
+    if df.empty:
+        return 'empty'
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha1(row_hashes.tobytes() + ','.join(map(str, df.columns)).encode()).hexdigest()
+
+
+def build_season_report(season_data: pd.DataFrame, season: str) -> dict:
+    """1シーズン分のレポート一式を作成
+    
+    Args:
+        season_data: シーズンのデータフレーム
+        season: シーズン
+    
+    Returns:
+        season, format_version, overview, leaders, rankings, opponents, player_lines, splits, games を含む辞書
+    """
+    games = build_game_table(season_data)
+    # 試合サマリーと同じく、スプリットも自チームの行のみで集計される
+    split_lines = build_split_lines(season_data)
+    
+    return {
+        'season': season,
+        'format_version': REPORT_FORMAT_VERSION,
+        'overview': calculate_season_overview(season_data, games),
+        'leaders': {stat: get_leaders(season_data, stat, n=5) for stat in REPORT_LEADER_STATS},
+        'rankings': calculate_advanced_stats(season_data),
+        'opponents': calculate_opponent_stats(games),
+        'player_lines': summarize_lines(build_season_lines(season_data)),
+        'splits': {
+            dimension: calculate_splits(split_lines, dimension, games=games)
+            for dimension in SPLIT_DIMENSIONS
+            if not split_lines.empty and dimension in split_lines.index.names
+        },
+        'games': games,
+    }
+
+
+def _init_worker(df: pd.DataFrame):
+    """ワーカープロセスの初期化（データセットを1回だけ受け取る）"""
+    global _worker_data
+    _worker_data = df
+
+
+def _build_report_task(season: str) -> dict:
+    """ワーカープロセスで1シーズン分のレポートを作成"""
+    return build_season_report(_worker_data[_worker_data['Season'] == season], season)
+
+
+def _report_path(season: str) -> Path:
+    """シーズンレポートのキャッシュファイルパス"""
+    safe_name = "".join(c if c.isalnum() or c in '-_' else '_' for c in str(season))
+    return Path(REPORTS_DIR) / f"season_report_{safe_name}.pkl"
+
+
+def load_season_report(season: str, fingerprint: str = None) -> Optional[dict]:
+    """キャッシュ済みのシーズンレポートを読み込む
+    
+    Args:
+        season: シーズン
+        fingerprint: 期待するデータの指紋（指定時は一致しない場合Noneを返す）
+    
+    Returns:
+        レポートの辞書（存在しない・古い・形式バージョンが異なる場合はNone）
+    """
+    path = _report_path(season)
+    if not path.exists():
+        return None
+    
+    try:
+        with open(path, 'rb') as f:
+            report = pickle.load(f)
+    except Exception as e:
+        if DEBUG_MODE:
+            print(f"⚠️ レポート読み込みエラー ({season}): {e}")
+        return None
+    
+    if report.get('format_version') != REPORT_FORMAT_VERSION:
+        return None
+    if fingerprint is not None and report.get('fingerprint') != fingerprint:
+        return None
+    return report
+
+
+def save_season_report(report: dict) -> bool:
+    """シーズンレポートをキャッシュに保存"""
+    try:
+        path = _report_path(report['season'])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(report, f)
+        return True
+    except Exception as e:
+        if DEBUG_MODE:
+            print(f"⚠️ レポート保存エラー ({report.get('season')}): {e}")
+        return False
+
+
+def build_all_season_reports(df: pd.DataFrame, seasons: List[str] = None, max_workers: int = None,
+                             force: bool = False) -> Dict[str, dict]:
+    """全シーズンのレポートを並列に作成してキャッシュに保存
+    
+    シーズンごとのデータの指紋が変わっていないレポートはキャッシュを再利用するため、
+    データ修正後は修正のあったシーズンだけが再計算される。
+    
+    Args:
+        df: 全シーズンの統計データフレーム
+        seasons: 対象シーズン（Noneの場合はデータ内の全シーズン）
+        max_workers: プロセス数（Noneの場合はCPU数）
+        force: Trueの場合はキャッシュを使わずすべて再計算
+    
+    Returns:
+        {シーズン: レポート} の辞書（各レポートに fingerprint, generated_at, cached を付与）
+    """
+    if df.empty or 'Season' not in df.columns:
+        return {}
+    
+    if seasons is None:
+        seasons = sorted(df['Season'].dropna().unique().tolist(), reverse=True)
+    
+    season_groups = {season: group for season, group in df.groupby('Season') if season in seasons}
+    fingerprints = {season: dataset_fingerprint(group) for season, group in season_groups.items()}
+    
+    reports = {}
+    pending = []
+    for season in season_groups:
+        cached = None if force else load_season_report(season, fingerprints[season])
+        if cached is not None:
+            cached['cached'] = True
+            reports[season] = cached
+        else:
+            pending.append(season)
+    
+    built = {}
+    if len(pending) > 1:
+        try:
+            target = df[df['Season'].isin(pending)]
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(target,)) as pool:
+                built = dict(zip(pending, pool.map(_build_report_task, pending)))
+        except (BrokenProcessPool, OSError) as e:
+            # プロセスを起動できない環境では逐次処理にフォールバック
+            # （ワーカー内のレポート作成エラーはそのまま呼び出し側に伝える）
+            if DEBUG_MODE:
+                print(f"⚠️ 並列レポート作成エラー（逐次処理に切り替え）: {e}")
+            built = {}
+    
+    for season in pending:
+        if season not in built:
+            built[season] = build_season_report(season_groups[season], season)
+    
+    generated_at = datetime.now().isoformat(timespec='seconds')
+    for season, report in built.items():
+        report['fingerprint'] = fingerprints[season]
+        report['generated_at'] = generated_at
+        save_season_report(report)
+        report['cached'] = False
+        reports[season] = report
+    
+    return {season: reports[season] for season in seasons if season in reports}
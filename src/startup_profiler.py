@@ -0,0 +1,95 @@
+"""起動時プロファイラ - モジュールごとのインポート時間を計測"""
+import importlib
+import sys
+import statistics
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+# 起動時に読み込まれていないことを確認する重い依存（表示名 → モジュール名）
+# plotly本体（graph_objects）はStreamlit自身が読み込むため対象外
+HEAVY_MODULES = {
+    'Plotly Express': 'plotly.express',
+    'グラフ (charts)': 'charts',
+    'Gemini SDK': 'google.generativeai',
+}
+
+# モジュール名 → 初回インポートにかかった時間（ミリ秒）
+IMPORT_TIMES: Dict[str, float] = {}
+
+# 新しいセッションで最初のコンテンツを描画し終えるまでの時間（ミリ秒、プロセス内の直近のセッション分）
+FIRST_CONTENT_SAMPLES = 200
+FIRST_CONTENT_TIMES: Deque[float] = deque(maxlen=FIRST_CONTENT_SAMPLES)
+
+
+def timed_import(module_name: str):
+    """モジュールをインポートし、初回のインポート時間を記録
+    
+    すでに読み込み済みのモジュールは計測せずにそのまま返す。
+    
+    Args:
+        module_name: モジュール名（例: 'pages.season_stats'）
+    
+    Returns:
+        インポートしたモジュール
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    IMPORT_TIMES[module_name] = (time.perf_counter() - start) * 1000
+    return module
+
+
+def import_report() -> List[Dict]:
+    """計測したインポート時間の一覧（時間の長い順）
+    
+    Returns:
+        [{'module': モジュール名, 'ms': ミリ秒}, ...]
+        （依存モジュールの読み込み時間は最初にそれを読み込んだモジュールに含まれる）
+    """
+    return [
+        {'module': name, 'ms': round(ms, 1)}
+        for name, ms in sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+
+def loaded_heavy_modules() -> Dict[str, bool]:
+    """重い依存がメモリに読み込まれているかどうか
+    
+    Returns:
+        {表示名: 読み込み済みならTrue}
+    """
+    return {label: module in sys.modules for label, module in HEAVY_MODULES.items()}
+
+
+def record_first_content(run_started: float) -> float:
+    """新しいセッションの最初のコンテンツ描画までの時間を記録
+    
+    Args:
+        run_started: スクリプト実行開始時のtime.perf_counter()の値
+    
+    Returns:
+        経過時間（ミリ秒、サーバー側でメインコンテンツの描画を終えるまで）
+    """
+    elapsed_ms = (time.perf_counter() - run_started) * 1000
+    FIRST_CONTENT_TIMES.append(elapsed_ms)
+    return elapsed_ms
+
+
+def first_content_summary() -> Dict[str, float]:
+    """最初のコンテンツ表示までの時間の集計
+    
+    Returns:
+        {'sessions': 集計したセッション数（直近FIRST_CONTENT_SAMPLES件まで）, 'last_ms': 直近, 'median_ms': 中央値}
+        （計測がない場合は空の辞書）
+    """
+    if not FIRST_CONTENT_TIMES:
+        return {}
+    return {
+        'sessions': len(FIRST_CONTENT_TIMES),
+        'last_ms': round(FIRST_CONTENT_TIMES[-1], 1),
+        'median_ms': round(statistics.median(FIRST_CONTENT_TIMES), 1),
+    }
@@ -144,36 +144,1192 @@ def calculate_team_stats(game_data: pd.DataFrame) -> dict:
         'fg_pct': safe_percentage(total_fgm, total_fga),
         '3p_pct': safe_percentage(total_3pm, total_3pa),
         'ft_pct': safe_percentage(total_ftm, total_fta),
+        'possessions': estimate_possessions(
+            total_fga, total_fta,
+            game_data['OR'].apply(safe_numeric).sum() if 'OR' in game_data.columns else 0,
+            game_data['TO'].apply(safe_numeric).sum()
+        ),
     }
 
 
-def calculate_season_overview(season_data: pd.DataFrame) -> dict:
+def calculate_season_overview(season_data: pd.DataFrame, games: pd.DataFrame = None) -> dict:
     """シーズン概要を計算
     
     Args:
         season_data: シーズンのデータフレーム
+        games: 試合単位のチームサマリー（build_game_tableの結果、省略時はseason_dataから作成）
     
     Returns:
         シーズン概要の辞書
     """
-    games = len(season_data['GameDate'].unique())
-    players = season_data['PlayerName'].nunique()
+    if games is None:
+        games = build_game_table(season_data)
     
-    # 安全な数値変換
-    season_data_clean = season_data.copy()
-    season_data_clean['PTS'] = season_data_clean['PTS'].apply(safe_numeric)
-    season_data_clean['TeamScore'] = season_data_clean['TeamScore'].apply(safe_numeric)
-    season_data_clean['OpponentScore'] = season_data_clean['OpponentScore'].apply(safe_numeric)
+    game_count = len(games)
+    players = season_data['PlayerName'].nunique() if 'PlayerName' in season_data.columns else 0
+    wins = int((games['Result'] == 'W').sum())
+    losses = int((games['Result'] == 'L').sum())
     
-    avg_pts = season_data_clean.groupby('GameDate')['PTS'].sum().mean()
-    wins = len(season_data_clean[season_data_clean['TeamScore'] > season_data_clean['OpponentScore']]['GameDate'].unique())
-    losses = len(season_data_clean[season_data_clean['TeamScore'] < season_data_clean['OpponentScore']]['GameDate'].unique())
+    def game_average(col):
+        return float(games[col].mean()) if game_count > 0 else 0
     
     return {
-        'games': games,
+        'games': game_count,
         'players': players,
-        'avg_pts': avg_pts,
+        'avg_pts': game_average('PTS'),
+        'avg_reb': game_average('TOT'),
+        'avg_ast': game_average('AST'),
+        'avg_opp_pts': game_average('OpponentScore'),
+        'avg_margin': game_average('Margin'),
         'wins': wins,
         'losses': losses,
-        'win_pct': (wins / games * 100) if games > 0 else 0
+        'win_pct': (wins / game_count * 100) if game_count > 0 else 0,
+        'avg_pace': game_average('PACE'),
+        'ortg': float(_ratio(games['TeamScore'].sum(), games['POSS'].sum(), 100)) if game_count > 0 else 0,
+        'drtg': float(_ratio(games['OpponentScore'].sum(), games['OPP_POSS'].sum(), 100)) if game_count > 0 else 0
     }
+
+
+# ===== アドバンスドスタッツ（列単位のベクトル演算） =====
+
+# 1試合を一意に識別するキー（同日同相手は試合形式で区別）
+GAME_KEY = ['GameDate', 'Opponent', 'GameFormat']
+
+# 集計に使う数値カラム
+BOX_SCORE_COLUMNS = ['PTS', '3PM', '3PA', '2PM', '2PA', 'DK', 'FTM', 'FTA',
+                     'OR', 'DR', 'TOT', 'AST', 'STL', 'BLK', 'TO', 'PF']
+
+# 出場時間あたりに換算するスタッツ
+RATE_STATS = {'PTS': 'PTS', 'TOT': 'REB', 'AST': 'AST', 'STL': 'STL', 'BLK': 'BLK', 'TO': 'TO'}
+
+# 平均スタッツのラベル（calculate_statsと同じ並び）
+AVERAGE_LABELS = {'PTS': 'PPG', 'TOT': 'RPG', 'AST': 'APG', 'STL': 'SPG', 'BLK': 'BPG', 'TO': 'TOPG'}
+
+
+def parse_minutes(series: pd.Series) -> pd.Series:
+    """出場時間（"MM:SS"形式）を分単位の数値に変換（ベクトル化）
+    
+    Args:
+        series: MINカラム
+    
+    Returns:
+        分単位のfloatシリーズ（解析できない値は0）
+    """
+    parts = series.astype(str).str.extract(r'^\s*(\d+)(?::(\d+))?')
+    minutes = pd.to_numeric(parts[0], errors='coerce').fillna(0)
+    seconds = pd.to_numeric(parts[1], errors='coerce').fillna(0)
+    return (minutes + seconds / 60).astype(float)
+
+
+def numeric_columns(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """指定カラムを数値化したデータフレームを返す（存在しないカラムは0）"""
+    result = pd.DataFrame(index=df.index)
+    for col in columns:
+        if col in df.columns:
+            result[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        else:
+            result[col] = 0
+    return result
+
+
+def _ratio(numerator, denominator, scale: float = 1.0):
+    """ゼロ除算を0として扱う割り算（配列・スカラー両対応）"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.where(denominator > 0, numerator / denominator * scale, 0.0)
+    return result
+
+
+def add_advanced_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """試合単位（1行=1選手1試合）のアドバンスドスタッツ列を追加
+    
+    追加カラム:
+        MIN_DEC: 出場時間（分）
+        FGM / FGA: フィールドゴール成功・試投数
+        eFG%: 実効FG% = (FGM + 0.5 × 3PM) / FGA
+        TS%: トゥルーシューティング% = PTS / (2 × (FGA + 0.44 × FTA))
+        AST/TO: アシスト/ターンオーバー比
+        PLAYS: 使用したポゼッション数の近似 = FGA + 0.44 × FTA + TO
+        USG%: 使用率の近似（出場時間で補正したチーム内のPLAYSシェア）
+    
+    Args:
+        df: 統計データフレーム
+    
+    Returns:
+        列を追加したデータフレーム（元のデータは変更しない）
+    """
+    result = df.copy()
+    nums = numeric_columns(result, BOX_SCORE_COLUMNS)
+    
+    result['MIN_DEC'] = parse_minutes(result['MIN']) if 'MIN' in result.columns else 0.0
+    result['FGM'] = nums['2PM'] + nums['3PM']
+    result['FGA'] = nums['2PA'] + nums['3PA']
+    result['eFG%'] = _ratio(result['FGM'] + 0.5 * nums['3PM'], result['FGA'], 100)
+    result['TS%'] = _ratio(nums['PTS'], 2 * (result['FGA'] + 0.44 * nums['FTA']), 100)
+    result['AST/TO'] = _ratio(nums['AST'], nums['TO'])
+    result['PLAYS'] = result['FGA'] + 0.44 * nums['FTA'] + nums['TO']
+    
+    # 使用率: チーム合計に対する出場時間補正後のシェア
+    # 出場時間が未記録の試合は全員が均等に出場したとみなす
+    if all(col in result.columns for col in GAME_KEY) and not result.empty:
+        game_groups = result.groupby(GAME_KEY, sort=False)
+        team_plays = game_groups['PLAYS'].transform('sum')
+        team_min = game_groups['MIN_DEC'].transform('sum')
+        players_in_game = game_groups['PLAYS'].transform('size')
+        has_minutes = team_min > 0
+        player_min = np.where(has_minutes, result['MIN_DEC'], 1.0)
+        team_min = np.where(has_minutes, team_min, players_in_game)
+        result['_USG_NUM'] = result['PLAYS'] * team_min / 5
+        result['_USG_DEN'] = player_min * team_plays
+    else:
+        result['_USG_NUM'] = 0.0
+        result['_USG_DEN'] = 0.0
+    result['USG%'] = _ratio(result['_USG_NUM'], result['_USG_DEN'], 100)
+    
+    return result
+
+
+def calculate_advanced_stats(df: pd.DataFrame, group_cols: list = None) -> pd.DataFrame:
+    """アドバンスドスタッツを一括集計（選手ごとのループなし）
+    
+    Args:
+        df: 統計データフレーム
+        group_cols: 集計キー（デフォルトは['PlayerName']、シーズン別は['Season', 'PlayerName']）
+    
+    Returns:
+        集計キーをインデックスとするデータフレーム
+        （GP, MIN, MPG, 平均スタッツ, FG%/3P%/FT%/eFG%/TS%, 出場時間換算, AST/TO, USG%）
+    """
+    if group_cols is None:
+        group_cols = ['PlayerName']
+    
+    if df.empty:
+        return pd.DataFrame()
+    
+    rows = add_advanced_columns(df)
+    sum_cols = BOX_SCORE_COLUMNS + ['MIN_DEC', 'FGM', 'FGA', 'PLAYS', '_USG_NUM', '_USG_DEN']
+    frame = numeric_columns(rows, sum_cols)
+    
+    # 出場時間換算は出場時間が記録された試合のスタッツのみで計算（分子と分母の対象試合を揃える）
+    timed = frame['MIN_DEC'] > 0
+    timed_cols = []
+    for col in RATE_STATS:
+        frame[f'_{col}_TIMED'] = frame[col].where(timed, 0)
+        timed_cols.append(f'_{col}_TIMED')
+    sum_cols = sum_cols + timed_cols
+    
+    for col in group_cols:
+        frame[col] = rows[col]
+    
+    grouped = frame.groupby(group_cols, sort=True)
+    totals = grouped[sum_cols].sum()
+    gp = grouped.size()
+    
+    result = pd.DataFrame(index=totals.index)
+    result['GP'] = gp
+    result['MIN'] = totals['MIN_DEC']
+    result['MPG'] = _ratio(totals['MIN_DEC'], gp)
+    
+    for col, label in AVERAGE_LABELS.items():
+        result[label] = _ratio(totals[col], gp)
+    
+    result['FG%'] = _ratio(totals['FGM'], totals['FGA'], 100)
+    result['3P%'] = _ratio(totals['3PM'], totals['3PA'], 100)
+    result['FT%'] = _ratio(totals['FTM'], totals['FTA'], 100)
+    result['eFG%'] = _ratio(totals['FGM'] + 0.5 * totals['3PM'], totals['FGA'], 100)
+    result['TS%'] = _ratio(totals['PTS'], 2 * (totals['FGA'] + 0.44 * totals['FTA']), 100)
+    
+    for col, label in RATE_STATS.items():
+        result[f'{label}/MIN'] = _ratio(totals[f'_{col}_TIMED'], totals['MIN_DEC'])
+        result[f'{label}/32'] = _ratio(totals[f'_{col}_TIMED'], totals['MIN_DEC'], 32)
+        result[f'{label}/36'] = _ratio(totals[f'_{col}_TIMED'], totals['MIN_DEC'], 36)
+    
+    result['AST/TO'] = _ratio(totals['AST'], totals['TO'])
+    result['USG%'] = _ratio(totals['_USG_NUM'], totals['_USG_DEN'], 100)
+    
+    return result
+
+
+# ===== 移動平均・直近N試合（グループ化した累積和） =====
+
+# 移動平均を計算するスタッツ
+ROLLING_STATS = ['PTS', 'TOT', 'AST', 'STL', 'BLK', 'TO']
+
+# 移動シュート率の計算に使う成功数・試投数
+ROLLING_SHOOTING = {'FG%': ('FGM', 'FGA'), '3P%': ('3PM', '3PA'), 'FT%': ('FTM', 'FTA')}
+
+
+def calculate_rolling_stats(df: pd.DataFrame, window: int = 5, group_cols: list = None) -> pd.DataFrame:
+    """全選手の移動平均・移動シュート率を一括計算（O(行数)）
+    
+    選手ごとの累積和からwindow試合前の累積和を引いて区間合計を求めるため、
+    ウィンドウ幅に関係なく1回のソートと累積和で計算できる。
+    
+    Args:
+        df: 統計データフレーム
+        window: 移動平均の試合数
+        group_cols: 系列を区切るキー（デフォルトは['PlayerName']）
+    
+    Returns:
+        元の行インデックスを持つデータフレーム
+        （GameNumber, WindowGames, {stat}_MA, {FG%|3P%|FT%}_MA）
+    """
+    if group_cols is None:
+        group_cols = ['PlayerName']
+    
+    if df.empty:
+        return pd.DataFrame()
+    
+    window = max(int(window), 1)
+    ordered = df.sort_values(group_cols + ['GameDate'], kind='stable')
+    
+    nums = numeric_columns(ordered, ROLLING_STATS + ['3PM', '3PA', '2PM', '2PA', 'FTM', 'FTA'])
+    nums['FGM'] = nums['2PM'] + nums['3PM']
+    nums['FGA'] = nums['2PA'] + nums['3PA']
+    sum_cols = ROLLING_STATS + ['FGM', 'FGA', '3PM', '3PA', 'FTM', 'FTA']
+    
+    keys = [ordered[col] for col in group_cols]
+    cumulative = nums[sum_cols].groupby(keys, sort=False).cumsum()
+    lagged = cumulative.groupby(keys, sort=False).shift(window).fillna(0)
+    window_sums = cumulative - lagged
+    
+    result = ordered[group_cols + ['GameDate']].copy()
+    result['GameNumber'] = ordered.groupby(group_cols, sort=False).cumcount() + 1
+    result['WindowGames'] = np.minimum(result['GameNumber'], window)
+    
+    for col in ROLLING_STATS:
+        result[f'{col}_MA'] = window_sums[col] / result['WindowGames']
+    
+    for label, (made, attempted) in ROLLING_SHOOTING.items():
+        result[f'{label}_MA'] = _ratio(window_sums[made], window_sums[attempted], 100)
+    
+    return result
+
+
+def calculate_last_n_stats(rolling: pd.DataFrame, group_cols: list = None) -> pd.DataFrame:
+    """直近N試合の成績を抽出（移動平均の最終行 = 直近N試合の平均）
+    
+    Args:
+        rolling: calculate_rolling_statsの結果
+        group_cols: 選手を識別するキー（デフォルトは['PlayerName']）
+    
+    Returns:
+        選手名をインデックスとするデータフレーム（GP, 平均スタッツ, シュート率）
+    """
+    if group_cols is None:
+        group_cols = ['PlayerName']
+    
+    if rolling.empty:
+        return pd.DataFrame()
+    
+    last_rows = rolling.groupby(group_cols, sort=True).tail(1).set_index(group_cols)
+    
+    result = pd.DataFrame(index=last_rows.index)
+    result['GP'] = last_rows['WindowGames']
+    for col in ROLLING_STATS:
+        result[AVERAGE_LABELS[col]] = last_rows[f'{col}_MA']
+    for label in ROLLING_SHOOTING:
+        result[label] = last_rows[f'{label}_MA']
+    result['LastGame'] = last_rows['GameDate']
+    
+    return result.sort_index()
+
+
+# ===== 試合単位のチームサマリー =====
+
+# 試合ごとに合計するスタッツ
+GAME_SUM_COLUMNS = ['PTS', 'TOT', 'OR', 'DR', 'AST', 'STL', 'BLK', 'TO', 'PF',
+                    'FGM', 'FGA', '3PM', '3PA', 'FTM', 'FTA']
+
+# ポゼッション・レーティングのカラム
+PACE_COLUMNS = ['POSS', 'OPP_POSS', 'OppRecorded', 'PACE', 'ORtg', 'DRtg', 'NetRtg']
+
+GAME_TABLE_COLUMNS = (['Season'] + GAME_KEY + ['Players'] + GAME_SUM_COLUMNS +
+                      ['TeamScore', 'OpponentScore', 'Result', 'Margin', 'FG%', '3P%', 'FT%'] +
+                      PACE_COLUMNS)
+
+# 相手チームとして登録された行のDataType
+OPPONENT_DATA_TYPE = 'OpponentTeam'
+
+
+def estimate_possessions(fga, fta, offensive_rebounds, turnovers):
+    """ポゼッション数を推定（POSS = FGA + 0.44 × FTA - OR + TO、配列・スカラー両対応）"""
+    return fga + 0.44 * fta - offensive_rebounds + turnovers
+
+
+def split_team_rows(df: pd.DataFrame) -> tuple:
+    """自チームの行と相手チームとして登録された行に分ける
+    
+    Args:
+        df: 統計データフレーム
+    
+    Returns:
+        (自チームの行, 相手チームの行)（DataTypeカラムがない場合はすべて自チーム）
+    """
+    if 'DataType' not in df.columns:
+        return df, df.iloc[0:0]
+    is_opponent = df['DataType'] == OPPONENT_DATA_TYPE
+    return df[~is_opponent], df[is_opponent]
+
+
+def add_pace_columns(games: pd.DataFrame, opponent_rows: pd.DataFrame = None) -> pd.DataFrame:
+    """試合サマリーにポゼッション・ペース・オフェンス/ディフェンスレーティングを追加
+    
+    相手チームのボックススコアが登録されている試合（GameDate・試合形式・OriginalTeamで照合）は
+    相手のポゼッションをそこから推定し、ない試合は自チームと同数とみなす。
+    
+    Args:
+        games: 試合サマリー（FGA, FTA, OR, TO, TeamScore, OpponentScoreを含む）
+        opponent_rows: 相手チームとして登録された行（DataType == 'OpponentTeam'）
+    
+    Returns:
+        POSS, OPP_POSS, OppRecorded, PACE, ORtg, DRtg, NetRtg を追加したデータフレーム
+    """
+    games = games.copy()
+    games['POSS'] = estimate_possessions(games['FGA'], games['FTA'], games['OR'], games['TO']).clip(lower=0)
+    games['OPP_POSS'] = games['POSS']
+    games['OppRecorded'] = False
+    
+    if opponent_rows is not None and not opponent_rows.empty and 'OriginalTeam' in opponent_rows.columns:
+        opp = numeric_columns(opponent_rows, ['2PA', '3PA', 'FTA', 'OR', 'TO'])
+        opp['OPP_POSS'] = estimate_possessions(opp['2PA'] + opp['3PA'], opp['FTA'], opp['OR'], opp['TO'])
+        opp['GameDate'] = opponent_rows['GameDate']
+        opp['Opponent'] = opponent_rows['OriginalTeam']
+        opp['GameFormat'] = opponent_rows['GameFormat'] if 'GameFormat' in opponent_rows.columns else '4Q'
+        opp_poss = opp.groupby(GAME_KEY)['OPP_POSS'].sum()
+        
+        matched = games.set_index(GAME_KEY).index.map(opp_poss)
+        recorded = matched.notna()
+        games.loc[recorded, 'OPP_POSS'] = np.clip(np.asarray(matched, dtype=float)[recorded], 0, None)
+        games['OppRecorded'] = recorded
+    
+    games['PACE'] = (games['POSS'] + games['OPP_POSS']) / 2
+    games['ORtg'] = _ratio(games['TeamScore'], games['POSS'], 100)
+    games['DRtg'] = _ratio(games['OpponentScore'], games['OPP_POSS'], 100)
+    games['NetRtg'] = games['ORtg'] - games['DRtg']
+    return games
+
+
+def build_game_table(df: pd.DataFrame) -> pd.DataFrame:
+    """試合単位のチームサマリーを1回のgroupbyで作成
+    
+    シーズン概要・ナビゲーションの集計値・試合リスト・対戦相手分析は
+    すべてこのテーブルから導出する。相手チームとして登録された行は集計に含めず、
+    相手のポゼッション推定にのみ使用する。
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合）
+    
+    Returns:
+        1行=1試合のデータフレーム（試合日順）
+        （Season, GameDate, Opponent, GameFormat, Players, 各合計スタッツ,
+         TeamScore, OpponentScore, Result('W'/'L'/'D'), Margin, FG%, 3P%, FT%,
+         POSS, OPP_POSS, OppRecorded, PACE, ORtg, DRtg, NetRtg）
+    """
+    if df.empty or not all(col in df.columns for col in GAME_KEY):
+        return pd.DataFrame(columns=GAME_TABLE_COLUMNS)
+    
+    df, opponent_rows = split_team_rows(df)
+    if df.empty:
+        return pd.DataFrame(columns=GAME_TABLE_COLUMNS)
+    
+    frame = numeric_columns(df, BOX_SCORE_COLUMNS + ['TeamScore', 'OpponentScore'])
+    frame['FGM'] = frame['2PM'] + frame['3PM']
+    frame['FGA'] = frame['2PA'] + frame['3PA']
+    for col in GAME_KEY:
+        frame[col] = df[col]
+    frame['Season'] = df['Season'] if 'Season' in df.columns else ''
+    
+    agg_spec = {'Season': ('Season', 'first'), 'Players': ('PTS', 'size')}
+    agg_spec.update({col: (col, 'sum') for col in GAME_SUM_COLUMNS})
+    agg_spec.update({'TeamScore': ('TeamScore', 'first'), 'OpponentScore': ('OpponentScore', 'first')})
+    
+    games = frame.groupby(GAME_KEY, sort=False).agg(**agg_spec).reset_index()
+    
+    games['Margin'] = games['TeamScore'] - games['OpponentScore']
+    games['Result'] = np.select([games['Margin'] > 0, games['Margin'] < 0], ['W', 'L'], default='D')
+    games['FG%'] = _ratio(games['FGM'], games['FGA'], 100)
+    games['3P%'] = _ratio(games['3PM'], games['3PA'], 100)
+    games['FT%'] = _ratio(games['FTM'], games['FTA'], 100)
+    games = add_pace_columns(games, opponent_rows)
+    
+    return games[GAME_TABLE_COLUMNS].sort_values('GameDate', kind='stable').reset_index(drop=True)
+
+
+# ===== 対戦相手別の成績 =====
+
+GAME_CATALOG_COLUMNS = ['Season'] + GAME_KEY + ['GameNumber', 'Doubleheader', 'Label', 'GameKey']
+
+
+def build_game_catalog(games: pd.DataFrame) -> pd.DataFrame:
+    """試合選択用のカタログを作成（ラベル・同日同相手の連番・キーを一括で付与）
+    
+    Args:
+        games: GameDate・Opponent・GameFormatを含むデータフレーム
+               （試合サマリーまたは統計データの行。重複行は1試合にまとめる）
+    
+    Returns:
+        1行=1試合のデータフレーム（日付・相手・試合形式順）
+        （Season, GameDate, Opponent, GameFormat, GameNumber, Doubleheader, Label, GameKey）
+    """
+    if games.empty or not all(col in games.columns for col in GAME_KEY):
+        return pd.DataFrame(columns=GAME_CATALOG_COLUMNS)
+    
+    cols = GAME_KEY + (['Season'] if 'Season' in games.columns else [])
+    catalog = games[cols].drop_duplicates(GAME_KEY).sort_values(GAME_KEY, kind='stable')
+    catalog = catalog.astype({col: str for col in GAME_KEY}).reset_index(drop=True)
+    if 'Season' not in catalog.columns:
+        catalog['Season'] = ''
+    
+    # 同日・同相手の試合は連番を付けて区別
+    same_day = catalog.groupby(['GameDate', 'Opponent'], sort=False)['GameFormat']
+    catalog['GameNumber'] = same_day.cumcount() + 1
+    catalog['Doubleheader'] = same_day.transform('size') > 1
+    
+    base = catalog['GameDate'] + " vs " + catalog['Opponent']
+    catalog['Label'] = np.where(
+        catalog['Doubleheader'],
+        base + " (第" + catalog['GameNumber'].astype(str) + "試合 - " + catalog['GameFormat'] + ")",
+        base + " (" + catalog['GameFormat'] + ")"
+    )
+    catalog['GameKey'] = catalog['GameDate'] + "|" + catalog['Opponent'] + "|" + catalog['GameFormat']
+    
+    return catalog[GAME_CATALOG_COLUMNS]
+
+
+OPPONENT_RECORD_COLUMNS = ['Opponent', 'GamesPlayed', 'Wins', 'Losses', 'WinRate',
+                           'AvgPtsFor', 'AvgPtsAgainst', 'AvgRebFor', 'AvgAstFor', 'PtsDiff']
+
+
+def calculate_opponent_stats(games: pd.DataFrame, group_cols: list = None) -> pd.DataFrame:
+    """対戦相手ごとの成績を試合サマリーから1回のgroupbyで計算
+    
+    Args:
+        games: 試合単位のチームサマリー（build_game_tableの結果）
+        group_cols: グループ化するカラム（デフォルト: ['Opponent']、シーズン別は['Season', 'Opponent']）
+    
+    Returns:
+        対戦相手ごとの成績（試合数の多い順）
+    """
+    if group_cols is None:
+        group_cols = ['Opponent']
+    
+    columns = [col for col in group_cols if col != 'Opponent'] + OPPONENT_RECORD_COLUMNS
+    if games.empty:
+        return pd.DataFrame(columns=columns)
+    
+    frame = games.assign(_WIN=(games['Result'] == 'W').astype(int))
+    result = frame.groupby(group_cols, sort=False).agg(
+        GamesPlayed=('Result', 'size'),
+        Wins=('_WIN', 'sum'),
+        AvgPtsFor=('PTS', 'mean'),
+        AvgPtsAgainst=('OpponentScore', 'mean'),
+        AvgRebFor=('TOT', 'mean'),
+        AvgAstFor=('AST', 'mean')
+    ).reset_index()
+    
+    # 引き分けは従来どおり敗北側に含める
+    result['Losses'] = result['GamesPlayed'] - result['Wins']
+    result['WinRate'] = _ratio(result['Wins'], result['GamesPlayed'], 100)
+    result['PtsDiff'] = result['AvgPtsFor'] - result['AvgPtsAgainst']
+    
+    return result[columns].sort_values('GamesPlayed', ascending=False, kind='stable').reset_index(drop=True)
+
+
+# ===== パーセンタイルテーブル =====
+
+# レーダーチャートで使用する項目（アドバンスドスタッツのカラム: 表示ラベル）
+RADAR_STATS = {'PPG': '得点', 'RPG': 'リバウンド', 'APG': 'アシスト', 'SPG': 'スティール', 'BPG': 'ブロック'}
+
+
+def build_percentile_table(advanced: pd.DataFrame) -> dict:
+    """数値スタッツごとにソート済み配列を作成（パーセンタイル検索用）
+    
+    Args:
+        advanced: 選手ごとのスタッツ（calculate_advanced_statsの結果）
+    
+    Returns:
+        {カラム名: 昇順ソート済みのnumpy配列} の辞書
+    """
+    if advanced.empty:
+        return {}
+    
+    numeric = advanced.select_dtypes(include='number')
+    return {col: np.sort(numeric[col].fillna(0).to_numpy(dtype=float)) for col in numeric.columns}
+
+
+def lookup_percentiles(table: dict, values, stats: list) -> list:
+    """ソート済み配列への二分探索でパーセンタイル（0〜100）を取得
+    
+    同値は平均順位として扱い、最下位が0・最上位が100になる。
+    
+    Args:
+        table: build_percentile_tableの結果
+        values: スタッツの値（辞書またはSeries）
+        stats: 取得するカラム名のリスト
+    
+    Returns:
+        statsと同じ順序のパーセンタイルのリスト
+    """
+    percentiles = []
+    for stat in stats:
+        sorted_values = table.get(stat)
+        if sorted_values is None or len(sorted_values) == 0:
+            percentiles.append(0.0)
+            continue
+        
+        value = safe_numeric(values.get(stat, 0))
+        count = len(sorted_values)
+        if count == 1:
+            percentiles.append(100.0)
+            continue
+        
+        below = np.searchsorted(sorted_values, value, side='left')
+        at_or_below = np.searchsorted(sorted_values, value, side='right')
+        rank = (below + max(at_or_below - 1, below)) / 2
+        percentiles.append(float(min(max(rank / (count - 1) * 100, 0.0), 100.0)))
+    
+    return percentiles
+
+
+# ===== 類似選手検索 =====
+
+# 類似度計算に使用するスタッツ（アドバンスドスタッツのカラム）
+SIMILARITY_FEATURES = ['MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'TOPG',
+                       'FG%', '3P%', 'FT%', 'eFG%', 'TS%', 'USG%']
+
+
+def build_similarity_matrix(advanced: pd.DataFrame, features: list = None) -> tuple:
+    """選手×シーズンの標準化済み特徴量行列を作成
+    
+    Args:
+        advanced: 選手・シーズン単位のスタッツ（calculate_advanced_statsの結果）
+        features: 使用するカラム（デフォルト: SIMILARITY_FEATURES）
+    
+    Returns:
+        (行に対応するインデックス, 各列をzスコア化したnumpy配列, 出場試合数の配列)
+    """
+    if features is None:
+        features = SIMILARITY_FEATURES
+    
+    features = [col for col in features if col in advanced.columns]
+    if advanced.empty or not features:
+        return pd.Index([]), np.empty((0, 0)), np.empty(0)
+    
+    values = advanced[features].fillna(0).to_numpy(dtype=float)
+    std = values.std(axis=0)
+    std[std == 0] = 1.0
+    matrix = (values - values.mean(axis=0)) / std
+    
+    return advanced.index, matrix, advanced['GP'].to_numpy(dtype=float)
+
+
+def find_similar_players(index: pd.Index, matrix: np.ndarray, games: np.ndarray, target,
+                         k: int = 5, min_games: int = 1, exclude_same_player: bool = True) -> pd.DataFrame:
+    """ユークリッド距離によるk近傍の選手シーズンを検索
+    
+    Args:
+        index: build_similarity_matrixのインデックス（(Season, PlayerName)）
+        matrix: 標準化済み特徴量行列
+        games: 各行の出場試合数
+        target: 基準となる行のキー（(Season, PlayerName)）
+        k: 返す件数
+        min_games: 候補とする最低出場試合数
+        exclude_same_player: 同じ選手の別シーズンを除外するか
+    
+    Returns:
+        Season, PlayerName, Distance, Similarity(0〜100) のデータフレーム（近い順）
+    """
+    columns = ['Season', 'PlayerName', 'Distance', 'Similarity']
+    if len(index) == 0 or target not in index:
+        return pd.DataFrame(columns=columns)
+    
+    position = index.get_loc(target)
+    diff = matrix - matrix[position]
+    distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    
+    candidates = games >= min_games
+    candidates[position] = False
+    if exclude_same_player:
+        candidates &= index.get_level_values('PlayerName') != target[1]
+    
+    candidate_positions = np.flatnonzero(candidates)
+    if len(candidate_positions) == 0:
+        return pd.DataFrame(columns=columns)
+    
+    k = min(k, len(candidate_positions))
+    nearest = candidate_positions[np.argpartition(distances[candidate_positions], k - 1)[:k]]
+    nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+    
+    result = index[nearest].to_frame(index=False)
+    result['Distance'] = distances[nearest]
+    result['Similarity'] = 100 / (1 + distances[nearest])
+    
+    return result[columns]
+
+
+# ===== 通算・シーズン別成績（キャリアテーブル） =====
+
+# 選手シーズン単位で合計するカラム（足し合わせ可能な値のみ保持し、平均・成功率は都度算出）
+CAREER_SUM_COLUMNS = ['PTS', 'TOT', 'AST', 'STL', 'BLK', 'TO', 'PF',
+                      '3PM', '3PA', '2PM', '2PA', 'FTM', 'FTA']
+
+# キャリアハイを記録するカラム
+CAREER_HIGH_COLUMNS = ['PTS', 'TOT', 'AST', 'STL', 'BLK', '3PM']
+
+SEASON_LINE_KEY = ['PlayerName', 'Season']
+
+
+def aggregate_lines(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """指定キー単位の合計・最高記録を1回のgroupbyで作成
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合、keysのカラムを含むこと）
+        keys: グループ化するカラム
+    
+    Returns:
+        keysをインデックスとするデータフレーム（GP, 各合計カラム, MIN_DEC, {カラム}_HIGH）
+    """
+    frame = numeric_columns(df, CAREER_SUM_COLUMNS)
+    frame['MIN_DEC'] = parse_minutes(df['MIN']) if 'MIN' in df.columns else 0.0
+    for col in keys:
+        frame[col] = df[col]
+    
+    agg_spec = {'GP': ('PTS', 'size')}
+    agg_spec.update({col: (col, 'sum') for col in CAREER_SUM_COLUMNS + ['MIN_DEC']})
+    agg_spec.update({f'{col}_HIGH': (col, 'max') for col in CAREER_HIGH_COLUMNS})
+    
+    return frame.groupby(keys).agg(**agg_spec)
+
+
+def rollup_lines(lines: pd.DataFrame, keys) -> pd.DataFrame:
+    """合計・最高記録のテーブルをより粗いキーで再集計（合計は加算、最高記録は最大値）
+    
+    Args:
+        lines: aggregate_linesの結果
+        keys: 残すインデックスレベル
+    
+    Returns:
+        keysをインデックスとするデータフレーム
+    """
+    agg_spec = {col: ('max' if col.endswith('_HIGH') else 'sum') for col in lines.columns}
+    return lines.groupby(level=keys).agg(agg_spec)
+
+
+def build_season_lines(df: pd.DataFrame) -> pd.DataFrame:
+    """選手×シーズン単位の合計・最高記録を1回のgroupbyで作成
+    
+    合計と最高記録のみを持つため、追加データ分の結果とmerge_season_linesで結合できる。
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合）
+    
+    Returns:
+        (PlayerName, Season) をインデックスとするデータフレーム
+        （GP, 各合計カラム, MIN_DEC, {カラム}_HIGH）
+    """
+    if df.empty or not all(col in df.columns for col in SEASON_LINE_KEY):
+        return pd.DataFrame()
+    
+    return aggregate_lines(df, SEASON_LINE_KEY)
+
+
+def merge_season_lines(lines: pd.DataFrame, new_lines: pd.DataFrame) -> pd.DataFrame:
+    """既存のシーズン別合計に追加分を結合（合計は加算、最高記録は最大値）
+    
+    Args:
+        lines: 既存のbuild_season_linesの結果
+        new_lines: 追加データのbuild_season_linesの結果
+    
+    Returns:
+        結合後のシーズン別合計
+    """
+    if lines.empty:
+        return new_lines
+    if new_lines.empty:
+        return lines
+    
+    return rollup_lines(pd.concat([lines, new_lines]), SEASON_LINE_KEY)
+
+
+def summarize_lines(lines: pd.DataFrame) -> pd.DataFrame:
+    """合計から平均・成功率を算出（calculate_statsと同じキー）
+    
+    Args:
+        lines: build_season_linesの結果、またはそれを選手単位に合算したもの
+    
+    Returns:
+        GP, PTS, REB, AST, STL, BLK, TO, PF（平均）, MPG, FG%, 3P%, FT%,
+        合計値（TOTAL_{カラム}）と最高記録（{カラム}_HIGH）のデータフレーム
+    """
+    if lines.empty:
+        return pd.DataFrame()
+    
+    result = pd.DataFrame(index=lines.index)
+    result['GP'] = lines['GP'].astype(int)
+    for col, label in [('PTS', 'PTS'), ('TOT', 'REB'), ('AST', 'AST'), ('STL', 'STL'),
+                       ('BLK', 'BLK'), ('TO', 'TO'), ('PF', 'PF')]:
+        result[label] = _ratio(lines[col], lines['GP'])
+    result['MPG'] = _ratio(lines['MIN_DEC'], lines['GP'])
+    
+    fgm = lines['2PM'] + lines['3PM']
+    fga = lines['2PA'] + lines['3PA']
+    result['FG%'] = _ratio(fgm, fga, 100)
+    result['3P%'] = _ratio(lines['3PM'], lines['3PA'], 100)
+    result['FT%'] = _ratio(lines['FTM'], lines['FTA'], 100)
+    
+    for col in ['PTS', 'TOT', 'AST', 'STL', 'BLK', '3PM']:
+        result[f'TOTAL_{col}'] = lines[col]
+    for col in CAREER_HIGH_COLUMNS:
+        result[f'{col}_HIGH'] = lines[f'{col}_HIGH']
+    
+    return result
+
+
+def build_career_table(lines: pd.DataFrame) -> pd.DataFrame:
+    """シーズン別合計から選手ごとの通算成績を作成
+    
+    Args:
+        lines: build_season_linesの結果
+    
+    Returns:
+        選手名をインデックスとする通算成績（summarize_linesのカラム + Seasons）
+    """
+    if lines.empty:
+        return pd.DataFrame()
+    
+    career_lines = rollup_lines(lines, 'PlayerName')
+    
+    career = summarize_lines(career_lines)
+    career['Seasons'] = lines.groupby(level='PlayerName').size()
+    return career
+
+
+# ===== 連続記録・マイルストーン =====
+
+# 連続記録の条件 {表示名: (カラム, 下限値)}
+STREAK_RULES = {
+    '2桁得点': ('PTS', 10),
+    '3P成功': ('3PM', 1),
+    '2桁リバウンド': ('TOT', 10),
+    '5アシスト以上': ('AST', 5),
+    'スティール': ('STL', 1),
+}
+
+# 通算マイルストーンの刻み {カラム: (刻み, 表示名)}
+MILESTONE_STEPS = {
+    'PTS': (100, '得点'),
+    'TOT': (50, 'リバウンド'),
+    'AST': (50, 'アシスト'),
+    '3PM': (25, '3P成功'),
+}
+
+# キャリアハイを検出するカラム {カラム: 表示名}
+CAREER_HIGH_LABELS = {'PTS': '得点', 'TOT': 'リバウンド', 'AST': 'アシスト', '3PM': '3P成功'}
+
+STREAK_COLUMNS = ['PlayerName', 'Streak', 'Length', 'StartDate', 'EndDate', 'Active']
+MILESTONE_COLUMNS = ['PlayerName', 'Season', 'GameDate', 'Opponent', 'Type', 'Stat', 'Value', 'Label']
+
+
+def _player_game_sequence(df: pd.DataFrame, stat_columns: list) -> pd.DataFrame:
+    """選手ごとの試合順に並べた数値データ（選手・日付・形式の順で安定ソート）"""
+    order_cols = ['PlayerName', 'GameDate'] + (['GameFormat'] if 'GameFormat' in df.columns else [])
+    sequence = df.sort_values(order_cols, kind='stable')
+    
+    result = numeric_columns(sequence, stat_columns)
+    for col in ['PlayerName', 'Season', 'GameDate', 'Opponent']:
+        result[col] = sequence[col] if col in sequence.columns else ''
+    return result.reset_index(drop=True)
+
+
+def calculate_streaks(df: pd.DataFrame, rules: dict = None, min_length: int = 2) -> pd.DataFrame:
+    """全選手の連続記録をランレングス符号化で一括検出
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合）
+        rules: 連続記録の条件（デフォルト: STREAK_RULES）
+        min_length: 記録とみなす最低連続試合数
+    
+    Returns:
+        PlayerName, Streak, Length, StartDate, EndDate, Active（最新試合まで継続中か）
+        のデータフレーム（長い順）
+    """
+    if rules is None:
+        rules = STREAK_RULES
+    
+    if df.empty or 'PlayerName' not in df.columns or 'GameDate' not in df.columns:
+        return pd.DataFrame(columns=STREAK_COLUMNS)
+    
+    sequence = _player_game_sequence(df, sorted({col for col, _ in rules.values()}))
+    new_player = sequence['PlayerName'].ne(sequence['PlayerName'].shift())
+    last_game = sequence['PlayerName'].ne(sequence['PlayerName'].shift(-1))
+    
+    streaks = []
+    for label, (col, threshold) in rules.items():
+        hit = sequence[col] >= threshold
+        # 条件の成否が変わる位置、または選手が変わる位置で新しいランを開始
+        run_id = (new_player | hit.ne(hit.shift())).cumsum()
+        
+        runs = pd.DataFrame({
+            'PlayerName': sequence['PlayerName'],
+            'GameDate': sequence['GameDate'],
+            'run': run_id,
+            'last': last_game
+        })[hit].groupby('run', sort=False).agg(
+            PlayerName=('PlayerName', 'first'),
+            Length=('GameDate', 'size'),
+            StartDate=('GameDate', 'first'),
+            EndDate=('GameDate', 'last'),
+            Active=('last', 'any')
+        )
+        runs['Streak'] = label
+        streaks.append(runs[runs['Length'] >= min_length])
+    
+    result = pd.concat(streaks, ignore_index=True) if streaks else pd.DataFrame(columns=STREAK_COLUMNS)
+    return result[STREAK_COLUMNS].sort_values(
+        ['Length', 'EndDate'], ascending=False, kind='stable'
+    ).reset_index(drop=True)
+
+
+def calculate_milestones(df: pd.DataFrame) -> pd.DataFrame:
+    """通算記録の節目とキャリアハイ達成試合をグループ累積和で一括検出
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合、全シーズン）
+    
+    Returns:
+        PlayerName, Season, GameDate, Opponent, Type('通算'/'キャリアハイ'),
+        Stat, Value, Label のデータフレーム（新しい順）
+    """
+    if df.empty or 'PlayerName' not in df.columns or 'GameDate' not in df.columns:
+        return pd.DataFrame(columns=MILESTONE_COLUMNS)
+    
+    stat_columns = sorted(set(MILESTONE_STEPS) | set(CAREER_HIGH_LABELS))
+    sequence = _player_game_sequence(df, stat_columns)
+    players = sequence.groupby('PlayerName', sort=False)
+    info_cols = ['PlayerName', 'Season', 'GameDate', 'Opponent']
+    
+    events = []
+    
+    # 通算の節目: 累積和が刻みを越えた試合（1試合で複数越えた場合は最大の節目）
+    for col, (step, label) in MILESTONE_STEPS.items():
+        total = players[col].cumsum()
+        reached = (total // step) * step
+        crossed = reached > (total - sequence[col]) // step * step
+        hits = sequence.loc[crossed & (reached > 0), info_cols].copy()
+        hits['Type'] = '通算'
+        hits['Stat'] = col
+        hits['Value'] = reached[crossed & (reached > 0)]
+        hits['Label'] = label + ' 通算' + hits['Value'].astype(int).astype(str)
+        events.append(hits)
+    
+    # キャリアハイ: 最終的な最高記録に初めて到達した試合
+    for col, label in CAREER_HIGH_LABELS.items():
+        career_max = players[col].transform('max')
+        previous_max = players[col].cummax().groupby(sequence['PlayerName']).shift().fillna(-1)
+        first_high = (sequence[col] == career_max) & (previous_max < career_max) & (career_max > 0)
+        hits = sequence.loc[first_high, info_cols].copy()
+        hits['Type'] = 'キャリアハイ'
+        hits['Stat'] = col
+        hits['Value'] = sequence.loc[first_high, col]
+        hits['Label'] = label + ' キャリアハイ ' + hits['Value'].astype(int).astype(str)
+        events.append(hits)
+    
+    result = pd.concat(events, ignore_index=True)
+    return result[MILESTONE_COLUMNS].sort_values('GameDate', ascending=False, kind='stable').reset_index(drop=True)
+
+
+# ===== スプリット（先発/ベンチ・勝敗・ホーム/アウェイ・試合形式） =====
+
+# スプリットの軸 {カラム: 表示名}（Venueはデータにカラムがある場合のみ使用）
+SPLIT_DIMENSIONS = {
+    'Role': '先発 / ベンチ',
+    'Result': '勝敗',
+    'Venue': 'ホーム / アウェイ',
+    'GameFormat': '試合形式',
+}
+
+SPLIT_VALUE_LABELS = {
+    'Role': {'Starter': '先発', 'Bench': 'ベンチ'},
+    'Result': {'W': '勝利', 'L': '敗北', 'D': '引き分け'},
+    'Venue': {'Home': 'ホーム', 'Away': 'アウェイ', 'Neutral': '中立'},
+}
+
+SPLIT_STAT_COLUMNS = ['GP', 'MPG', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'TO', 'FG%', '3P%', 'FT%']
+
+
+def build_split_lines(df: pd.DataFrame) -> pd.DataFrame:
+    """スプリット集計の元になる合計テーブルを1回の複数キーgroupbyで作成
+    
+    相手チームとして登録された行（DataType='OpponentTeam'）は除外する。
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合）
+    
+    Returns:
+        (PlayerName, Season, Role, Result, [Venue,] GameFormat) をインデックスとする
+        自チームの合計・最高記録のデータフレーム（aggregate_linesを参照）
+    """
+    if df.empty or not all(col in df.columns for col in SEASON_LINE_KEY):
+        return pd.DataFrame()
+    
+    frame = split_team_rows(df)[0].copy()
+    if frame.empty:
+        return pd.DataFrame()
+    starter = pd.to_numeric(frame['GS'], errors='coerce').fillna(0) if 'GS' in frame.columns else 0
+    frame['Role'] = np.where(starter >= 1, 'Starter', 'Bench')
+    
+    scores = numeric_columns(frame, ['TeamScore', 'OpponentScore'])
+    margin = scores['TeamScore'] - scores['OpponentScore']
+    frame['Result'] = np.select([margin > 0, margin < 0], ['W', 'L'], default='D')
+    
+    if 'GameFormat' not in frame.columns:
+        frame['GameFormat'] = '4Q'
+    frame['GameFormat'] = frame['GameFormat'].fillna('4Q')
+    
+    dimensions = [dim for dim in SPLIT_DIMENSIONS if dim in frame.columns]
+    return aggregate_lines(frame, SEASON_LINE_KEY + dimensions)
+
+
+def calculate_splits(split_lines: pd.DataFrame, dimension: str, season: str = None,
+                     player_name: str = None, games: pd.DataFrame = None) -> pd.DataFrame:
+    """スプリット別の平均スタッツを計算
+    
+    選手指定時は選手の1試合平均、未指定時はチームの1試合平均（試合数はgamesから取得）。
+    
+    Args:
+        split_lines: build_split_linesの結果
+        dimension: スプリットの軸（SPLIT_DIMENSIONSのキー）
+        season: シーズン（Noneの場合は全シーズン）
+        player_name: 選手名（Noneの場合はチーム全体）
+        games: チームスプリットの試合数算出に使う試合サマリー（build_game_tableの結果）
+    
+    Returns:
+        Split（表示名）をインデックスとするデータフレーム（SPLIT_STAT_COLUMNS）
+    """
+    if split_lines.empty or dimension not in split_lines.index.names:
+        return pd.DataFrame(columns=SPLIT_STAT_COLUMNS)
+    
+    lines = split_lines
+    if season:
+        lines = lines[lines.index.get_level_values('Season') == season]
+    if player_name:
+        lines = lines[lines.index.get_level_values('PlayerName') == player_name]
+    if lines.empty:
+        return pd.DataFrame(columns=SPLIT_STAT_COLUMNS)
+    
+    lines = rollup_lines(lines, dimension)
+    
+    # チーム単位では1試合あたりに換算するため、GPを試合数に置き換える
+    if not player_name and games is not None:
+        if dimension in games.columns:
+            game_counts = games.groupby(dimension).size()
+        else:
+            game_counts = pd.Series(len(games), index=lines.index)
+        lines = lines.assign(GP=game_counts.reindex(lines.index).fillna(0))
+    
+    result = summarize_lines(lines)[SPLIT_STAT_COLUMNS]
+    
+    # 表示順（先発→ベンチ、勝利→敗北など）と表示名
+    labels = SPLIT_VALUE_LABELS.get(dimension, {})
+    order = [value for value in labels if value in result.index]
+    result = result.reindex(order + [value for value in result.index if value not in labels])
+    result.index = result.index.map(lambda value: labels.get(value, value))
+    result.index.name = 'Split'
+    return result
+
+
+# ===== シュート成功率の信頼区間 =====
+
+# {成功率: (成功数カラム, 試投数カラム)}
+SHOOTING_PAIRS = {'FG%': ('FGM', 'FGA'), '3P%': ('3PM', '3PA'), 'FT%': ('FTM', 'FTA')}
+
+
+def _clip_made(made, attempted) -> tuple:
+    """成功数・試投数を区間計算できる範囲（0 ≤ 成功数 ≤ 試投数）に揃える
+    
+    整合性チェックは警告のみで保存を止めないため、成功数 > 試投数の行も渡される。
+    
+    Returns:
+        (試投数の配列, 成功数の配列)（欠損値は0）
+    """
+    attempted = np.clip(np.nan_to_num(np.asarray(attempted, dtype=float)), 0, None)
+    made = np.clip(np.nan_to_num(np.asarray(made, dtype=float)), 0, attempted)
+    return attempted, made
+
+
+def wilson_interval(made, attempted, z: float = 1.96) -> tuple:
+    """Wilsonスコア区間（0〜100、全選手分をベクトル演算）
+    
+    Args:
+        made: 成功数の配列
+        attempted: 試投数の配列
+        z: 標準正規分布の分位点（1.96で95%区間）
+    
+    Returns:
+        (下限の配列, 上限の配列)（試投数0の場合は0〜100）
+        （成功数が試投数を超える不整合な行は成功数を試投数までに丸めて計算）
+    """
+    attempted, made = _clip_made(made, attempted)
+    n = np.where(attempted > 0, attempted, 1.0)
+    p = made / n
+    
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    margin = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    
+    low = np.where(attempted > 0, np.clip(center - margin, 0, 1) * 100, 0.0)
+    high = np.where(attempted > 0, np.clip(center + margin, 0, 1) * 100, 100.0)
+    return low, high
+
+
+def bootstrap_interval(made, attempted, n_samples: int = 2000, confidence: float = 0.95,
+                       seed: int = 42, chunk_size: int = 1000) -> tuple:
+    """ブートストラップ区間（0〜100、全選手分をベクトル演算）
+    
+    各試投を独立な成否とみなした再標本化は、成功数を二項分布から生成することと同じなので
+    選手×標本の行列を一度に生成する。メモリ使用量は選手をchunk_size人ずつ処理して抑える。
+    
+    Args:
+        made: 成功数の配列
+        attempted: 試投数の配列
+        n_samples: 再標本化の回数
+        confidence: 信頼水準
+        seed: 乱数シード（同じデータなら毎回同じ区間になる）
+        chunk_size: 一度に処理する選手数
+    
+    Returns:
+        (下限の配列, 上限の配列)（試投数0の場合は0〜100）
+        （成功数が試投数を超える不整合な行は成功数を試投数までに丸めて計算）
+    """
+    attempted, made = _clip_made(made, attempted)
+    trials = attempted.astype(np.int64)
+    p = _ratio(made, attempted)
+    
+    rng = np.random.default_rng(seed)
+    quantiles = [(1 - confidence) / 2, 1 - (1 - confidence) / 2]
+    low = np.zeros(len(made))
+    high = np.full(len(made), 100.0)
+    
+    for start in range(0, len(made), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        chunk_trials = trials[chunk]
+        samples = rng.binomial(chunk_trials, p[chunk], size=(n_samples, len(chunk_trials)))
+        rates = _ratio(samples, np.broadcast_to(chunk_trials, samples.shape), 100)
+        bounds = np.quantile(rates, quantiles, axis=0)
+        has_attempts = chunk_trials > 0
+        low[chunk] = np.where(has_attempts, bounds[0], 0.0)
+        high[chunk] = np.where(has_attempts, bounds[1], 100.0)
+    
+    return low, high
+
+
+def add_shooting_intervals(player_stats: pd.DataFrame, method: str = 'wilson', **kwargs) -> pd.DataFrame:
+    """FG% / 3P% / FT% の信頼区間カラム（{成功率}_LO, {成功率}_HI）を追加
+    
+    Args:
+        player_stats: 選手ごとの合計（2PM, 2PA, 3PM, 3PA, FTM, FTA を含む）
+        method: 'wilson' または 'bootstrap'
+        **kwargs: bootstrap_intervalに渡す引数（n_samples, seed, chunk_size など）
+    
+    Returns:
+        カラムを追加したデータフレーム（元のデータは変更しない）
+    """
+    result = player_stats.copy()
+    totals = numeric_columns(result, ['2PM', '2PA', '3PM', '3PA', 'FTM', 'FTA'])
+    totals['FGM'] = totals['2PM'] + totals['3PM']
+    totals['FGA'] = totals['2PA'] + totals['3PA']
+    
+    for stat, (made_col, attempt_col) in SHOOTING_PAIRS.items():
+        if method == 'bootstrap':
+            low, high = bootstrap_interval(totals[made_col], totals[attempt_col], **kwargs)
+        else:
+            low, high = wilson_interval(totals[made_col], totals[attempt_col])
+        result[f'{stat}_LO'] = low
+        result[f'{stat}_HI'] = high
+    
+    return result
+
+
+# ===== ボックススコアの整合性チェック =====
+
+def check_box_score_consistency(df: pd.DataFrame) -> tuple:
+    """ボックススコアの整合性をバッチ全体でまとめて検証
+    
+    検証ルール:
+        PTS: PTS = 3×3PM + 2×2PM + 2×DK + FTM
+        TOT: TOT = OR + DR（OR・DRが未記録の行は対象外）
+        3PM / 2PM / FTM: 成功数 ≤ 試投数
+        TeamScore: 試合ごとの選手得点合計 = TeamScore（TeamScore未入力の試合は対象外）
+    
+    Args:
+        df: 統計データフレーム（1行=1選手1試合）
+    
+    Returns:
+        (violations, report):
+            violations: 元のインデックス×ルールの真偽値データフレーム（Trueが違反）
+            report: Row, PlayerName, Rule, Expected, Actual の違反一覧
+    """
+    report_columns = ['Row', 'PlayerName', 'Rule', 'Expected', 'Actual']
+    if df.empty:
+        return pd.DataFrame(index=df.index), pd.DataFrame(columns=report_columns)
+    
+    def num(col):
+        if col not in df.columns:
+            return pd.Series(0.0, index=df.index)
+        return pd.to_numeric(df[col], errors='coerce').fillna(0)
+    
+    expected = {}
+    actual = {}
+    
+    expected['PTS'] = 3 * num('3PM') + 2 * num('2PM') + 2 * num('DK') + num('FTM')
+    actual['PTS'] = num('PTS')
+    
+    rebounds = num('OR') + num('DR')
+    expected['TOT'] = rebounds.where(rebounds > 0, num('TOT'))
+    actual['TOT'] = num('TOT')
+    
+    for made, attempted in [('3PM', '3PA'), ('2PM', '2PA'), ('FTM', 'FTA')]:
+        # 試投数を上限とし、超えた場合のみ違反
+        expected[made] = num(made).clip(upper=num(attempted))
+        actual[made] = num(made)
+    
+    game_cols = [col for col in GAME_KEY if col in df.columns]
+    team_score = num('TeamScore')
+    if game_cols:
+        points_total = actual['PTS'].groupby([df[col] for col in game_cols], dropna=False).transform('sum')
+    else:
+        points_total = pd.Series(actual['PTS'].sum(), index=df.index)
+    expected['TeamScore'] = team_score.where(team_score > 0, points_total)
+    actual['TeamScore'] = points_total
+    
+    violations = pd.DataFrame({rule: expected[rule] != actual[rule] for rule in expected}, index=df.index)
+    
+    player_names = df['PlayerName'] if 'PlayerName' in df.columns else pd.Series('', index=df.index)
+    if game_cols:
+        first_in_game = ~df.duplicated(subset=game_cols)
+    else:
+        first_in_game = pd.Series(range(len(df)), index=df.index) == 0
+    
+    reports = []
+    for rule in violations.columns:
+        if rule == 'TeamScore':
+            # 試合単位のルールは試合ごとに1件だけ報告
+            rows = violations.index[violations[rule] & first_in_game]
+            names = ['（チーム合計）'] * len(rows)
+            expected_values = team_score.loc[rows].to_numpy()
+        else:
+            rows = violations.index[violations[rule]]
+            names = player_names.loc[rows].to_numpy()
+            expected_values = expected[rule].loc[rows].to_numpy()
+        reports.append(pd.DataFrame({
+            'Row': rows,
+            'PlayerName': names,
+            'Rule': rule,
+            'Expected': expected_values,
+            'Actual': actual[rule].loc[rows].to_numpy()
+        }))
+    
+    report = pd.concat(reports, ignore_index=True) if reports else pd.DataFrame(columns=report_columns)
+    return violations, report[report_columns]
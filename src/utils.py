@@ -7,6 +7,8 @@ import os
 import hashlib
 from datetime import datetime, timedelta
 
+from stats import check_box_score_consistency
+
 
 class DataValidator:
     """データバリデーション用クラス"""
@@ -39,6 +41,11 @@ class DataValidator:
         
         return True, "OK"
     
+    @staticmethod
+    def check_box_score_consistency(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """ボックススコアの整合性を検証（stats.check_box_score_consistencyを参照）"""
+        return check_box_score_consistency(df)
+    
     @staticmethod
     def clean_percentage(value: Any) -> float:
         """パーセンテージデータのクリーニング"""